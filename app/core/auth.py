@@ -1,26 +1,73 @@
 # Standard Imports
+import jwt
 from fastapi import Depends
 from fastapi import APIRouter
+from fastapi.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi_login import LoginManager
 from fastapi_login.exceptions import InvalidCredentialsException
+from starlette.concurrency import run_in_threadpool
 from datetime import timedelta
 
 from .. import API_PREFIX
 from ..utils.helpers import BaseSchema
+from ..utils.cache import TTLCache
+from ..utils.exceptions import PasswordHasherBusy
+from .passwords import password_hasher
+from .tokens import MISSING
+from .tokens import TokenUser
+from .tokens import token_versions
 
 # Environment Import
 from .config import JWT_SECRET
 from .config import JWT_EXPIRATION_DAYS
+from .config import AUTH_CACHE_TTL_SECONDS
+from .config import AUTH_CACHE_MAX_SIZE
+from .config import DATABASE_ASYNC
+from .config import AUTH_STATELESS_TOKENS
 
 # Database Import
-from ..db.engine import get_db
+from ..db.engine import SessionLocal
+from ..db.async_engine import AsyncSessionLocal
+from sqlalchemy import select, update
 from ..modules.users.models import User
 
 
-manager = LoginManager(JWT_SECRET, tokenUrl=API_PREFIX+'/auth/token')
+class TokenLoginManager(LoginManager):
+    """
+    Login manager authorizing the stateless tokens from their claims.
+
+    Stateless tokens carry the user id (`uid`), admin flag (`adm`) and token
+    version (`ver`). They are accepted while the version matches the one in
+    `token_versions`, without querying the user. Tokens with the subject
+    only are loaded by the user loader.
+    """
+    async def get_current_user(self, token: str):
+        if not AUTH_STATELESS_TOKENS:
+            return await super().get_current_user(token)
+
+        try:
+            payload = jwt.decode(token, str(self.secret), algorithms=[self.algorithm])
+        except jwt.PyJWTError:
+            raise InvalidCredentialsException
+        if 'uid' not in payload:
+            return await super().get_current_user(token)
+
+        version = token_versions.get(payload['uid'])
+        if version is MISSING:
+            version = await run_in_threadpool(token_versions.load, payload['uid'])
+        if version is None or version != payload.get('ver'):
+            raise InvalidCredentialsException
+
+        return TokenUser(id=payload['uid'], email=payload['sub'], admin=payload['adm'])
+
+
+manager = TokenLoginManager(JWT_SECRET, tokenUrl=API_PREFIX+'/auth/token')
 route = APIRouter()
 
+# Authenticated users keyed by the JWT subject (email)
+user_cache = TTLCache(max_size=AUTH_CACHE_MAX_SIZE, ttl=AUTH_CACHE_TTL_SECONDS)
+
 
 # Login Schema
 class LoginData(BaseSchema):
@@ -35,31 +82,104 @@ class LoginData(BaseSchema):
             }
         }
 
-@manager.user_loader
+def _query_user(username: str) -> User:
+    """
+    Fetch the user from the database and detach it from the session,
+    so it can be shared between requests.
+    """
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(
+            User.email == username
+        ).first()
+        if user:
+            db.expunge(user)
+        return user
+    finally:
+        db.close()
+
 def load_user(username: str):
-    db = next(get_db())
-    user = db.query(User).filter(
-        User.email == username
-    ).first()
+    user = user_cache.get(username)
+    if user is None:
+        user = _query_user(username)
+        if user:
+            user_cache.set(username, user)
     return user
 
+async def load_user_async(username: str):
+    user = user_cache.get(username)
+    if user is None:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(User).filter(
+                User.email == username
+            ))
+            user = result.scalars().first()
+        if user:
+            user_cache.set(username, user)
+    return user
+
+# Keep the event loop free from blocking queries on async mode
+manager.user_loader(load_user_async if DATABASE_ASYNC else load_user)
+
+def invalidate_user(username: str) -> None:
+    """
+    Drop a cached user, must be called whenever the user record changes.
+    """
+    user_cache.invalidate(username)
+
+def _rehash_password(user: User, new_hash: str) -> None:
+    """
+    Store the password hashed with the current parameters, unless it was
+    changed meanwhile. The `updated_on` value is kept, it is not an edit.
+    """
+    db = SessionLocal()
+    try:
+        db.execute(update(User).where(
+            User.id == user.id,
+            User.password == user.password
+        ).values(password=new_hash, updated_on=User.updated_on))
+        db.commit()
+    finally:
+        db.close()
+    user.password = new_hash
+
 @route.post('/auth/token', include_in_schema=False)
-def auth_token(data: OAuth2PasswordRequestForm = Depends()):
-    return login(data)
+async def auth_token(data: OAuth2PasswordRequestForm = Depends()):
+    return await login(data)
 
 @route.post('/login')
-def login(data: LoginData):
+async def login(data: LoginData):
     username = data.username
     password = data.password
 
-    user: User = load_user(username)
+    # Always check credentials against the database
+    user: User = await run_in_threadpool(_query_user, username)
     if not user:
         raise InvalidCredentialsException
-    elif user.verify_password(password) == False:
+
+    # Verified on the hasher threads, the requests threadpool stays free
+    try:
+        valid, new_hash = await password_hasher.verify_and_update_async(password, user.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Muitas tentativas de login simultâneas, tente novamente em instantes.",
+            headers={"Retry-After": "1"}
+        )
+    if not valid:
         raise InvalidCredentialsException
 
+    if new_hash is not None:
+        await run_in_threadpool(_rehash_password, user, new_hash)
+    user_cache.set(username, user)
+
+    claims = dict(sub=username)
+    if AUTH_STATELESS_TOKENS:
+        claims.update(uid=user.id, adm=user.admin, ver=user.token_version)
+        token_versions.set(user.id, user.token_version)
+
     access_token = manager.create_access_token(
-        data=dict(sub=username),
+        data=claims,
         expires=timedelta(days=JWT_EXPIRATION_DAYS)
     )
     return {
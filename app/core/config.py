@@ -9,9 +9,78 @@ from typing import List
 JWT_SECRET = getenv("JWT_SECRET", default="The_quick_brown_fox_jumps_over_the_lazy_dog")
 JWT_EXPIRATION_DAYS = int(getenv("JWT_EXPIRATION_DAYS", default=7))
 
+# Authenticated users cache (set AUTH_CACHE_TTL_SECONDS=0 to disable)
+AUTH_CACHE_TTL_SECONDS = float(getenv("AUTH_CACHE_TTL_SECONDS", default=60))
+AUTH_CACHE_MAX_SIZE = int(getenv("AUTH_CACHE_MAX_SIZE", default=1024))
+
+# Stateless tokens carry the user id, admin flag and token version, skipping the user query
+# Changed or deleted users are revoked within the versions refresh interval
+AUTH_STATELESS_TOKENS = getenv("AUTH_STATELESS_TOKENS", default="false").lower() == "true"
+AUTH_TOKEN_VERSIONS_REFRESH_SECONDS = float(getenv("AUTH_TOKEN_VERSIONS_REFRESH_SECONDS", default=5))
+
+# Password Hashing Configuration (passwords are rehashed on login after a change)
+# Rounds set the hashing cost of the scheme, 0 keeps the scheme default
+PASSWORD_HASH_SCHEME = getenv("PASSWORD_HASH_SCHEME", default="pbkdf2_sha256")
+PASSWORD_HASH_ROUNDS = int(getenv("PASSWORD_HASH_ROUNDS", default=0))
+# Threads verifying the logins, and logins running or waiting before answering 503
+PASSWORD_HASH_WORKERS = int(getenv("PASSWORD_HASH_WORKERS", default=2))
+PASSWORD_HASH_MAX_PENDING = int(getenv("PASSWORD_HASH_MAX_PENDING", default=32))
+
 
 # Database Configuration
 DATABASE_URL = getenv("DATABASE_URL", default="sqlite:///:memory:")
+# Heroku still provides the "postgres://" scheme, removed on SQLAlchemy 1.4
+if DATABASE_URL.startswith("postgres://"):
+    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+
+# Database Pool Configuration (ignored by SQLite, except pre-ping and recycle)
+DATABASE_POOL_SIZE = int(getenv("DATABASE_POOL_SIZE", default=5))
+DATABASE_MAX_OVERFLOW = int(getenv("DATABASE_MAX_OVERFLOW", default=10))
+DATABASE_POOL_TIMEOUT = float(getenv("DATABASE_POOL_TIMEOUT", default=30))
+DATABASE_POOL_RECYCLE = int(getenv("DATABASE_POOL_RECYCLE", default=-1))
+DATABASE_POOL_PRE_PING = getenv("DATABASE_POOL_PRE_PING", default="false").lower() == "true"
+
+# SQL Instrumentation, statement counts and times of each request on the Server-Timing header and the logs
+SQL_INSTRUMENTATION = getenv("SQL_INSTRUMENTATION", default="true").lower() == "true"
+# Statements slower than this are logged with their parameters redacted, in seconds
+SQL_SLOW_QUERY_SECONDS = float(getenv("SQL_SLOW_QUERY_SECONDS", default=0.5))
+
+# Metrics exposed on /v1/metrics, in the Prometheus text format
+METRICS_ENABLED = getenv("METRICS_ENABLED", default="true").lower() == "true"
+# Directory shared by the workers of a multi-process server, emptied before they start
+# Each worker writes its metrics there every METRICS_FLUSH_SECONDS, unset for a single process
+METRICS_DIR = getenv("METRICS_DIR", default="")
+METRICS_FLUSH_SECONDS = float(getenv("METRICS_FLUSH_SECONDS", default=5))
+
+# Migrations wait at most this long for a table lock (PostgreSQL), instead of queueing the requests behind them
+MIGRATION_LOCK_TIMEOUT = getenv("MIGRATION_LOCK_TIMEOUT", default="5s")
+
+# Async Database Configuration (asyncpg for PostgreSQL, aiosqlite for SQLite)
+DATABASE_ASYNC = getenv("DATABASE_ASYNC", default="false").lower() == "true"
+
+# Transactions Import Configuration
+TRANSACTION_IMPORT_MAX_ITEMS = int(getenv("TRANSACTION_IMPORT_MAX_ITEMS", default=5000))
+
+# HTTP Caching Configuration (read endpoints are revalidated with their ETag)
+HTTP_CACHE_CONTROL = getenv("HTTP_CACHE_CONTROL", default="private, no-cache")
+
+# List endpoints cache, "memory://" or a "redis://" URL (set QUERY_CACHE_TTL_SECONDS=0 to disable)
+QUERY_CACHE_URL = getenv("QUERY_CACHE_URL", default="memory://")
+QUERY_CACHE_TTL_SECONDS = float(getenv("QUERY_CACHE_TTL_SECONDS", default=30))
+QUERY_CACHE_MAX_SIZE = int(getenv("QUERY_CACHE_MAX_SIZE", default=256))
+
+
+# Get the async driver URL for the configured database
+def get_async_database_url() -> str:
+    _url = getenv("ASYNC_DATABASE_URL", default=None)
+    if _url:
+        return _url
+    elif DATABASE_URL.startswith("postgresql://"):
+        return DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+    elif DATABASE_URL.startswith("sqlite://"):
+        return DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    else:
+        return DATABASE_URL
 
 
 # Get CORS Origins
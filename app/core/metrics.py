@@ -0,0 +1,199 @@
+# Standard Imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+# Typing Imports
+from typing import Any, Callable, List, Optional
+
+# Metrics Imports
+from ..utils.metrics import MetricsFiles
+from ..utils.metrics import Sample
+from ..utils.metrics import registry
+from ..utils.metrics import render_snapshot
+
+# Collected Objects
+from ..db.engine import engine
+from ..db.async_engine import AsyncSessionLocal
+from ..db.pool import checkout_latency
+from ..db.pool import get_pool_status
+from ..utils.query_cache import query_cache
+from .auth import user_cache
+from .passwords import password_hasher
+
+# Metrics Configuration
+from .config import METRICS_DIR
+from .config import METRICS_FLUSH_SECONDS
+
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# Requests metrics, updated by the `MetricsMiddleware`
+http_requests = registry.counter(
+    "sbf_http_requests_total",
+    "Requests answered, by route and status.",
+    ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "sbf_http_request_duration_seconds",
+    "Requests latency in seconds, by route.",
+    ("method", "route")
+)
+http_requests_in_flight = registry.gauge(
+    "sbf_http_requests_in_flight",
+    "Requests being handled."
+)
+db_statements = registry.counter(
+    "sbf_db_statements_total",
+    "SQL statements sent by the requests, by route.",
+    ("method", "route")
+)
+db_statements_duration = registry.counter(
+    "sbf_db_statements_seconds_total",
+    "Time spent on the SQL statements of the requests in seconds, by route.",
+    ("method", "route")
+)
+
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool counting its running calls, to measure its saturation.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.active = 0
+        self._active_lock = Lock()
+
+    def _call(self, function: Callable, *args, **kwargs) -> Any:
+        with self._active_lock:
+            self.active += 1
+        try:
+            return function(*args, **kwargs)
+        finally:
+            with self._active_lock:
+                self.active -= 1
+
+    def submit(self, function: Callable, *args, **kwargs):
+        return super().submit(self._call, function, *args, **kwargs)
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self._max_workers,
+            "active": self.active,
+            "queued": self._work_queue.qsize()
+        }
+
+
+# Runs the sync routes and dependencies, set as the event loop default executor on startup
+requests_executor: Optional[InstrumentedThreadPoolExecutor] = None
+
+
+def _collect_threadpools() -> List[Sample]:
+    hasher = password_hasher.stats()
+    pools = [(
+        "password_hasher",
+        hasher["workers"],
+        min(hasher["pending"], hasher["workers"]),
+        max(hasher["pending"] - hasher["workers"], 0)
+    )]
+    if requests_executor is not None:
+        stats = requests_executor.stats()
+        pools.append(("requests", stats["max_workers"], stats["active"], stats["queued"]))
+
+    samples = [
+        ("sbf_password_hasher_rejected_total", {}, hasher["rejected"]),
+        ("sbf_password_verify_seconds", {}, hasher["verify_latency"])
+    ]
+    for pool, max_workers, active, queued in pools:
+        labels = {"pool": pool}
+        samples += [
+            ("sbf_threadpool_max_workers", labels, max_workers),
+            ("sbf_threadpool_active", labels, active),
+            ("sbf_threadpool_queued", labels, queued)
+        ]
+    return samples
+
+
+def _collect_database_pools() -> List[Sample]:
+    engines = [("sync", engine)]
+    if AsyncSessionLocal:
+        engines.append(("async", AsyncSessionLocal.kw['bind'].sync_engine))
+
+    samples = [("sbf_db_pool_checkout_seconds", {}, checkout_latency.snapshot())]
+    for name, pool_engine in engines:
+        status = get_pool_status(pool_engine)
+        # SQLite pools have no counters
+        if "size" not in status:
+            continue
+
+        labels = {"engine": name}
+        samples += [
+            ("sbf_db_pool_size", labels, status["size"]),
+            ("sbf_db_pool_max_overflow", labels, status["max_overflow"]),
+            ("sbf_db_pool_checked_out", labels, status["checked_out"]),
+            ("sbf_db_pool_checked_in", labels, status["checked_in"])
+        ]
+    return samples
+
+
+def _collect_caches() -> List[Sample]:
+    samples = []
+    for cache, stats in (("query", query_cache.stats()), ("user", user_cache.stats())):
+        labels = {"cache": cache}
+        samples += [
+            ("sbf_cache_hits_total", labels, stats["hits"]),
+            ("sbf_cache_misses_total", labels, stats["misses"])
+        ]
+    return samples
+
+
+registry.describe("sbf_threadpool_max_workers", "gauge", "Threads of the pool.")
+registry.describe("sbf_threadpool_active", "gauge", "Calls running on the pool threads.")
+registry.describe("sbf_threadpool_queued", "gauge", "Calls waiting for a pool thread.")
+registry.describe("sbf_password_hasher_rejected_total", "counter", "Logins rejected with 503, too many password hashes pending.")
+registry.describe("sbf_password_verify_seconds", "histogram", "Password verification latency in seconds.")
+registry.add_collector(_collect_threadpools)
+
+registry.describe("sbf_db_pool_checkout_seconds", "histogram", "Time waiting for a database connection in seconds.")
+registry.describe("sbf_db_pool_size", "gauge", "Connections kept by the pool.")
+registry.describe("sbf_db_pool_max_overflow", "gauge", "Connections the pool may open above its size.")
+registry.describe("sbf_db_pool_checked_out", "gauge", "Connections in use.")
+registry.describe("sbf_db_pool_checked_in", "gauge", "Idle connections.")
+registry.add_collector(_collect_database_pools)
+
+# The hit rate is rate(hits) / (rate(hits) + rate(misses))
+registry.describe("sbf_cache_hits_total", "counter", "Cache lookups answered from the cache.")
+registry.describe("sbf_cache_misses_total", "counter", "Cache lookups answered by the database.")
+registry.add_collector(_collect_caches)
+
+
+# Shares the metrics between the workers of a multi-process server
+metrics_files = MetricsFiles(registry, METRICS_DIR, interval=METRICS_FLUSH_SECONDS) if METRICS_DIR else None
+
+
+def start_metrics() -> None:
+    """
+    Count the calls of the requests threadpool and start writing the
+    metrics of this worker to `METRICS_DIR`, when set.
+    """
+    global requests_executor
+    requests_executor = InstrumentedThreadPoolExecutor(thread_name_prefix="requests")
+    asyncio.get_event_loop().set_default_executor(requests_executor)
+
+    if metrics_files is not None:
+        metrics_files.start()
+
+
+def stop_metrics() -> None:
+    if metrics_files is not None:
+        metrics_files.stop()
+
+
+def collect_metrics() -> str:
+    """
+    The metrics of all the workers, in the Prometheus text format.
+    """
+    snapshot = metrics_files.collect() if metrics_files is not None else registry.snapshot()
+    return render_snapshot(snapshot)
@@ -0,0 +1,132 @@
+# Standard Imports
+import logging
+from time import perf_counter
+
+# Typing Imports
+from typing import Callable, Dict, Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Instrumentation Imports
+from ..db.instrumentation import QueryStats
+from ..db.instrumentation import get_query_stats
+from ..db.instrumentation import start_query_stats
+from ..db.instrumentation import stop_query_stats
+from ..utils.serialization import dumps
+
+# Metrics Imports
+from .metrics import db_statements
+from .metrics import db_statements_duration
+from .metrics import http_request_duration
+from .metrics import http_requests
+from .metrics import http_requests_in_flight
+
+
+logger = logging.getLogger("app.requests")
+
+
+def make_server_timing(stats: QueryStats, duration: float) -> bytes:
+    """
+    `Server-Timing` header value with the database and total times, in milliseconds.
+    """
+    return (
+        f'db;dur={stats.duration * 1000:.3f};desc="{stats.count} queries", '
+        f'db-slowest;dur={stats.slowest * 1000:.3f}, '
+        f'app;dur={duration * 1000:.3f}'
+    ).encode("latin-1")
+
+
+class QueryTimingMiddleware:
+    """
+    Count the SQL statements of each request and their time.
+
+    The totals are sent on the `Server-Timing` response header and logged
+    as one JSON line per request (`app.requests` logger, INFO level).
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+        start = perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", make_server_timing(stats, perf_counter() - start))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_query_stats(token)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(dumps({
+                    "event": "request",
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": round((perf_counter() - start) * 1000, 3),
+                    **stats.as_dict()
+                }).decode())
+
+
+class MetricsMiddleware:
+    """
+    Count the requests and their latency by route, and the requests in flight.
+
+    Routes are labelled with their path template, requests matching no
+    route (not found, CORS preflight) with "unmatched". Added inside the
+    `QueryTimingMiddleware`, it also counts the SQL statements by route.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._routes: Optional[Dict[Callable, str]] = None
+
+    def _get_route(self, scope: Scope) -> str:
+        # The router leaves the matched endpoint on the scope
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if self._routes is None:
+            self._routes = {
+                route.endpoint: route.path
+                for route in scope["app"].routes if hasattr(route, "endpoint")
+            }
+        return self._routes.get(endpoint, "unmatched")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+
+            method, route = scope["method"], self._get_route(scope)
+            http_requests.inc(method, route, str(status))
+            http_request_duration.observe(perf_counter() - start, method, route)
+
+            stats = get_query_stats()
+            if stats is not None:
+                db_statements.inc(method, route, amount=stats.count)
+                db_statements_duration.inc(method, route, amount=stats.duration)
@@ -0,0 +1,163 @@
+# Standard Imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from passlib.context import CryptContext
+
+# Typing Imports
+from typing import Any, Callable, Optional, Tuple
+
+# Exception Imports
+from ..utils.exceptions import PasswordHasherBusy
+
+# Metrics Imports
+from ..utils.metrics import Histogram
+
+# Password Hashing Configuration
+from .config import PASSWORD_HASH_SCHEME
+from .config import PASSWORD_HASH_ROUNDS
+from .config import PASSWORD_HASH_WORKERS
+from .config import PASSWORD_HASH_MAX_PENDING
+
+
+# Schemes of the stored passwords still accepted, rehashed with the configured one on login
+LEGACY_SCHEMES = ["pbkdf2_sha256"]
+
+
+def make_password_context(scheme: str = PASSWORD_HASH_SCHEME, rounds: int = PASSWORD_HASH_ROUNDS) -> CryptContext:
+    """
+    Create the passlib context hashing with the scheme and rounds.
+
+    Hashes of other schemes or rounds are still verified, and flagged to be
+    rehashed. Schemes like `bcrypt` and `argon2` need their backend package.
+
+    Args:
+        scheme (str): The passlib scheme of the new hashes.
+        rounds (int): The scheme cost, 0 keeps the scheme default.
+
+    Returns:
+        CryptContext: The password context.
+    """
+    options = {f"{scheme}__rounds": rounds} if rounds > 0 else {}
+    schemes = [scheme] + [legacy for legacy in LEGACY_SCHEMES if legacy != scheme]
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+class PasswordHasher:
+    """
+    Hashes and verifies passwords on a dedicated thread pool.
+
+    Hashing is CPU bound by design. Running it on its own `workers` threads,
+    instead of the requests threadpool, keeps a login storm from delaying
+    the other endpoints. At most `max_pending` calls run or wait, the
+    following ones are rejected with `PasswordHasherBusy`.
+    """
+    def __init__(self, context: CryptContext, workers: int = 2, max_pending: int = 32):
+        self.context = context
+        self.workers = max(workers, 1)
+        self.max_pending = max(max_pending, self.workers)
+        self.latency = Histogram()
+        self.rehashed = 0
+        self.rejected = 0
+        self._pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+
+    def hash(self, password: str) -> str:
+        return self.context.hash(password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self.verify_and_update(password, hashed)[0]
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password against its stored hash.
+
+        Args:
+            password (str): The informed password.
+            hashed (str): The stored hash.
+
+        Returns:
+            Tuple[bool, Optional[str]]: If the password matches, and its new
+            hash when the stored one uses an outdated scheme or rounds.
+        """
+        start = perf_counter()
+        try:
+            valid, new_hash = self.context.verify_and_update(password, hashed)
+        finally:
+            self.latency.observe(perf_counter() - start)
+
+        if new_hash is not None:
+            with self._lock:
+                self.rehashed += 1
+        return valid, new_hash
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hasher")
+            return self._executor
+
+    async def _run(self, function: Callable, *args) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy(f"{self._pending} password hashes pending")
+            self._pending += 1
+
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._get_executor(), function, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash_async(self, password: str) -> str:
+        """
+        Hash a password on the hasher threads.
+
+        Raises:
+            PasswordHasherBusy: If there are already `max_pending` calls.
+        """
+        return await self._run(self.hash, password)
+
+    async def verify_and_update_async(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password on the hasher threads, see `verify_and_update`.
+
+        Raises:
+            PasswordHasherBusy: If there are already `max_pending` calls.
+        """
+        return await self._run(self.verify_and_update, password, hashed)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """
+        Hasher counters.
+
+        Returns:
+            dict: The scheme, the threads usage, the rejected and rehashed
+            counters and the verification latency histogram (seconds).
+        """
+        return {
+            "scheme": self.context.default_scheme(),
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "verify_latency": self.latency.snapshot()
+        }
+
+
+password_hasher = PasswordHasher(
+    make_password_context(),
+    workers=PASSWORD_HASH_WORKERS,
+    max_pending=PASSWORD_HASH_MAX_PENDING
+)
@@ -0,0 +1,145 @@
+# Standard Imports
+from datetime import datetime
+from threading import Event, Lock, Thread
+from sqlalchemy import and_, select
+from sqlalchemy.exc import SQLAlchemyError
+
+# Typing Imports
+from typing import Dict, NamedTuple, Optional
+
+# Database Import
+from ..db.engine import SessionLocal
+from ..modules.users.models import User
+
+# Token Versions Configuration
+from .config import AUTH_TOKEN_VERSIONS_REFRESH_SECONDS
+
+
+# Returned by `TokenVersions.get` for users not loaded yet
+MISSING = object()
+
+
+class TokenUser(NamedTuple):
+    """
+    The authenticated user of a stateless token, built from its claims.
+    """
+    id: int
+    email: str
+    admin: bool
+
+
+class TokenVersions:
+    """
+    In-memory token versions of the active users, keyed by id.
+
+    The version is the user `token_version` column, raised by every edit
+    of the user (admin flag, password, deletion) so the tokens issued
+    before it are revoked. Password rehashes keep it, they revoke nothing.
+
+    The whole map is reloaded from the database every `interval` seconds by
+    a background thread, each worker keeps its own. Users missing from the
+    map (created or deleted since the last reload) are loaded one at a time
+    with `load`, deleted users are kept as None until the next reload.
+    """
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self.refreshes = 0
+        self.errors = 0
+        self.refreshed_on: Optional[datetime] = None
+        self._versions: Dict[int, Optional[int]] = {}
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+
+    def get(self, id: int) -> object:
+        """
+        Token version of an user from the map, without querying the database.
+
+        Returns:
+            int: The version, None if the user is deleted, `MISSING` if not loaded.
+        """
+        return self._versions.get(id, MISSING)
+
+    def set(self, id: int, version: Optional[int]) -> None:
+        self._versions[id] = version
+
+    def load(self, id: int) -> Optional[int]:
+        """
+        Load the token version of one user into the map.
+
+        Returns:
+            int: The version, None if the user does not exist or is deleted.
+        """
+        db = SessionLocal()
+        try:
+            version = db.execute(select(User.token_version).where(and_(
+                User.id == id,
+                User.is_deleted == False
+            ))).scalar()
+        finally:
+            db.close()
+
+        self.set(id, version)
+        return version
+
+    def refresh(self) -> None:
+        """
+        Reload the token versions of all the active users.
+        """
+        db = SessionLocal()
+        try:
+            rows = db.execute(select(User.id, User.token_version).where(
+                User.is_deleted == False
+            )).all()
+        finally:
+            db.close()
+
+        # Replaced at once, the readers never see a partial map
+        self._versions = dict(rows)
+        self.refreshes += 1
+        self.refreshed_on = datetime.utcnow()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except SQLAlchemyError:
+                # Keeps the previous versions until the database answers again
+                self.errors += 1
+            if self._stop.wait(self.interval):
+                break
+
+    def start(self) -> None:
+        """
+        Start reloading the map in the background, every `interval` seconds.
+        """
+        with self._lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = Thread(target=self._run, name="token-versions", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def stats(self) -> dict:
+        """
+        Token versions counters.
+
+        Returns:
+            dict: The users in the map, the reloads done and failed and the last reload time (UTC).
+        """
+        return {
+            "size": len(self._versions),
+            "interval": self.interval,
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "refreshed_on": self.refreshed_on
+        }
+
+
+token_versions = TokenVersions(interval=AUTH_TOKEN_VERSIONS_REFRESH_SECONDS)
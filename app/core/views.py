@@ -1,9 +1,13 @@
 # Framework imports.
 from fastapi import FastAPI
+from fastapi import APIRouter
 
 # Prefix Import
 from .. import API_PREFIX
 
+# Database Mode
+from .config import DATABASE_ASYNC
+
 
 # Import First Admin Registration Route
 from .first_access import route as first_access_route
@@ -26,11 +30,54 @@ from app.modules.products.routes import route as product_router
 # Import Product Router
 from app.modules.transactions.routes import route as transaction_router
 
+# Import Report Router
+from app.modules.reports.routes import route as report_router
+
+
+def _merge_routers(async_router: APIRouter, sync_router: APIRouter) -> APIRouter:
+    """
+    Replace the sync routes by their async versions, keeping the declaration
+    order. Routes without an async version stay on the sync engine.
+    """
+    async_routes = {
+        (route.path, method): route
+        for route in async_router.routes
+        for method in route.methods
+    }
+
+    router = APIRouter()
+    for route in sync_router.routes:
+        replacement = [async_routes[(route.path, method)] for method in route.methods if (route.path, method) in async_routes]
+        router.routes.append(replacement[0] if replacement else route)
+    return router
+
+
+def _select_routers() -> tuple:
+    """
+    Pick the async routers when the `DATABASE_ASYNC` mode is enabled.
+    """
+    if not DATABASE_ASYNC:
+        return user_router, provider_router, product_router, transaction_router
+
+    from app.modules.users.async_routes import route as async_user_router
+    from app.modules.providers.async_routes import route as async_provider_router
+    from app.modules.products.async_routes import route as async_product_router
+    from app.modules.transactions.async_routes import route as async_transaction_router
+
+    return (
+        _merge_routers(async_user_router, user_router),
+        _merge_routers(async_provider_router, provider_router),
+        _merge_routers(async_product_router, product_router),
+        _merge_routers(async_transaction_router, transaction_router)
+    )
+
 
 def create_routes(app: FastAPI) -> None:
     """
     Include routes.
     """
+    user_routes, provider_routes, product_routes, transaction_routes = _select_routers()
+
     # Include Core Router
     app.include_router(core_router, tags=['Core'], prefix=API_PREFIX)
 
@@ -41,13 +88,16 @@ def create_routes(app: FastAPI) -> None:
     app.include_router(auth_router, tags=['Authentication'], prefix=API_PREFIX)
 
     # Include Project Info Router
-    app.include_router(user_router, tags=['Users'], prefix=API_PREFIX+'/admin')
+    app.include_router(user_routes, tags=['Users'], prefix=API_PREFIX+'/admin')
 
     # Include Provider Router
-    app.include_router(provider_router, tags=['Providers'], prefix=API_PREFIX)
+    app.include_router(provider_routes, tags=['Providers'], prefix=API_PREFIX)
     
     # Include Product Router
-    app.include_router(product_router, tags=['Products'], prefix=API_PREFIX)
+    app.include_router(product_routes, tags=['Products'], prefix=API_PREFIX)
     
     # Include Transaction Router
-    app.include_router(transaction_router, tags=['Transaction'], prefix=API_PREFIX)
+    app.include_router(transaction_routes, tags=['Transaction'], prefix=API_PREFIX)
+
+    # Include Report Router
+    app.include_router(report_router, tags=['Reports'], prefix=API_PREFIX)
@@ -0,0 +1,53 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from .engine import Base
+from .pool import make_pool_options
+from .instrumentation import instrument_engine
+
+from ..core.config import DATABASE_ASYNC
+from ..core.config import SQL_INSTRUMENTATION
+from ..core.config import get_async_database_url
+
+
+def make_async_session_factory(url: str) -> sessionmaker:
+    """
+    Create an async engine and its session factory.
+
+    Objects are not expired on commit, because an expired attribute
+    would need a lazy load, which is not allowed on async sessions.
+    """
+    engine = create_async_engine(url, **make_pool_options(url, is_async=True))
+    if SQL_INSTRUMENTATION:
+        instrument_engine(engine.sync_engine)
+    return sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False,
+        bind=engine, class_=AsyncSession
+    )
+
+
+# The async driver is only required when the async mode is enabled
+AsyncSessionLocal = make_async_session_factory(get_async_database_url()) if DATABASE_ASYNC else None
+
+
+# Dependency
+async def get_async_db():
+    """
+    Create a new `AsyncSession` that will be used in a single
+    request, and then close it once the request is finished
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def async_create_all(session_factory: sessionmaker = None):
+    session_factory = session_factory or AsyncSessionLocal
+    async with session_factory.kw['bind'].begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def async_drop_all(session_factory: sessionmaker = None):
+    session_factory = session_factory or AsyncSessionLocal
+    async with session_factory.kw['bind'].begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
@@ -1,36 +1,41 @@
 import sqlalchemy as db
 
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import FetchedValue
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 # Base Mixin object.
 class BaseMixin(object):
-    __mapper_args__ = {'always_refresh': True}
+    # The `created_on` and `updated_on` values are fetched by the INSERT and
+    # UPDATE statements themselves on databases with RETURNING support
+    __mapper_args__ = {'eager_defaults': True}
 
-    created_on = db.Column(db.DateTime, default=db.func.now())
-    updated_on = db.Column(db.DateTime, onupdate=db.func.now())
+    # Generated by the statements, marked as fetched values to be eagerly loaded
+    created_on = db.Column(db.DateTime, default=db.func.now(), server_default=FetchedValue())
+    updated_on = db.Column(db.DateTime, onupdate=db.func.now(), server_onupdate=FetchedValue())
     
     @property
     def metadatetime(self):
         return self
 
-    def insert(self, session: Session, refresh: bool = True) -> object:
+    def insert(self, session: Session, refresh: bool = False) -> object:
         """
-        Use only for insert operation
+        Use only for insert operation, `refresh` reloads all the columns after the commit
         """
         try:
             session.add(self)
             session.commit()
             if refresh:
                 session.refresh(self)
-                return self
+            return self
         except:
             session.rollback()
             raise
 
-    def update(self, session: Session, **kwargs) -> None:
+    def update(self, session: Session, refresh: bool = False, **kwargs) -> None:
         """
-        User only for update operation
+        User only for update operation, `refresh` reloads all the columns after the commit
         """
         try:
             # set the new values
@@ -38,6 +43,8 @@ class BaseMixin(object):
                 setattr(self, key, value)
             # commit the modifications
             session.commit()
+            if refresh:
+                session.refresh(self)
         except:
             session.rollback()
             raise
@@ -51,4 +58,56 @@ class BaseMixin(object):
             session.commit()
         except:
             session.rollback()
-            raise
\ No newline at end of file
+            raise
+
+    async def insert_async(self, session: AsyncSession, refresh: bool = False) -> object:
+        """
+        Use only for insert operation on an async session
+        """
+        try:
+            session.add(self)
+            await session.commit()
+            if refresh:
+                await session.refresh(self)
+            return self
+        except:
+            await session.rollback()
+            raise
+
+    async def update_async(self, session: AsyncSession, refresh: bool = False, **kwargs) -> None:
+        """
+        Use only for update operation on an async session
+        """
+        try:
+            # set the new values
+            for key, value in kwargs.items():
+                setattr(self, key, value)
+            # commit the modifications, the `updated_on` value is fetched by the flush
+            await session.commit()
+            if refresh:
+                await session.refresh(self)
+        except:
+            await session.rollback()
+            raise
+
+    async def delete_async(self, session: AsyncSession) -> None:
+        """
+        Use only for delete operation on an async session
+        """
+        try:
+            await session.delete(self)
+            await session.commit()
+        except:
+            await session.rollback()
+            raise
+
+def active_rows_index(name: str, is_deleted: db.Column, id: db.Column) -> db.Index:
+    """
+    Index of the rows not soft deleted in id order, as the endpoints list them.
+
+    PostgreSQL gets a partial index (`WHERE NOT is_deleted`) with the deleted
+    rows left out. SQLite only uses a partial index when the query repeats
+    its condition as a literal, the bound `is_deleted = ?` does not, so the
+    flag is also the leading column.
+    """
+    return db.Index(name, is_deleted, id, postgresql_where=db.not_(is_deleted))
\ No newline at end of file
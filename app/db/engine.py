@@ -3,12 +3,18 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 
+from .pool import make_pool_options
+from .instrumentation import instrument_engine
 from ..core.config import DATABASE_URL as SQLALCHEMY_DATABASE_URL
+from ..core.config import SQL_INSTRUMENTATION
 
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **make_pool_options(SQLALCHEMY_DATABASE_URL))
+if SQL_INSTRUMENTATION:
+    instrument_engine(engine)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Committed instances keep their values, as on the async sessions
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 Base = declarative_base()
 
@@ -0,0 +1,142 @@
+# Standard Imports
+import logging
+from contextvars import ContextVar, Token
+from time import perf_counter
+from sqlalchemy import event
+
+# Typing Imports
+from typing import Any, Optional, Tuple
+from sqlalchemy.engine import Engine
+
+# Serialization Import
+from ..utils.serialization import dumps
+
+# Instrumentation Configuration
+from ..core.config import SQL_SLOW_QUERY_SECONDS
+
+
+logger = logging.getLogger("app.db.queries")
+
+# Statements are logged on one line, cut at this length
+MAX_STATEMENT_LENGTH = 1000
+
+# Rows of an executemany logged with a slow statement
+MAX_LOGGED_ROWS = 3
+
+
+class QueryStats:
+    """
+    Statements sent to the database while handling one request.
+    """
+    __slots__ = ("count", "duration", "slowest", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        if elapsed > self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+    def as_dict(self) -> dict:
+        """
+        Statement counters of the request, times in milliseconds.
+        """
+        return {
+            "db_queries": self.count,
+            "db_duration_ms": round(self.duration * 1000, 3),
+            "db_slowest_ms": round(self.slowest * 1000, 3),
+            "db_slowest_statement": format_statement(self.slowest_statement) if self.slowest_statement else None
+        }
+
+
+# Stats of the current request, copied to the threadpool and to the async greenlets
+_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> Tuple[QueryStats, Token]:
+    """
+    Count the statements executed from the current context on a new `QueryStats`.
+
+    Returns:
+        tuple: The stats and the token to give to `stop_query_stats`.
+    """
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_stats(token: Token) -> None:
+    _query_stats.reset(token)
+
+
+def get_query_stats() -> Optional[QueryStats]:
+    return _query_stats.get()
+
+
+def format_statement(statement: str) -> str:
+    return " ".join(statement.split())[:MAX_STATEMENT_LENGTH]
+
+
+def _redact_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _redact_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_redact_value(item) for item in value]
+    # Only the type is kept, values may hold passwords or personal data
+    return None if value is None else f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Replace the bound parameters by their types, keeping their names and positions.
+
+    Args:
+        parameters (Any): The DBAPI parameters, a sequence of them on executemany.
+        executemany (bool): Whether the statement is executed once per row.
+
+    Returns:
+        Any: The redacted parameters, the first rows and the row count on executemany.
+    """
+    if executemany:
+        return {
+            "rows": len(parameters),
+            "first": [_redact_value(row) for row in list(parameters)[:MAX_LOGGED_ROWS]]
+        }
+    return _redact_value(parameters)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - context._query_start
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed >= SQL_SLOW_QUERY_SECONDS:
+        logger.warning(dumps({
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 3),
+            "statement": format_statement(statement),
+            "parameters": redact_parameters(parameters, executemany)
+        }).decode())
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement of the engine, counting it on the current request
+    stats and logging it when slower than `SQL_SLOW_QUERY_SECONDS`.
+
+    Args:
+        engine (Engine): The sync engine, or the `sync_engine` of an async one.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
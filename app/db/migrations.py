@@ -0,0 +1,68 @@
+# Standard Imports
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+# Typing Imports
+from typing import List, Optional
+
+
+def _make_index(name: str, table_name: str, columns: List[str], where: Optional[str] = None) -> sa.Index:
+    # Only the names are needed to render the statements
+    table = sa.Table(table_name, sa.MetaData(), *[sa.Column(column) for column in columns])
+    options = {"postgresql_concurrently": True}
+    if where != None:
+        options["postgresql_where"] = sa.text(where)
+    return sa.Index(name, *[table.c[column] for column in columns], **options)
+
+
+def _is_invalid_index(name: str) -> bool:
+    return op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+        "WHERE pg_class.relname = :name AND NOT pg_index.indisvalid"
+    ), {"name": name}).first() != None
+
+
+def create_index_online(name: str, table_name: str, columns: List[str], where: Optional[str] = None) -> None:
+    """
+    Create an index without blocking the writes to the table.
+
+    PostgreSQL builds it with CREATE INDEX CONCURRENTLY, which can not run
+    inside a transaction, so the migration transaction is committed first.
+    An invalid index left by an interrupted build is dropped and built
+    again. Existing indexes are kept, like the ones of tables made by
+    `create_all`.
+
+    Args:
+        name (str): The index name.
+        table_name (str): The indexed table.
+        columns (List[str]): The indexed columns.
+        where (str): The condition of a partial index, only used on PostgreSQL.
+    """
+    index = _make_index(name, table_name, columns, where)
+    if op.get_bind().dialect.name != "postgresql":
+        op.execute(CreateIndex(index, if_not_exists=True))
+        return
+
+    with op.get_context().autocommit_block():
+        if not op.get_context().as_sql and _is_invalid_index(name):
+            op.execute(DropIndex(index, if_exists=True))
+        op.execute(CreateIndex(index, if_not_exists=True))
+
+
+def drop_index_online(name: str, table_name: str) -> None:
+    """
+    Drop an index without blocking the reads and writes to the table
+    (DROP INDEX CONCURRENTLY on PostgreSQL).
+
+    Args:
+        name (str): The index name.
+        table_name (str): The indexed table.
+    """
+    index = _make_index(name, table_name, [])
+    if op.get_bind().dialect.name != "postgresql":
+        op.execute(DropIndex(index, if_exists=True))
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(DropIndex(index, if_exists=True))
@@ -9,4 +9,13 @@ from app.modules.products.models import Product, ProductImage
 
 # Transactions
 from app.modules.transactions.models import Transaction
-from app.modules.transactions_products.models import TransactionProduct
\ No newline at end of file
+from app.modules.transactions_products.models import TransactionProduct
+
+# Inventory Snapshots
+from app.modules.inventory_snapshots.models import InventorySnapshot
+
+# Reports
+from app.modules.reports.models import ProductMovementReport, ProviderMovementReport
+
+# Table Versions
+from app.db.versions import TableVersion
\ No newline at end of file
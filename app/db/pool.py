@@ -0,0 +1,92 @@
+# Standard Imports
+from time import perf_counter
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Typing Imports
+from sqlalchemy.engine import Engine
+
+# Metrics Imports
+from ..utils.metrics import Histogram
+
+# Pool Configuration
+from ..core.config import DATABASE_POOL_SIZE
+from ..core.config import DATABASE_MAX_OVERFLOW
+from ..core.config import DATABASE_POOL_TIMEOUT
+from ..core.config import DATABASE_POOL_RECYCLE
+from ..core.config import DATABASE_POOL_PRE_PING
+
+
+# Time spent waiting for a connection, in seconds
+checkout_latency = Histogram()
+
+
+class _CheckoutTimingMixin:
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            checkout_latency.observe(perf_counter() - start)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def make_pool_options(url: str, is_async: bool = False) -> dict:
+    """
+    Engine keyword arguments for the connection pool.
+
+    SQLite keeps the pool chosen by its dialect, which does not accept sizing options.
+
+    Args:
+        url (str): The database URL.
+        is_async (bool): Whether the options are for an async engine.
+
+    Returns:
+        dict: The `create_engine` pool keyword arguments.
+    """
+    options = {
+        "pool_pre_ping": DATABASE_POOL_PRE_PING,
+        "pool_recycle": DATABASE_POOL_RECYCLE
+    }
+    if url.startswith("sqlite"):
+        return options
+
+    options.update({
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": DATABASE_POOL_SIZE,
+        "max_overflow": DATABASE_MAX_OVERFLOW,
+        "pool_timeout": DATABASE_POOL_TIMEOUT
+    })
+    return options
+
+
+def get_pool_status(engine: Engine) -> dict:
+    """
+    Connections currently held by the engine pool.
+
+    Args:
+        engine (Engine): The sync engine, or the `sync_engine` of an async one.
+
+    Returns:
+        dict: The pool class and, for queue pools, its connection counters.
+    """
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout()
+        })
+    return status
@@ -0,0 +1,185 @@
+# Standard Imports
+from sqlite3 import sqlite_version_info
+from sqlalchemy import case, event, func, literal, literal_column, select, table, text, true
+from sqlalchemy.exc import OperationalError
+
+# Typing Imports
+from typing import List
+from sqlalchemy import Column
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import ColumnElement
+
+from .engine import Base
+from .engine import engine
+
+
+# Columns searched by `name_search`, indexed when the tables are created
+search_columns: List[Column] = []
+
+# The FTS5 trigram tokenizer is available since SQLite 3.34
+SQLITE_TRIGRAM = sqlite_version_info >= (3, 34, 0)
+
+# Trigram MATCH needs at least three characters, shorter terms use LIKE
+FTS_MIN_TERM_LENGTH = 3
+
+
+def add_name_search(column: Column) -> None:
+    """
+    Index a column to be searched by `name_search`.
+
+    PostgreSQL gets a trigram GIN index on `lower(column)`, SQLite gets an
+    external content FTS5 table kept in sync by triggers.
+    """
+    search_columns.append(column)
+
+
+def _fts_table_name(column: Column) -> str:
+    return f"{column.table.name}_{column.name}_fts"
+
+
+def _primary_key(column: Column) -> Column:
+    return list(column.table.primary_key)[0]
+
+
+def _create_postgresql_search(connection: Connection, column: Column) -> None:
+    table_name, name = column.table.name, column.name
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    connection.execute(text(
+        f"CREATE INDEX IF NOT EXISTS ix_{table_name}_{name}_trgm "
+        f"ON {table_name} USING gin (lower({name}) gin_trgm_ops)"
+    ))
+
+
+def _create_sqlite_search(connection: Connection, column: Column) -> None:
+    table_name, name, fts = column.table.name, column.name, _fts_table_name(column)
+    pk = _primary_key(column).name
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts}
+    ).first()
+    if exists:
+        return
+
+    connection.execute(text(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{name}, content='{table_name}', content_rowid='{pk}', tokenize='trigram')"
+    ))
+    connection.execute(text(
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table_name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {name}) VALUES (new.{pk}, new.{name}); END"
+    ))
+    connection.execute(text(
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {name}) VALUES ('delete', old.{pk}, old.{name}); END"
+    ))
+    connection.execute(text(
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {name} ON {table_name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {name}) VALUES ('delete', old.{pk}, old.{name}); "
+        f"INSERT INTO {fts}(rowid, {name}) VALUES (new.{pk}, new.{name}); END"
+    ))
+
+    # Indexes the rows stored before the search table existed
+    connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+
+
+def create_column_search(connection: Connection, column: Column) -> None:
+    """
+    Create the search index of a column, if it does not exist yet.
+
+    Used by the migrations, with the columns of the tables they create.
+    """
+    if connection.dialect.name == "postgresql":
+        _create_postgresql_search(connection, column)
+    elif connection.dialect.name == "sqlite" and SQLITE_TRIGRAM:
+        _create_sqlite_search(connection, column)
+
+
+def drop_column_search(connection: Connection, column: Column) -> None:
+    """
+    Drop the SQLite search table of a column, PostgreSQL indexes are dropped with their tables.
+    """
+    if connection.dialect.name == "sqlite" and SQLITE_TRIGRAM:
+        try:
+            connection.execute(text(f"DROP TABLE IF EXISTS {_fts_table_name(column)}"))
+        except OperationalError:
+            # Without the trigram tokenizer the table can not be loaded, nor dropped
+            pass
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_name_search(target, connection: Connection, **kw) -> None:
+    """
+    Create the search indexes of the registered columns, if they do not exist yet.
+    """
+    for column in search_columns:
+        create_column_search(connection, column)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def drop_name_search(target, connection: Connection, **kw) -> None:
+    """
+    Drop the search tables of the registered columns.
+    """
+    for column in search_columns:
+        drop_column_search(connection, column)
+
+
+def name_search(column: Column, term: str) -> ColumnElement:
+    """
+    Filter the rows whose column contains the term, ignoring case.
+
+    On PostgreSQL it also matches similar names (trigram similarity), on
+    SQLite the registered columns are searched through their FTS5 table.
+
+    Args:
+        column (Column): The searched column.
+        term (str): The text to search.
+
+    Returns:
+        ColumnElement: The filter clause.
+    """
+    term = term.lower()
+    if term == '':
+        return true()
+
+    contains = func.lower(column).contains(term, autoescape=True)
+
+    if engine.dialect.name == "postgresql":
+        # Both conditions are answered by the same trigram index
+        return contains | func.lower(column).op("%")(term)
+
+    if engine.dialect.name == "sqlite" and SQLITE_TRIGRAM and column in search_columns \
+        and len(term) >= FTS_MIN_TERM_LENGTH:
+        fts = _fts_table_name(column)
+        phrase = '"' + term.replace('"', '""') + '"'
+        return _primary_key(column).in_(
+            select(literal_column("rowid")).select_from(table(fts)).where(
+                literal_column(fts).op("MATCH")(literal(phrase))
+            )
+        )
+
+    return contains
+
+
+def name_search_rank(column: Column, term: str) -> List[ColumnElement]:
+    """
+    Order by relevance for `name_search`, names starting with the term come first.
+
+    Args:
+        column (Column): The searched column.
+        term (str): The searched text.
+
+    Returns:
+        List[ColumnElement]: The `order_by` clauses, empty if there is no term.
+    """
+    term = term.lower()
+    if term == '':
+        return []
+
+    prefix = case((func.lower(column).startswith(term, autoescape=True), 0), else_=1)
+
+    if engine.dialect.name == "postgresql":
+        return [prefix, func.similarity(func.lower(column), term).desc()]
+
+    # Shorter names are closer to the term
+    return [prefix, func.length(column)]
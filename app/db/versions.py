@@ -0,0 +1,130 @@
+# Standard Imports
+import sqlalchemy as db
+from itertools import chain
+from sqlalchemy import event, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# Typing Imports
+from typing import Set, Tuple
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Insert
+
+from .engine import Base
+
+
+# Tables whose writes raise their version, registered by `add_table_version`
+versioned_tables: Set[str] = set()
+
+# Versioned tables written by the current transaction of a session
+_WRITTEN_TABLES = "written_tables"
+
+
+class TableVersion(Base):
+    __tablename__ = 'support_table_versions'
+
+    # Table name, its row is created by the first write
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False)
+
+
+def add_table_version(model) -> None:
+    """
+    Keep a version of the model table, raised by the commit of every
+    transaction writing to it, see `fetch_versions`.
+    """
+    versioned_tables.add(model.__tablename__)
+
+
+def _written_tables(session: Session) -> Set[str]:
+    return session.info.setdefault(_WRITTEN_TABLES, set())
+
+
+def _make_version_bump(dialect_name: str, name: str) -> Insert:
+    insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+    statement = insert(TableVersion).values(name=name, version=1)
+    return statement.on_conflict_do_update(
+        index_elements=[TableVersion.name], set_={"version": TableVersion.version + 1}
+    )
+
+
+def _make_versions_select(names: Tuple[str, ...]):
+    return select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(names))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        name = getattr(instance, "__tablename__", None)
+        if name in versioned_tables:
+            _written_tables(session).add(name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_executed_tables(state: ORMExecuteState) -> None:
+    # Statements as the conditional stock UPDATE, they are not flushed
+    if state.is_insert or state.is_update or state.is_delete:
+        name = state.statement.table.name
+        if name in versioned_tables:
+            _written_tables(state.session).add(name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_versions(session: Session) -> None:
+    """
+    Raise the versions of the tables written by the transaction, on the
+    same transaction. Rows are written first and the versions last, in
+    name order, so their locks are held only until the commit and always
+    taken in the same order.
+    """
+    session.flush()
+    names = session.info.pop(_WRITTEN_TABLES, None)
+    if not names:
+        return
+
+    dialect_name = session.get_bind().dialect.name
+    for name in sorted(names):
+        session.execute(_make_version_bump(dialect_name, name))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_tables(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES, None)
+
+
+def version_column(name: str):
+    """
+    The version of a table as a column of another select, 0 for a table never
+    written, so the version of a record is read along with it.
+    """
+    version = select(TableVersion.version).where(TableVersion.name == name).scalar_subquery()
+    return func.coalesce(version, 0)
+
+
+def fetch_versions(db: Session, *names: str) -> Tuple[int, ...]:
+    """
+    Retrieve the versions of the tables, 0 for a table never written.
+
+    Unlike the greatest id or `updated_on`, a version always grows with
+    each committed write, including soft deletes of older rows and writes
+    committed out of order or within the same second.
+
+    Args:
+        db (Session): The database session.
+        names (str): The table names.
+
+    Returns:
+        Tuple[int, ...]: The versions, in the order of the names.
+    """
+    versions = dict(db.execute(_make_versions_select(names)).all())
+    return tuple(versions.get(name, 0) for name in names)
+
+
+async def fetch_versions_async(db: AsyncSession, *names: str) -> Tuple[int, ...]:
+    """
+    Retrieve the versions of the tables on an async session, see `fetch_versions`.
+    """
+    result = await db.execute(_make_versions_select(names))
+    versions = dict(result.all())
+    return tuple(versions.get(name, 0) for name in names)
@@ -9,10 +9,23 @@ from app.db import models
 from . import __version__
 from . import API_PREFIX
 from app.core.views import create_routes
+from app.core.passwords import password_hasher
+from app.core.tokens import token_versions
+from app.core.middleware import MetricsMiddleware
+from app.core.middleware import QueryTimingMiddleware
+from app.core.metrics import start_metrics
+from app.core.metrics import stop_metrics
 
 # CORS Origins
 from app.core.config import get_cors_origins
 
+# Authorization Configuration
+from app.core.config import AUTH_STATELESS_TOKENS
+
+# Instrumentation Configuration
+from app.core.config import SQL_INSTRUMENTATION
+from app.core.config import METRICS_ENABLED
+
 
 # Application factory
 def create_app() -> FastAPI:
@@ -35,8 +48,26 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Requests metrics, inside the statements counting to read its totals
+    if METRICS_ENABLED:
+        application.add_middleware(MetricsMiddleware)
+        application.add_event_handler("startup", start_metrics)
+        application.add_event_handler("shutdown", stop_metrics)
+
+    # Statement counts and times of each request
+    if SQL_INSTRUMENTATION:
+        application.add_middleware(QueryTimingMiddleware)
+
     # Create routes
     create_routes(application)
 
+    # Wait for the password hasher threads
+    application.add_event_handler("shutdown", password_hasher.shutdown)
+
+    # Reload the stateless tokens versions in the background
+    if AUTH_STATELESS_TOKENS:
+        application.add_event_handler("startup", token_versions.start)
+        application.add_event_handler("shutdown", token_versions.stop)
+
     # Make app
     return application
\ No newline at end of file
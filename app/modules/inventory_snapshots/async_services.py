@@ -0,0 +1,55 @@
+# Standard Imports
+from datetime import date
+from sqlalchemy import insert, select
+
+# Typing Imports
+from typing import Dict, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Product Model
+from app.modules.products.models import Product
+
+# Inventory Snapshot Model and Sync Service
+from .models import InventorySnapshot
+from .services import InventorySnapshotService
+
+
+class AsyncInventorySnapshotService(InventorySnapshotService):
+    """
+    Async version of the `InventorySnapshotService`, the statements are
+    built by the sync service.
+    """
+    async def _compute_inventory_at(self, db: AsyncSession, product_id: int, day: date, current: Optional[int] = None) -> int:
+        previous = (await db.execute(self._make_previous_snapshot_select(product_id, day))).first()
+        if previous != None:
+            return previous.inventory + (await db.execute(self._make_deltas_sum(product_id, previous.date, day))).scalar()
+
+        next = (await db.execute(self._make_next_snapshot_select(product_id, day))).first()
+        if next != None:
+            return next.inventory - (await db.execute(self._make_deltas_sum(product_id, day, next.date))).scalar()
+
+        if current == None:
+            current = (await db.execute(select(Product.inventory).where(Product.id == product_id))).scalar()
+        return current - (await db.execute(self._make_deltas_sum(product_id, day))).scalar()
+
+    async def apply_deltas(self, db: AsyncSession, deltas: Dict[Tuple[int, date], int]) -> None:
+        """
+        Update the snapshots with the stock changes of new transactions.
+
+        Args:
+            db (AsyncSession): The async database session.
+            deltas (Dict[Tuple[int, date], int]): Stock change per product id and transaction date.
+        """
+        for (product_id, day), delta in sorted(deltas.items()):
+            if delta != 0:
+                await db.execute(self._make_snapshots_update(product_id, day, delta))
+
+        for product_id, period_end in sorted({(product_id, self._period_end(day)) for product_id, day in deltas}):
+            if (await db.execute(self._make_snapshot_select(product_id, period_end))).first() != None:
+                continue
+
+            await db.execute(insert(InventorySnapshot).values(
+                product_id = product_id,
+                date = period_end,
+                inventory = await self._compute_inventory_at(db, product_id, period_end)
+            ))
@@ -0,0 +1,13 @@
+import sqlalchemy as db
+
+from ...db.engine import Base
+from ...db.base import BaseMixin
+
+
+class InventorySnapshot(BaseMixin, Base):
+    __tablename__ = 'support_inventory_snapshots'
+
+    # Product stock at the end of the date, the last day of a month
+    product_id = db.Column(db.Integer, db.ForeignKey('base_products.id'), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    inventory = db.Column(db.Integer, nullable=False)
\ No newline at end of file
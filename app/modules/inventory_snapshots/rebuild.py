@@ -0,0 +1,39 @@
+"""
+Rebuild the products inventory snapshots from their stock and transactions.
+
+Backfills the snapshots of the transactions stored before they existed.
+
+Usage:
+    python -m app.modules.inventory_snapshots.rebuild [--batch-size 500]
+"""
+# Standard Imports
+from argparse import ArgumentParser
+
+# Database Imports
+from app.db import models
+from app.db.engine import SessionLocal
+
+# Inventory Snapshot Service
+from .services import InventorySnapshotService
+from .services import REBUILD_BATCH_SIZE
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Rebuild the products inventory snapshots from their stock and transactions.")
+    parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE,
+        help="Amount of products read and committed at a time.")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        processed = InventorySnapshotService().rebuild(
+            db, args.batch_size, on_batch=lambda processed: print(f"{processed} products processed")
+        )
+    finally:
+        db.close()
+
+    print(f"Inventory snapshots rebuilt for {processed} products.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+from datetime import date
+from pydantic import BaseModel
+
+
+class ProductInventoryResponse(BaseModel):
+    product_id: int
+    date: date
+    inventory: int
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "product_id": 1,
+                "date": "2020-01-01",
+                "inventory": 10
+            }
+        }
\ No newline at end of file
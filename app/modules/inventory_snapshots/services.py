@@ -0,0 +1,224 @@
+# Standard Imports
+from calendar import monthrange
+from datetime import date
+from sqlalchemy import and_, case, delete, func, insert, select, update
+
+# Typing Imports
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select, Update
+
+# Product Model
+from app.modules.products.models import Product
+
+# Transaction Models
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.schemas import TransactionTypeEnum
+from app.modules.transactions_products.models import TransactionProduct
+
+# Inventory Snapshot Model and Schemas
+from .models import InventorySnapshot
+from .schemas import ProductInventoryResponse
+
+
+# Products read and committed at a time by the rebuild
+REBUILD_BATCH_SIZE = 500
+
+
+class InventorySnapshotService:
+    """
+    Keeps one stock snapshot per product and month with movements, so the
+    stock at any date is computed from the nearest snapshot plus the
+    transactions of at most one month.
+    """
+    def _period_end(self, day: date) -> date:
+        return day.replace(day=monthrange(day.year, day.month)[1])
+
+    def _make_delta(self) -> ColumnElement:
+        return case(
+            (Transaction.type == TransactionTypeEnum.outgoing, -TransactionProduct.quantity),
+            else_=TransactionProduct.quantity
+        )
+
+    def _make_deltas_sum(self, product_id: int, after: Optional[date] = None, until: Optional[date] = None) -> Select:
+        query = select(func.coalesce(func.sum(self._make_delta()), 0)).select_from(TransactionProduct).join(
+            TransactionProduct.transactions
+        ).where(TransactionProduct.product_id == product_id)
+
+        if after != None:
+            query = query.where(Transaction.date > after)
+        if until != None:
+            query = query.where(Transaction.date <= until)
+
+        return query
+
+    def _make_snapshots_update(self, product_id: int, day: date, delta: int) -> Update:
+        # Snapshots from the transaction date onwards include the new transaction
+        return update(InventorySnapshot).where(and_(
+            InventorySnapshot.product_id == product_id,
+            InventorySnapshot.date >= day
+        )).values(
+            inventory = InventorySnapshot.inventory + delta
+        ).execution_options(synchronize_session=False)
+
+    def _make_snapshot_select(self, product_id: int, day: date) -> Select:
+        return select(InventorySnapshot.inventory).where(and_(
+            InventorySnapshot.product_id == product_id,
+            InventorySnapshot.date == day
+        ))
+
+    def _make_previous_snapshot_select(self, product_id: int, day: date) -> Select:
+        return select(InventorySnapshot.date, InventorySnapshot.inventory).where(and_(
+            InventorySnapshot.product_id == product_id,
+            InventorySnapshot.date <= day
+        )).order_by(InventorySnapshot.date.desc()).limit(1)
+
+    def _make_next_snapshot_select(self, product_id: int, day: date) -> Select:
+        return select(InventorySnapshot.date, InventorySnapshot.inventory).where(and_(
+            InventorySnapshot.product_id == product_id,
+            InventorySnapshot.date > day
+        )).order_by(InventorySnapshot.date).limit(1)
+
+    def _make_current_inventory_select(self, product_id: int) -> Select:
+        return select(Product.inventory).where(and_(
+            Product.id == product_id,
+            Product.is_deleted == False
+        ))
+
+    def _compute_inventory_at(self, db: Session, product_id: int, day: date, current: Optional[int] = None) -> int:
+        # Forward from the previous snapshot, or backwards from the next one or from the current stock
+        previous = db.execute(self._make_previous_snapshot_select(product_id, day)).first()
+        if previous != None:
+            return previous.inventory + db.execute(self._make_deltas_sum(product_id, previous.date, day)).scalar()
+
+        next = db.execute(self._make_next_snapshot_select(product_id, day)).first()
+        if next != None:
+            return next.inventory - db.execute(self._make_deltas_sum(product_id, day, next.date)).scalar()
+
+        if current == None:
+            current = db.execute(select(Product.inventory).where(Product.id == product_id)).scalar()
+        return current - db.execute(self._make_deltas_sum(product_id, day)).scalar()
+
+    def apply_deltas(self, db: Session, deltas: Dict[Tuple[int, date], int]) -> None:
+        """
+        Update the snapshots with the stock changes of new transactions.
+
+        Must run in the same database transaction that stored the transactions
+        and changed the products stock, after they were flushed.
+
+        Args:
+            db (Session): The database session.
+            deltas (Dict[Tuple[int, date], int]): Stock change per product id and transaction date.
+        """
+        for (product_id, day), delta in sorted(deltas.items()):
+            if delta != 0:
+                db.execute(self._make_snapshots_update(product_id, day, delta))
+
+        # Creates the snapshot of the transactions months, from the already updated ones
+        for product_id, period_end in sorted({(product_id, self._period_end(day)) for product_id, day in deltas}):
+            if db.execute(self._make_snapshot_select(product_id, period_end)).first() != None:
+                continue
+
+            db.execute(insert(InventorySnapshot).values(
+                product_id = product_id,
+                date = period_end,
+                inventory = self._compute_inventory_at(db, product_id, period_end)
+            ))
+
+    def _make_daily_deltas_select(self, products_ids: List[int]) -> Select:
+        return select(
+            TransactionProduct.product_id,
+            Transaction.date,
+            func.sum(self._make_delta()).label("delta")
+        ).select_from(TransactionProduct).join(
+            TransactionProduct.transactions
+        ).where(
+            TransactionProduct.product_id.in_(products_ids)
+        ).group_by(TransactionProduct.product_id, Transaction.date)
+
+    def _make_batch_snapshots(self, products: List[Tuple[int, int]], daily_deltas: list) -> List[dict]:
+        monthly: Dict[int, Dict[date, int]] = {}
+        for row in daily_deltas:
+            months = monthly.setdefault(row.product_id, {})
+            period_end = self._period_end(row.date)
+            months[period_end] = months.get(period_end, 0) + row.delta
+
+        # Backwards from the current stock, each month ends with the stock before the later months changes
+        snapshots = []
+        for product_id, inventory in products:
+            months = monthly.get(product_id, {})
+            for period_end in sorted(months, reverse=True):
+                snapshots.append({"product_id": product_id, "date": period_end, "inventory": inventory})
+                inventory -= months[period_end]
+        return snapshots
+
+    def rebuild(self, db: Session, batch_size: int = REBUILD_BATCH_SIZE,
+        on_batch: Callable[[int], None] = None) -> int:
+        """
+        Recreate the snapshots of every product from its current stock and
+        transactions, committing each batch of products.
+
+        Backfills the history stored before the snapshots existed, dates
+        before the first snapshot of a product would replay all its
+        transactions otherwise. The products of a batch are locked in id
+        order, as the transactions creation does, so their stock and
+        transactions do not change while the batch is rebuilt.
+
+        Args:
+            db (Session): The database session.
+            batch_size (int): Amount of products read at a time.
+            on_batch (Callable): Called with the amount of products processed after each batch.
+
+        Returns:
+            int: The amount of products processed.
+        """
+        processed, after = 0, 0
+        while True:
+            ids = db.execute(select(Product.id).where(Product.id > after).order_by(Product.id).limit(
+                batch_size
+            ).with_for_update()).scalars().all()
+            if len(ids) == 0:
+                db.commit()
+                break
+
+            # The delete takes the write lock on SQLite, before the stock is read
+            db.execute(delete(InventorySnapshot).where(
+                InventorySnapshot.product_id.in_(ids)
+            ).execution_options(synchronize_session=False))
+            products = db.execute(select(Product.id, Product.inventory).where(
+                Product.id.in_(ids)
+            ).order_by(Product.id)).all()
+            daily_deltas = db.execute(self._make_daily_deltas_select(ids)).all()
+
+            snapshots = self._make_batch_snapshots(products, daily_deltas)
+            if len(snapshots) > 0:
+                db.execute(insert(InventorySnapshot), snapshots)
+            db.commit()
+
+            processed, after = processed + len(ids), ids[-1]
+            if on_batch != None:
+                on_batch(processed)
+
+        return processed
+
+    def fetch_inventory_at(self, db: Session, product_id: int, day: date) -> Optional[ProductInventoryResponse]:
+        """
+        Retrieve the stock of a product at the end of a date.
+
+        Args:
+            db (Session): The database session.
+            product_id (int): The product ID.
+            day (date): The date of the stock.
+
+        Returns:
+            ProductInventoryResponse: The product stock at the date, None if the product was not found.
+        """
+        current = db.execute(self._make_current_inventory_select(product_id)).scalar()
+        if current == None:
+            return None
+
+        return ProductInventoryResponse(
+            product_id = product_id,
+            date = day,
+            inventory = self._compute_inventory_at(db, product_id, day, current)
+        )
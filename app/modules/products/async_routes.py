@@ -0,0 +1,182 @@
+# Standard Imports
+from fastapi import APIRouter
+from fastapi import HTTPException
+from fastapi import Depends
+from fastapi import Path, Query
+from fastapi import Header, Response
+
+# Database Import
+from app.db.async_engine import get_async_db
+
+# ETag Imports
+from ...utils.helpers import not_modified
+
+# Serialization Imports
+from ...utils.serialization import make_json_response
+
+# Typing Imports
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+# Exception Imports
+from sqlalchemy_filters.exceptions import InvalidPage
+from ...utils.exceptions import ItensNotFound
+from ...utils.exceptions import InvalidPageItemsNumber
+
+# Authentication Imports
+from ..users.models import User
+from app.core.auth import manager
+
+# Product Schemas
+from .async_services import AsyncProductService
+from .schemas import ProductCreate
+from .schemas import ProductUpdate
+from .schemas import ProductResponse
+from .schemas import ProductsResponse
+
+
+
+route = APIRouter()
+product_service = AsyncProductService()
+
+
+
+@route.get("/products/", response_model_exclude_unset=True, response_model=ProductsResponse)
+async def get_all_products(response: Response, if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db), auth_user: User=Depends(manager), name: Optional[str] = ''):
+    """
+    ## Retrieve all products.
+
+    ### Args:  
+      >  id (int): The product ID.   
+      >  name (str): Product name to filter.
+
+    ### Returns:  
+      >  ProductsResponse: A dict with products records.
+    """
+    etag = await product_service.fetch_list_etag(db)
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
+    try:
+        products = await product_service.fetch_all(db, name, etag)
+        return make_json_response(products, response)
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhum produto foi encontrado.")
+
+
+@route.get("/products/page/{page}", response_model=ProductsResponse)
+async def get_all_products_in_current_page(response: Response, page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
+    name: Optional[str] = '', if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve all products in current page.
+
+    ### Args:  
+      >  id (int): The product ID.  
+      >  page (int): Page to fetch.  
+      >  per_page (int): Amount of products per page.  
+      >  name (str): Product name to filter.
+
+    ### Returns:  
+      >  ProductsResponse: A dict with products records and pagination metadata.
+    """
+    etag = await product_service.fetch_list_etag(db)
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
+    try:
+        products = await product_service.fetch_all_with_pagination(db, page, per_page, name, etag)
+        return make_json_response(products, response)
+    except InvalidPage:
+        raise HTTPException(status_code=400, detail="Não foi possivel recuperar os itens na página informada.")
+    except InvalidPageItemsNumber:
+        raise HTTPException(status_code=400, detail="Quantidade de itens por pagina precisa ser maior que zero.")
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhum produto foi encontrado.")
+
+
+@route.get("/products/{id}", response_model=ProductResponse)
+async def get_one_product(id: int, response: Response, if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve one product.
+
+    ### Args:  
+      >  id (int): The product ID.
+
+    ### Raises:  
+      >  HTTPException: Raises 404 if product was not found.
+
+    ### Returns:  
+      >  ProductResponse: The product response model.
+    """
+    etag = await product_service.fetch_etag(db, id)
+    if not etag:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
+    product = await product_service.fetch(db, id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    return product
+
+
+@route.post("/products/", response_model=ProductResponse)
+async def create_product(product: ProductCreate, db: AsyncSession = Depends(get_async_db), auth_user: User=Depends(manager)):
+    """
+    ## Creates a product.
+
+    ### Args:  
+      >  product (ProductCreate): The product update model.
+
+    ### Returns:  
+      >  ProductResponse: The product response model.
+    """
+    product = await product_service.create(db, product, auth_user)
+    return product
+
+
+@route.patch("/products/{id}", response_model=ProductResponse)
+async def update_product(id: int, product: ProductUpdate, db: AsyncSession = Depends(get_async_db), auth_user: User=Depends(manager)):
+    """
+    ## Edits a product by id.
+
+    ### Args:  
+      >  id (int): The product ID.  
+      >  product (ProductUpdate): The product update model.
+
+    ### Raises:  
+      >  HTTPException: Raises 404 if product was not found.
+
+    ### Returns:  
+      >  ProductResponse: The product response model.
+    """
+    product = await product_service.update(db, id, product)
+    if not product:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    return product
+
+
+@route.delete("/products/{id}", response_model=ProductResponse)
+async def delete_product(id: int, db: AsyncSession = Depends(get_async_db), auth_user: User=Depends(manager)):
+    """
+    ## Deletes a product by id.
+
+    ### Args:  
+      >  id (int): The product ID.
+
+    ### Raises:  
+      >  HTTPException: Raises 404 if product was not found.
+
+    ### Returns:  
+      >  ProductResponse: The product response model.
+    """
+    product = await product_service.delete(db, id)
+    if not product:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    return product
@@ -0,0 +1,242 @@
+# Standard Import
+from sqlalchemy import and_, select
+
+# Typing Imports
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Exception Imports
+from sqlalchemy_filters.exceptions import InvalidPage
+from ...utils.exceptions import ItensNotFound
+from ...utils.exceptions import InvalidPageItemsNumber
+
+# User Model
+from app.modules.users.models import User
+
+# Product Model and Schemas
+from .models import Product
+from .schemas import ProductCreate
+from .schemas import ProductUpdate
+from .schemas import ProductResponse
+from .schemas import make_product_record
+from .services import PRODUCT_RECORD_COLUMNS
+
+# Name Search
+from ...db.search import name_search
+from ...db.search import name_search_rank
+
+# Pagination Metadata Schema
+from ...utils.pagination import make_pagination_metadata
+from ...utils.pagination import apply_pagination_async
+
+# ETag Helper
+from ...utils.helpers import make_etag
+from ...db.versions import fetch_versions_async
+from ...db.versions import version_column
+
+# Query Cache
+from ...utils.query_cache import query_cache
+
+
+class AsyncProductService:
+    def _make_products_select(self, name: str = ''):
+        return select(*PRODUCT_RECORD_COLUMNS).filter(
+            Product.is_deleted == False,
+            name_search(Product.name, name)
+        ).order_by(*name_search_rank(Product.name, name), Product.id)
+
+    async def _get_product(self, db: AsyncSession, id: int) -> Product:
+        result = await db.execute(select(Product).filter(and_(
+            Product.id == id,
+            Product.is_deleted == False
+        )))
+        return result.scalars().first()
+
+    async def fetch_all(self, db: AsyncSession, name: str = '', etag: Optional[str] = None) -> dict:
+        """
+        Retrieve all products records.
+
+        Args:
+            db (AsyncSession): The async database session.
+            name (str): Product name to filter.
+            etag (str): The list ETag of the response, read when missing.
+
+        Raises:
+            ItensNotFound: If no item was found.
+
+        Returns:
+            dict: The `ProductsResponse` body, with products records.
+        """
+        if etag is None:
+            etag = await self.fetch_list_etag(db)
+        key = query_cache.key(Product.__tablename__, etag, "all", name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        result = await db.execute(self._make_products_select(name))
+        products = [make_product_record(product) for product in result.all()]
+
+        if len(products) == 0:
+            raise ItensNotFound("No products found")
+
+        response = {"records": products}
+        query_cache.set(key, response)
+        return response
+
+    async def fetch_all_with_pagination(self, db: AsyncSession, page: int, per_page: int = 20, name: str = '',
+        etag: Optional[str] = None) -> dict:
+        """
+        Retrieve all products records listed by page argument and pagination metadata.
+
+        Args:
+            db (AsyncSession): The async database session.
+            page (int): Page to fetch.
+            per_page (int): Amount of products per page.
+            name (str): Product name to filter.
+            etag (str): The list ETag of the response, read when missing.
+
+        Raises:
+            InvalidPage: If the page informed is invalid.
+            ItensNotFound: If no item was found.
+            InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
+
+        Returns:
+            dict: The `ProductsResponse` body, with products records and pagination metadata.
+        """
+        if page <= 0:
+            raise InvalidPage(f"Page number should be positive and greater than zero: {page}")
+        if per_page <= 0:
+            raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
+
+        if etag is None:
+            etag = await self.fetch_list_etag(db)
+        key = query_cache.key(Product.__tablename__, etag, "page", page, per_page, name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        query = self._make_products_select(name)
+
+        query, pagination = await apply_pagination_async(db, query, page_number=page, page_size=per_page)
+        result = await db.execute(query)
+        products = [make_product_record(product) for product in result.all()]
+
+        if page > pagination.num_pages and pagination.num_pages > 0:
+            raise InvalidPage(f"Page number invalid, the total of pages is {pagination.num_pages}: {page}")
+        if len(products) == 0:
+            raise ItensNotFound("No products found")
+
+        pagination_metadata = make_pagination_metadata(
+            current_page=page,
+            total_pages=pagination.num_pages,
+            per_page=per_page,
+            total_items=pagination.total_results,
+            url_args={'name': name}
+        )
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": products
+        }
+        query_cache.set(key, response)
+        return response
+
+    async def fetch(self, db: AsyncSession, id: int) -> ProductResponse:
+        """
+        Retrieve one product.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The product ID.
+
+        Returns:
+            ProductResponse: The product response model.
+        """
+        return await self._get_product(db, id)
+
+    async def fetch_etag(self, db: AsyncSession, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of one product, without loading it.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The product ID.
+
+        Returns:
+            str: The product ETag, or None if the product was not found.
+        """
+        result = await db.execute(select(Product.id, version_column(Product.__tablename__)).where(and_(
+            Product.id == id,
+            Product.is_deleted == False
+        )))
+        version = result.first()
+        if not version:
+            return None
+
+        return make_etag(Product.__tablename__, *version)
+
+    async def fetch_list_etag(self, db: AsyncSession) -> str:
+        """
+        Retrieve the ETag shared by the products list endpoints.
+
+        Args:
+            db (AsyncSession): The async database session.
+
+        Returns:
+            str: The products list ETag.
+        """
+        return make_etag(Product.__tablename__, *await fetch_versions_async(db, Product.__tablename__))
+
+    async def create(self, db: AsyncSession, product: ProductCreate, user: User) -> ProductResponse:
+        """
+        Creates a product.
+
+        Args:
+            db (AsyncSession): The async database session.
+            product (ProductCreate): The product create model.
+
+        Returns:
+            ProductResponse: The product response model.
+        """
+        product_create = Product(**product.dict())
+        product_create.created_by = user.id
+        product = await product_create.insert_async(db)
+
+        return ProductResponse.from_orm(product)
+
+    async def update(self, db: AsyncSession, id: int, product: ProductUpdate) -> ProductResponse:
+        """
+        Edits a product by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The product ID.
+            product (ProductUpdate): The product update model.
+
+        Returns:
+            ProductResponse: The Product Response model.
+        """
+        original_product = await self._get_product(db, id)
+        if not original_product:
+            return None
+
+        await original_product.update_async(db, **product.dict(exclude_unset=True))
+        return ProductResponse.from_orm(original_product)
+
+    async def delete(self, db: AsyncSession, id: int) -> ProductResponse:
+        """
+        Deletes a product by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The product ID.
+
+        Returns:
+            ProductResponse: The Product Response model.
+        """
+        deleted_product = await self._get_product(db, id)
+        if not deleted_product:
+            return None
+
+        await deleted_product.update_async(db, is_deleted=True)
+        return ProductResponse.from_orm(deleted_product)
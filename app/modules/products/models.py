@@ -1,19 +1,23 @@
 import sqlalchemy as db
 
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from ...db.engine import Base
 from ...db.base import BaseMixin
+from ...db.base import active_rows_index
+from ...db.search import add_name_search
+from ...db.versions import add_table_version
 
 
 class ProductImage(BaseMixin, Base):
     __tablename__ = 'support_products_image'
     
     product_id = db.Column(db.Integer, db.ForeignKey('base_products.id'), primary_key=True)
-    image_data = db.Column(db.TEXT, default="R0lGODdhAQABAPAAAP8AAAAAACwAAAAAAQABAAACAkQBADs=")
+    # Base64 image, only loaded when the attribute is accessed
+    image_data = deferred(db.Column(db.TEXT, default="R0lGODdhAQABAPAAAP8AAAAAACwAAAAAAQABAAACAkQBADs="))
 
     # Relationships
-    product = relationship("Product", lazy="joined", back_populates="image")
+    product = relationship("Product", lazy="select", back_populates="image")
 
 
 class Product(BaseMixin, Base):
@@ -32,5 +36,18 @@ class Product(BaseMixin, Base):
     created_by = db.Column(db.Integer, db.ForeignKey('base_users.id'), nullable=False)
 
     # Relationships
-    image = relationship("ProductImage", lazy="joined", back_populates="product", uselist=False)
-    user = relationship("User", lazy="select", back_populates="products_created", uselist=False)
\ No newline at end of file
+    image = relationship("ProductImage", lazy="select", back_populates="product", uselist=False)
+    user = relationship("User", lazy="select", back_populates="products_created", uselist=False)
+
+    # Define Indexes
+    __table_args__ = (
+        active_rows_index('ix_base_products_active_id', is_deleted, id),
+        db.Index('ix_base_products_created_by', created_by),
+    )
+
+
+# Indexed name search
+add_name_search(Product.name)
+
+# Version of the products lists ETag
+add_table_version(Product)
\ No newline at end of file
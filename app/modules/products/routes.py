@@ -1,12 +1,21 @@
 # Standard Imports
+from datetime import date
 from fastapi import APIRouter
 from fastapi import HTTPException
 from fastapi import Depends
 from fastapi import Path, Query
+from fastapi import Header, Response
 
 # Database Import
 from app.db.engine import get_db
 
+# ETag Imports
+from ...utils.helpers import etag_matches
+from ...utils.helpers import not_modified
+
+# Serialization Imports
+from ...utils.serialization import make_json_response
+
 # Typing Imports
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -15,6 +24,7 @@ from typing import Optional
 from sqlalchemy_filters.exceptions import InvalidPage
 from ...utils.exceptions import ItensNotFound
 from ...utils.exceptions import InvalidPageItemsNumber
+from ...utils.exceptions import InvalidCursor
 
 # Authentication Imports
 from ..users.models import User
@@ -26,16 +36,26 @@ from .schemas import ProductCreate
 from .schemas import ProductUpdate
 from .schemas import ProductResponse
 from .schemas import ProductsResponse
+from .schemas import ProductsCursorResponse
+
+# Inventory Snapshot Schemas
+from ..inventory_snapshots.services import InventorySnapshotService
+from ..inventory_snapshots.schemas import ProductInventoryResponse
 
 
 
 route = APIRouter()
 product_service = ProductService()
+inventory_snapshot_service = InventorySnapshotService()
+
+# Images only change through their own records, so browsers may keep them for a while
+IMAGE_CACHE_CONTROL = "private, max-age=3600"
 
 
 
 @route.get("/products/", response_model_exclude_unset=True, response_model=ProductsResponse)
-def get_all_products(db: Session = Depends(get_db), auth_user: User=Depends(manager), name: Optional[str] = ''):
+def get_all_products(response: Response, if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager), name: Optional[str] = ''):
     """
     ## Retrieve all products.
 
@@ -46,16 +66,22 @@ def get_all_products(db: Session = Depends(get_db), auth_user: User=Depends(mana
     ### Returns:  
       >  ProductsResponse: A dict with products records.
     """
+    etag = product_service.fetch_list_etag(db)
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     try:
-        products = product_service.fetch_all(db, name)
-        return products
+        products = product_service.fetch_all(db, name, etag)
+        return make_json_response(products, response)
     except ItensNotFound:
 	      raise HTTPException(status_code=404, detail="Nenhum produto foi encontrado.")
 
 
 @route.get("/products/page/{page}", response_model=ProductsResponse)
-def get_all_products_in_current_page(page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
-    name: Optional[str] = '', db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+def get_all_products_in_current_page(response: Response, page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
+    name: Optional[str] = '', if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve all products in current page.
 
@@ -68,9 +94,14 @@ def get_all_products_in_current_page(page: int = Path(..., gt=0), per_page: int
     ### Returns:  
       >  ProductsResponse: A dict with products records and pagination metadata.
     """
+    etag = product_service.fetch_list_etag(db)
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     try:
-        products = product_service.fetch_all_with_pagination(db, page, per_page, name)
-        return products
+        products = product_service.fetch_all_with_pagination(db, page, per_page, name, etag)
+        return make_json_response(products, response)
     except InvalidPage:
 	      raise HTTPException(status_code=400, detail="Não foi possivel recuperar os itens na página informada.")
     except InvalidPageItemsNumber:
@@ -79,8 +110,40 @@ def get_all_products_in_current_page(page: int = Path(..., gt=0), per_page: int
 	      raise HTTPException(status_code=404, detail="Nenhum produto foi encontrado.")
 
 
+@route.get("/products/cursor", response_model=ProductsCursorResponse)
+def get_all_products_by_cursor(response: Response, limit: int = Query(default=20, gt=0), after: Optional[str] = None, before: Optional[str] = None,
+    name: Optional[str] = '', if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve products next to a cursor (keyset pagination).
+
+    ### Args:  
+      >  limit (int): Amount of products per page.  
+      >  after (str): Cursor to fetch the next page (`next_cursor`).  
+      >  before (str): Cursor to fetch the previous page (`previous_cursor`).  
+      >  name (str): Product name to filter.
+
+    ### Returns:  
+      >  ProductsCursorResponse: A dict with products records and cursor pagination metadata.
+    """
+    response_304 = not_modified(response, if_none_match, product_service.fetch_list_etag(db))
+    if response_304:
+        return response_304
+
+    try:
+        products = product_service.fetch_all_with_cursor(db, limit, after, before, name)
+        return make_json_response(products, response)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Cursor de paginação inválido.")
+    except InvalidPageItemsNumber:
+        raise HTTPException(status_code=400, detail="Quantidade de itens por pagina precisa ser maior que zero.")
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhum produto foi encontrado.")
+
+
 @route.get("/products/{id}", response_model=ProductResponse)
-def get_one_product(id: int, db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+def get_one_product(id: int, response: Response, if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve one product.
 
@@ -93,12 +156,73 @@ def get_one_product(id: int, db: Session = Depends(get_db), auth_user: User=Depe
     ### Returns:  
       >  ProductResponse: The product response model.
     """
+    etag = product_service.fetch_etag(db, id)
+    if not etag:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     product = product_service.fetch(db, id)
     if not product:
         raise HTTPException(status_code=404, detail="Produto não encontrado.")
     return product
 
 
+@route.get("/products/{id}/image", response_class=Response, responses={200: {"content": {"image/*": {}}}, 304: {}})
+def get_product_image(id: int, if_none_match: Optional[str] = Header(None), db: Session = Depends(get_db),
+    auth_user: User=Depends(manager)):
+    """
+    ## Retrieve the binary image of one product.
+
+    ### Args:  
+      >  id (int): The product ID.
+
+    ### Raises:  
+      >  HTTPException: Raises 404 if product or image was not found.
+
+    ### Returns:  
+      >  Response: The image bytes, or 304 if the `If-None-Match` ETag is still valid.
+    """
+    etag = product_service.fetch_image_etag(db, id)
+    if not etag:
+        raise HTTPException(status_code=404, detail="Imagem do produto não encontrada.")
+
+    headers = {"ETag": etag, "Cache-Control": IMAGE_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    # Deleted after the ETag was read, or not readable
+    image = product_service.fetch_image(db, id)
+    if not image:
+        raise HTTPException(status_code=404, detail="Imagem do produto não encontrada.")
+
+    content, media_type = image
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
+@route.get("/products/{id}/inventory", response_model=ProductInventoryResponse)
+def get_product_inventory(id: int, at: Optional[date] = None, db: Session = Depends(get_db),
+    auth_user: User=Depends(manager)):
+    """
+    ## Retrieve the stock of one product at the end of a date.
+
+    ### Args:  
+      >  id (int): The product ID.  
+      >  at (date): The date of the stock, today by default. (YYYY-MM-DD)
+
+    ### Raises:  
+      >  HTTPException: Raises 404 if product was not found.
+
+    ### Returns:  
+      >  ProductInventoryResponse: The product stock at the date.
+    """
+    inventory = inventory_snapshot_service.fetch_inventory_at(db, id, at or date.today())
+    if not inventory:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+    return inventory
+
+
 @route.post("/products/", response_model=ProductResponse)
 def create_product(product: ProductCreate, db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
@@ -1,6 +1,7 @@
 from typing import List, Optional
-from ...utils.helpers import BaseSchema, MetaDatetimeSchema
+from ...utils.helpers import BaseSchema, MetaDatetimeSchema, make_metadatetime
 from ...utils.pagination import PaginationMetadataSchema
+from ...utils.pagination import CursorPaginationMetadataSchema
 
 
 class ProductCreate(BaseSchema):
@@ -58,4 +59,22 @@ class ProductResponse(BaseSchema):
 
 class ProductsResponse(BaseSchema):
     pagination_metadata: Optional[PaginationMetadataSchema]
-    records: List[ProductResponse]
\ No newline at end of file
+    records: List[ProductResponse]
+
+class ProductsCursorResponse(BaseSchema):
+    pagination_metadata: CursorPaginationMetadataSchema
+    records: List[ProductResponse]
+
+
+def make_product_record(product) -> dict:
+    """
+    Make the `ProductResponse` dict of a product model or row, without validating it.
+    """
+    return {
+        "id": product.id,
+        "name": product.name,
+        "size": product.size,
+        "inventory": product.inventory,
+        "weight": product.weight,
+        "metadatetime": make_metadatetime(product)
+    }
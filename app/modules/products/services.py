@@ -1,10 +1,11 @@
 # Standard Import
-from sqlalchemy import and_, func
-from pydantic import parse_obj_as
+from base64 import b64decode
+from binascii import Error as Base64Error
+from sqlalchemy import and_, func, select
 from sqlalchemy_filters import apply_pagination
 
 # Typing Imports
-from typing import List
+from typing import Optional, Tuple
 from sqlalchemy.orm import Session
 
 # Exception Imports
@@ -17,45 +18,78 @@ from app.modules.users.models import User
 
 # Product Model and Schemas
 from .models import Product
+from .models import ProductImage
 from .schemas import ProductCreate
 from .schemas import ProductUpdate
 from .schemas import ProductResponse
-from .schemas import ProductsResponse
+from .schemas import make_product_record
+
+# Name Search
+from ...db.search import name_search
+from ...db.search import name_search_rank
 
 # Pagination Metadata Schema
 from ...utils.pagination import make_pagination_metadata
+from ...utils.helpers import make_etag
+from ...db.versions import fetch_versions
+from ...db.versions import version_column
+from ...utils.pagination import apply_cursor_pagination
+from ...utils.pagination import make_cursor_pagination_metadata
+
+# Query Cache
+from ...utils.query_cache import query_cache
+
+
+# Columns of the `ProductResponse` records, the lists load them as plain rows
+PRODUCT_RECORD_COLUMNS = (
+    Product.id,
+    Product.name,
+    Product.size,
+    Product.inventory,
+    Product.weight,
+    Product.created_on,
+    Product.updated_on
+)
 
 
 class ProductService:
-    def fetch_all(self, db: Session, name: str = '') -> ProductsResponse:
+    def fetch_all(self, db: Session, name: str = '', etag: Optional[str] = None) -> dict:
         """
         Retrieve all products records.
 
         Args:
             db (Session): The database session.
             name (str): Product name to filter.
+            etag (str): The list ETag of the response, read when missing.
 
         Raises:
             ItensNotFound: If no item was found.
 
         Returns:
-            ProductsResponse: A dict with products records.
+            dict: The `ProductsResponse` body, with products records.
         """
-        products = db.query(Product).filter(
+        if etag is None:
+            etag = self.fetch_list_etag(db)
+        key = query_cache.key(Product.__tablename__, etag, "all", name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        products = db.query(*PRODUCT_RECORD_COLUMNS).filter(
             Product.is_deleted == False,
-            func.lower(Product.name).contains(name.lower(), autoescape=True)
-        ).order_by(Product.id).all()
-        products = parse_obj_as(List[ProductResponse], products)
+            name_search(Product.name, name)
+        ).order_by(*name_search_rank(Product.name, name), Product.id).all()
+        products = [make_product_record(product) for product in products]
 
         if len(products) == 0:
             raise ItensNotFound("No products found")
 
-        response = ProductsResponse(
-            records = products
-        )
+        response = {"records": products}
+        query_cache.set(key, response)
         return response
 
-    def fetch_all_with_pagination(self, db: Session, page: int, per_page: int = 20, name: str = '') -> ProductsResponse:
+    def fetch_all_with_pagination(self, db: Session, page: int, per_page: int = 20, name: str = '',
+        etag: Optional[str] = None) -> dict:
         """
         Retrieve all products records listed by page argument and pagination metadata.
 
@@ -64,6 +98,7 @@ class ProductService:
             page (int): Page to fetch.
             per_page (int): Amount of products per page.
             name (str): Product name to filter.
+            etag (str): The list ETag of the response, read when missing.
 
         Raises:
             InvalidPage: If the page informed is invalid.
@@ -71,20 +106,27 @@ class ProductService:
             InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
 
         Returns:
-            ProductsResponse: A dict with products records and pagination metadata.
+            dict: The `ProductsResponse` body, with products records and pagination metadata.
         """
         if page <= 0:
             raise InvalidPage(f"Page number should be positive and greater than zero: {page}")
         if per_page <= 0:
             raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
 
-        query = db.query(Product).filter(
+        if etag is None:
+            etag = self.fetch_list_etag(db)
+        key = query_cache.key(Product.__tablename__, etag, "page", page, per_page, name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        query = db.query(*PRODUCT_RECORD_COLUMNS).filter(
             Product.is_deleted == False,
-            func.lower(Product.name).contains(name.lower(), autoescape=True)
-        ).order_by(Product.id)
+            name_search(Product.name, name)
+        ).order_by(*name_search_rank(Product.name, name), Product.id)
 
         query, pagination = apply_pagination(query, page_number=page, page_size=per_page)
-        products = parse_obj_as(List[ProductResponse], query.all())
+        products = [make_product_record(product) for product in query.all()]
 
         if page > pagination.num_pages and pagination.num_pages > 0:
             raise InvalidPage(f"Page number invalid, the total of pages is {pagination.num_pages}: {page}")
@@ -98,10 +140,59 @@ class ProductService:
             total_items=pagination.total_results,
             url_args={'name': name}
         )
-        response = ProductsResponse(
-            pagination_metadata = pagination_metadata,
-            records = products
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": products
+        }
+        query_cache.set(key, response)
+        return response
+
+    def fetch_all_with_cursor(self, db: Session, limit: int = 20, after: str = None,
+        before: str = None, name: str = '') -> dict:
+        """
+        Retrieve the products records next to a cursor, without counting or offsetting rows.
+
+        Args:
+            db (Session): The database session.
+            limit (int): Amount of products per page.
+            after (str): Cursor of the last product of the previous page.
+            before (str): Cursor of the first product of the next page.
+            name (str): Product name to filter.
+
+        Raises:
+            InvalidCursor: If the cursor informed is invalid.
+            ItensNotFound: If no item was found.
+            InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
+
+        Returns:
+            dict: The `ProductsCursorResponse` body, with products records and cursor pagination metadata.
+        """
+        if limit <= 0:
+            raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
+
+        query = db.query(*PRODUCT_RECORD_COLUMNS).filter(
+            Product.is_deleted == False,
+            name_search(Product.name, name)
+        )
+
+        products, has_previous, has_next = apply_cursor_pagination(query, Product.id, limit, after, before)
+        if len(products) == 0:
+            raise ItensNotFound("No products found")
+
+        pagination_metadata = make_cursor_pagination_metadata(
+            first_id=products[0].id,
+            last_id=products[-1].id,
+            limit=limit,
+            has_previous=has_previous,
+            has_next=has_next,
+            url_args={'name': name},
+            after=after,
+            before=before
         )
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": [make_product_record(product) for product in products]
+        }
         return response
 
     def fetch(self, db: Session, id: int) -> ProductResponse:
@@ -124,6 +215,106 @@ class ProductService:
         )).first()
         return single_product
 
+    def fetch_etag(self, db: Session, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of one product, without loading it.
+
+        Args:
+            db (Session): The database session.
+            id (int): The product ID.
+
+        Returns:
+            str: The product ETag, or None if the product was not found.
+        """
+        version = db.execute(select(Product.id, version_column(Product.__tablename__)).where(and_(
+            Product.id == id,
+            Product.is_deleted == False
+        ))).first()
+        if not version:
+            return None
+
+        return make_etag(Product.__tablename__, *version)
+
+    def fetch_list_etag(self, db: Session) -> str:
+        """
+        Retrieve the ETag shared by the products list endpoints, from the
+        products table version raised by every committed write.
+
+        Args:
+            db (Session): The database session.
+
+        Returns:
+            str: The products list ETag.
+        """
+        return make_etag(Product.__tablename__, *fetch_versions(db, Product.__tablename__))
+
+    def fetch_image_etag(self, db: Session, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of a product image, without loading the image itself.
+
+        Args:
+            db (Session): The database session.
+            id (int): The product ID.
+
+        Returns:
+            str: The image ETag, or None if the product has no image.
+        """
+        image_version = db.query(
+            ProductImage.product_id, ProductImage.created_on, ProductImage.updated_on
+        ).join(ProductImage.product).filter(and_(
+            Product.id == id,
+            Product.is_deleted == False,
+            ProductImage.image_data != None
+        )).first()
+        if not image_version:
+            return None
+
+        return make_etag(*image_version)
+
+    def fetch_image(self, db: Session, id: int) -> Optional[Tuple[bytes, str]]:
+        """
+        Retrieve the binary image of a product.
+
+        Args:
+            db (Session): The database session.
+            id (int): The product ID.
+
+        Returns:
+            Tuple[bytes, str]: The image content and its media type, or None if the
+            product has no image or it is not valid base64.
+        """
+        image_data = db.query(ProductImage.image_data).join(ProductImage.product).filter(and_(
+            Product.id == id,
+            Product.is_deleted == False
+        )).scalar()
+        if image_data is None:
+            return None
+
+        # Accepts plain base64 or data urls ("data:image/png;base64,...")
+        media_type = None
+        if image_data.startswith("data:"):
+            header, _, image_data = image_data.partition(",")
+            media_type = header[len("data:"):].split(";")[0] or None
+
+        try:
+            content = b64decode(image_data, validate=True)
+        except Base64Error:
+            return None
+        if not content:
+            return None
+        return content, media_type or self._guess_image_media_type(content)
+
+    def _guess_image_media_type(self, content: bytes) -> str:
+        if content.startswith(b"\x89PNG"):
+            return "image/png"
+        elif content.startswith(b"\xff\xd8"):
+            return "image/jpeg"
+        elif content.startswith(b"GIF8"):
+            return "image/gif"
+        elif content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+            return "image/webp"
+        return "application/octet-stream"
+
     def create(self, db: Session, product: ProductCreate, user: User) -> ProductResponse:
         """
         Creates a product.
@@ -0,0 +1,245 @@
+# Standard Import
+from sqlalchemy import and_, select
+
+# Typing Imports
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Exception Imports
+from sqlalchemy_filters.exceptions import InvalidPage
+from ...utils.exceptions import ItensNotFound
+from ...utils.exceptions import InvalidPageItemsNumber
+
+# User Model
+from app.modules.users.models import User
+
+# Provider Model and Schemas
+from .models import Provider
+from .schemas import ProviderCreate
+from .schemas import ProviderUpdate
+from .schemas import ProviderResponse
+from .schemas import make_provider_record
+from .services import PROVIDER_RECORD_COLUMNS
+
+# Name Search
+from ...db.search import name_search
+from ...db.search import name_search_rank
+
+# Pagination Metadata Schema
+from ...utils.pagination import make_pagination_metadata
+from ...utils.pagination import apply_pagination_async
+
+# ETag Helper
+from ...utils.helpers import make_etag
+from ...db.versions import fetch_versions_async
+from ...db.versions import version_column
+
+# Query Cache
+from ...utils.query_cache import query_cache
+
+
+class AsyncProviderService:
+    def _make_providers_select(self, name: str = ''):
+        return select(*PROVIDER_RECORD_COLUMNS).filter(
+            Provider.is_deleted == False,
+            name_search(Provider.name, name)
+        ).order_by(*name_search_rank(Provider.name, name), Provider.id)
+
+    async def _get_provider(self, db: AsyncSession, id: int) -> Provider:
+        result = await db.execute(select(Provider).filter(and_(
+            Provider.id == id,
+            Provider.is_deleted == False
+        )))
+        return result.scalars().first()
+
+    async def fetch_all(self, db: AsyncSession, name: str = '', etag: Optional[str] = None) -> dict:
+        """
+        Retrieve all providers records.
+
+        Args:
+            db (AsyncSession): The async database session.
+            name (str): Provider name to filter.
+            etag (str): The list ETag of the response, read when missing.
+
+        Raises:
+            ItensNotFound: If no item was found.
+
+        Returns:
+            dict: The `ProvidersResponse` body, with providers records.
+        """
+        if etag is None:
+            etag = await self.fetch_list_etag(db)
+        key = query_cache.key(Provider.__tablename__, etag, "all", name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        result = await db.execute(self._make_providers_select(name))
+        providers = [make_provider_record(provider) for provider in result.all()]
+
+        if len(providers) == 0:
+            raise ItensNotFound("No providers found")
+
+        response = {"records": providers}
+        query_cache.set(key, response)
+        return response
+
+    async def fetch_all_with_pagination(self, db: AsyncSession, page: int, per_page: int = 20, name: str = '',
+        etag: Optional[str] = None) -> dict:
+        """
+        Retrieve all providers records listed by page argument and pagination metadata.
+
+        Args:
+            db (AsyncSession): The async database session.
+            page (int): Page to fetch.
+            per_page (int): Amount of providers per page.
+            name (str): Provider name to filter.
+            etag (str): The list ETag of the response, read when missing.
+
+        Raises:
+            InvalidPage: If the page informed is invalid.
+            ItensNotFound: If no item was found.
+            InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
+
+        Returns:
+            dict: The `ProvidersResponse` body, with providers records and pagination metadata.
+        """
+        if page <= 0:
+            raise InvalidPage(f"Page number should be positive and greater than zero: {page}")
+        if per_page <= 0:
+            raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
+
+        if etag is None:
+            etag = await self.fetch_list_etag(db)
+        key = query_cache.key(Provider.__tablename__, etag, "page", page, per_page, name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        query = self._make_providers_select(name)
+
+        query, pagination = await apply_pagination_async(db, query, page_number=page, page_size=per_page)
+        result = await db.execute(query)
+        providers = [make_provider_record(provider) for provider in result.all()]
+
+        if page > pagination.num_pages and pagination.num_pages > 0:
+            raise InvalidPage(f"Page number invalid, the total of pages is {pagination.num_pages}: {page}")
+        if len(providers) == 0:
+            raise ItensNotFound("No providers found")
+
+        pagination_metadata = make_pagination_metadata(
+            current_page=page,
+            total_pages=pagination.num_pages,
+            per_page=per_page,
+            total_items=pagination.total_results,
+            url_args={'name': name}
+        )
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": providers
+        }
+        query_cache.set(key, response)
+        return response
+
+    async def fetch(self, db: AsyncSession, id: int) -> ProviderResponse:
+        """
+        Retrieve one provider.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The provider ID.
+
+        Returns:
+            ProviderResponse: The provider response model.
+        """
+        return await self._get_provider(db, id)
+
+    async def fetch_etag(self, db: AsyncSession, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of one provider, without loading it.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The provider ID.
+
+        Returns:
+            str: The provider ETag, or None if the provider was not found.
+        """
+        result = await db.execute(select(Provider.id, version_column(Provider.__tablename__)).where(and_(
+            Provider.id == id,
+            Provider.is_deleted == False
+        )))
+        version = result.first()
+        if not version:
+            return None
+
+        return make_etag(Provider.__tablename__, *version)
+
+    async def fetch_list_etag(self, db: AsyncSession) -> str:
+        """
+        Retrieve the ETag shared by the providers list endpoints.
+
+        Args:
+            db (AsyncSession): The async database session.
+
+        Returns:
+            str: The providers list ETag.
+        """
+        return make_etag(Provider.__tablename__, *await fetch_versions_async(db, Provider.__tablename__))
+
+    async def create(self, db: AsyncSession, user: User, provider: ProviderCreate) -> ProviderResponse:
+        """
+        Creates a provider.
+
+        Args:
+            db (AsyncSession): The async database session.
+            user (User): The user model.
+            provider (ProviderCreate): The provider create model.
+
+        Returns:
+            ProviderResponse: The provider response model.
+        """
+        provider_create = Provider(**provider.dict())
+        provider_create.created_by = user.id
+        provider = await provider_create.insert_async(db)
+
+        return ProviderResponse.from_orm(provider)
+
+    async def update(self, db: AsyncSession, id: int, provider: ProviderUpdate) -> ProviderResponse:
+        """
+        Edits a provider by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The provider ID.
+            provider (ProviderUpdate): The provider update model.
+
+        Returns:
+            ProviderResponse: The Provider Response model.
+        """
+        original_provider = await self._get_provider(db, id)
+        if not original_provider:
+            return None
+
+        await original_provider.update_async(db, **provider.dict(exclude_unset=True))
+        updated_provider = ProviderResponse.from_orm(original_provider)
+        return updated_provider
+
+    async def delete(self, db: AsyncSession, id: int) -> ProviderResponse:
+        """
+        Deletes a provider by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The provider ID.
+
+        Returns:
+            ProviderResponse: The Provider Response model.
+        """
+        original_provider = await self._get_provider(db, id)
+        if not original_provider:
+            return None
+
+        await original_provider.update_async(db, is_deleted=True)
+        disable_provider = ProviderResponse.from_orm(original_provider)
+        return disable_provider
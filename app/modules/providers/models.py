@@ -4,6 +4,9 @@ from sqlalchemy.orm import relationship
 
 from ...db.engine import Base
 from ...db.base import BaseMixin
+from ...db.base import active_rows_index
+from ...db.search import add_name_search
+from ...db.versions import add_table_version
 
 
 class Provider(BaseMixin, Base):
@@ -23,4 +26,17 @@ class Provider(BaseMixin, Base):
     created_by = db.Column(db.Integer, db.ForeignKey('base_users.id'), nullable=False)
 
     # Relationships
-    user = relationship("User", lazy="select", back_populates="providers_created", uselist=False)
\ No newline at end of file
+    user = relationship("User", lazy="select", back_populates="providers_created", uselist=False)
+
+    # Define Indexes
+    __table_args__ = (
+        active_rows_index('ix_base_providers_active_id', is_deleted, id),
+        db.Index('ix_base_providers_created_by', created_by),
+    )
+
+
+# Indexed name search
+add_name_search(Provider.name)
+
+# Version of the providers lists ETag
+add_table_version(Provider)
\ No newline at end of file
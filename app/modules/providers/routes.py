@@ -3,10 +3,17 @@ from fastapi import APIRouter
 from fastapi import HTTPException
 from fastapi import Depends
 from fastapi import Path, Query
+from fastapi import Header, Response
 
 # Database Import
 from app.db.engine import get_db
 
+# ETag Imports
+from ...utils.helpers import not_modified
+
+# Serialization Imports
+from ...utils.serialization import make_json_response
+
 # Typing Imports
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -16,6 +23,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy_filters.exceptions import InvalidPage
 from ...utils.exceptions import ItensNotFound
 from ...utils.exceptions import InvalidPageItemsNumber
+from ...utils.exceptions import InvalidCursor
 
 # Authentication Imports
 from ..users.models import User
@@ -27,6 +35,7 @@ from .schemas import ProviderCreate
 from .schemas import ProviderUpdate
 from .schemas import ProviderResponse
 from .schemas import ProvidersResponse
+from .schemas import ProvidersCursorResponse
 
 
 
@@ -36,7 +45,8 @@ provider_service = ProviderService()
 
 
 @route.get("/providers/", response_model_exclude_unset=True, response_model=ProvidersResponse)
-def get_all_providers(db: Session = Depends(get_db), auth_user: User=Depends(manager), name: Optional[str] = ''):
+def get_all_providers(response: Response, if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager), name: Optional[str] = ''):
     """
     ## Retrieve all providers.
 
@@ -47,16 +57,22 @@ def get_all_providers(db: Session = Depends(get_db), auth_user: User=Depends(man
     ### Returns:  
       >  ProvidersResponse: A dict with providers records.
     """
+    etag = provider_service.fetch_list_etag(db)
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     try:
-        providers = provider_service.fetch_all(db, name)
-        return providers
+        providers = provider_service.fetch_all(db, name, etag)
+        return make_json_response(providers, response)
     except ItensNotFound:
 	      raise HTTPException(status_code=404, detail="Nenhum fornecedor foi encontrado.")
 
 
 @route.get("/providers/page/{page}", response_model=ProvidersResponse)
-def get_all_providers_in_current_page(page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
-    name: Optional[str] = '', db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+def get_all_providers_in_current_page(response: Response, page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
+    name: Optional[str] = '', if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve all providers in current page.
 
@@ -68,9 +84,14 @@ def get_all_providers_in_current_page(page: int = Path(..., gt=0), per_page: int
     ### Returns:  
       >  ProvidersResponse: A dict with providers records and pagination metadata.
     """
+    etag = provider_service.fetch_list_etag(db)
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     try:
-        providers = provider_service.fetch_all_with_pagination(db, page, per_page, name)
-        return providers
+        providers = provider_service.fetch_all_with_pagination(db, page, per_page, name, etag)
+        return make_json_response(providers, response)
     except InvalidPage:
 	      raise HTTPException(status_code=400, detail="Não foi possivel recuperar os itens na página informada.")
     except InvalidPageItemsNumber:
@@ -79,8 +100,40 @@ def get_all_providers_in_current_page(page: int = Path(..., gt=0), per_page: int
 	      raise HTTPException(status_code=404, detail="Nenhum fornecedor foi encontrado.")
 
 
+@route.get("/providers/cursor", response_model=ProvidersCursorResponse)
+def get_all_providers_by_cursor(response: Response, limit: int = Query(default=20, gt=0), after: Optional[str] = None, before: Optional[str] = None,
+    name: Optional[str] = '', if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve providers next to a cursor (keyset pagination).
+
+    ### Args:  
+      >  limit (int): Amount of providers per page.  
+      >  after (str): Cursor to fetch the next page (`next_cursor`).  
+      >  before (str): Cursor to fetch the previous page (`previous_cursor`).  
+      >  name (str): Provider name to filter.
+
+    ### Returns:  
+      >  ProvidersCursorResponse: A dict with providers records and cursor pagination metadata.
+    """
+    response_304 = not_modified(response, if_none_match, provider_service.fetch_list_etag(db))
+    if response_304:
+        return response_304
+
+    try:
+        providers = provider_service.fetch_all_with_cursor(db, limit, after, before, name)
+        return make_json_response(providers, response)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Cursor de paginação inválido.")
+    except InvalidPageItemsNumber:
+        raise HTTPException(status_code=400, detail="Quantidade de itens por pagina precisa ser maior que zero.")
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhum fornecedor foi encontrado.")
+
+
 @route.get("/providers/{id}", response_model=ProviderResponse)
-def get_one_provider(id: int, db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+def get_one_provider(id: int, response: Response, if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve one provider.
 
@@ -93,6 +146,13 @@ def get_one_provider(id: int, db: Session = Depends(get_db), auth_user: User=Dep
     ### Returns:  
       >  ProviderResponse: The provider response model.
     """
+    etag = provider_service.fetch_etag(db, id)
+    if not etag:
+        raise HTTPException(status_code=404, detail=f"Fornecedor de id {id} não foi encontrado.")
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     provider = provider_service.fetch(db, id)
     if not provider:
         raise HTTPException(status_code=404, detail=f"Fornecedor de id {id} não foi encontrado.")
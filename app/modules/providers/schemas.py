@@ -4,8 +4,9 @@ from validate_docbr import CNPJ
 from typing import List, Optional
 from pydantic import EmailStr, validator
 
-from ...utils.helpers import BaseSchema, MetaDatetimeSchema
+from ...utils.helpers import BaseSchema, MetaDatetimeSchema, make_metadatetime
 from ...utils.pagination import PaginationMetadataSchema
+from ...utils.pagination import CursorPaginationMetadataSchema
 
 
 def _cnpj_validator(value) -> str:
@@ -87,4 +88,23 @@ class ProviderResponse(BaseSchema):
 
 class ProvidersResponse(BaseSchema):
     pagination_metadata: Optional[PaginationMetadataSchema]
-    records: List[ProviderResponse]
\ No newline at end of file
+    records: List[ProviderResponse]
+
+class ProvidersCursorResponse(BaseSchema):
+    pagination_metadata: CursorPaginationMetadataSchema
+    records: List[ProviderResponse]
+
+
+def make_provider_record(provider) -> dict:
+    """
+    Make the `ProviderResponse` dict of a provider model or row, without validating it.
+    """
+    return {
+        "id": provider.id,
+        "name": provider.name,
+        "cnpj": provider.cnpj,
+        "phone_number": provider.phone_number,
+        "email": provider.email,
+        "contact_name": provider.contact_name,
+        "metadatetime": make_metadatetime(provider)
+    }
@@ -1,10 +1,9 @@
 # Standard Imports
-from sqlalchemy import and_, func
-from pydantic import parse_obj_as
+from sqlalchemy import and_, func, select
 from sqlalchemy_filters import apply_pagination
 
 # Typing Imports
-from typing import List
+from typing import Optional
 from sqlalchemy.orm import Session
 from pydantic.types import PositiveInt
 
@@ -21,42 +20,77 @@ from .models import Provider
 from .schemas import ProviderCreate
 from .schemas import ProviderUpdate
 from .schemas import ProviderResponse
-from .schemas import ProvidersResponse
+from .schemas import make_provider_record
+
+# Name Search
+from ...db.search import name_search
+from ...db.search import name_search_rank
 
 # Pagination Metadata Schema
 from ...utils.pagination import make_pagination_metadata
+from ...utils.pagination import apply_cursor_pagination
+from ...utils.pagination import make_cursor_pagination_metadata
+
+# ETag Helper
+from ...utils.helpers import make_etag
+from ...db.versions import fetch_versions
+from ...db.versions import version_column
+
+# Query Cache
+from ...utils.query_cache import query_cache
+
+
+# Columns of the `ProviderResponse` records, the lists load them as plain rows
+PROVIDER_RECORD_COLUMNS = (
+    Provider.id,
+    Provider.name,
+    Provider.cnpj,
+    Provider.phone_number,
+    Provider.email,
+    Provider.contact_name,
+    Provider.created_on,
+    Provider.updated_on
+)
 
 
 class ProviderService:
-    def fetch_all(self, db: Session, name: str = '') -> ProvidersResponse:
+    def fetch_all(self, db: Session, name: str = '', etag: Optional[str] = None) -> dict:
         """
         Retrieve all providers records.
 
         Args:
             db (Session): The database session.
             name (str): Provider name to filter.
+            etag (str): The list ETag of the response, read when missing.
 
         Raises:
             ItensNotFound: If no item was found.
 
         Returns:
-            ProvidersResponse: A dict with providers records.
+            dict: The `ProvidersResponse` body, with providers records.
         """
-        providers = db.query(Provider).filter(
+        if etag is None:
+            etag = self.fetch_list_etag(db)
+        key = query_cache.key(Provider.__tablename__, etag, "all", name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        providers = db.query(*PROVIDER_RECORD_COLUMNS).filter(
             Provider.is_deleted == False,
-            func.lower(Provider.name).contains(name.lower(), autoescape=True)
-        ).order_by(Provider.id).all()
-        providers = parse_obj_as(List[ProviderResponse], providers)
+            name_search(Provider.name, name)
+        ).order_by(*name_search_rank(Provider.name, name), Provider.id).all()
+        providers = [make_provider_record(provider) for provider in providers]
 
         if len(providers) == 0:
             raise ItensNotFound("No providers found")
 
-        response = ProvidersResponse(
-            records = providers
-        )
+        response = {"records": providers}
+        query_cache.set(key, response)
         return response
 
-    def fetch_all_with_pagination(self, db: Session, page: int, per_page: int = 20, name: str = '') -> ProvidersResponse:
+    def fetch_all_with_pagination(self, db: Session, page: int, per_page: int = 20, name: str = '',
+        etag: Optional[str] = None) -> dict:
         """
         Retrieve all providers records listed by page argument and pagination metadata.
 
@@ -65,6 +99,7 @@ class ProviderService:
             page (int): Page to fetch.
             per_page (int): Amount of providers per page.
             name (str): Provider name to filter.
+            etag (str): The list ETag of the response, read when missing.
 
         Raises:
             InvalidPage: If the page informed is invalid.
@@ -72,20 +107,27 @@ class ProviderService:
             InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
 
         Returns:
-            ProvidersResponse: A dict with providers records and pagination metadata.
+            dict: The `ProvidersResponse` body, with providers records and pagination metadata.
         """
         if page <= 0:
             raise InvalidPage(f"Page number should be positive and greater than zero: {page}")
         if per_page <= 0:
             raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
 
-        query = db.query(Provider).filter(
+        if etag is None:
+            etag = self.fetch_list_etag(db)
+        key = query_cache.key(Provider.__tablename__, etag, "page", page, per_page, name)
+        response = query_cache.get(key)
+        if response is not None:
+            return response
+
+        query = db.query(*PROVIDER_RECORD_COLUMNS).filter(
             Provider.is_deleted == False,
-            func.lower(Provider.name).contains(name.lower(), autoescape=True)
-        ).order_by(Provider.id)
+            name_search(Provider.name, name)
+        ).order_by(*name_search_rank(Provider.name, name), Provider.id)
 
         query, pagination = apply_pagination(query, page_number=page, page_size=per_page)
-        providers = parse_obj_as(List[ProviderResponse], query.all())
+        providers = [make_provider_record(provider) for provider in query.all()]
 
         if page > pagination.num_pages and pagination.num_pages > 0:
             raise InvalidPage(f"Page number invalid, the total of pages is {pagination.num_pages}: {page}")
@@ -99,10 +141,59 @@ class ProviderService:
             total_items=pagination.total_results,
             url_args={'name': name}
         )
-        response = ProvidersResponse(
-            pagination_metadata = pagination_metadata,
-            records = providers
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": providers
+        }
+        query_cache.set(key, response)
+        return response
+
+    def fetch_all_with_cursor(self, db: Session, limit: int = 20, after: str = None,
+        before: str = None, name: str = '') -> dict:
+        """
+        Retrieve the providers records next to a cursor, without counting or offsetting rows.
+
+        Args:
+            db (Session): The database session.
+            limit (int): Amount of providers per page.
+            after (str): Cursor of the last provider of the previous page.
+            before (str): Cursor of the first provider of the next page.
+            name (str): Provider name to filter.
+
+        Raises:
+            InvalidCursor: If the cursor informed is invalid.
+            ItensNotFound: If no item was found.
+            InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
+
+        Returns:
+            dict: The `ProvidersCursorResponse` body, with providers records and cursor pagination metadata.
+        """
+        if limit <= 0:
+            raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
+
+        query = db.query(*PROVIDER_RECORD_COLUMNS).filter(
+            Provider.is_deleted == False,
+            name_search(Provider.name, name)
+        )
+
+        providers, has_previous, has_next = apply_cursor_pagination(query, Provider.id, limit, after, before)
+        if len(providers) == 0:
+            raise ItensNotFound("No providers found")
+
+        pagination_metadata = make_cursor_pagination_metadata(
+            first_id=providers[0].id,
+            last_id=providers[-1].id,
+            limit=limit,
+            has_previous=has_previous,
+            has_next=has_next,
+            url_args={'name': name},
+            after=after,
+            before=before
         )
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": [make_provider_record(provider) for provider in providers]
+        }
         return response
 
     def fetch(self, db: Session, id: int) -> ProviderResponse:
@@ -122,6 +213,39 @@ class ProviderService:
         )).first()
         return provider
 
+    def fetch_etag(self, db: Session, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of one provider, without loading it.
+
+        Args:
+            db (Session): The database session.
+            id (int): The provider ID.
+
+        Returns:
+            str: The provider ETag, or None if the provider was not found.
+        """
+        version = db.execute(select(Provider.id, version_column(Provider.__tablename__)).where(and_(
+            Provider.id == id,
+            Provider.is_deleted == False
+        ))).first()
+        if not version:
+            return None
+
+        return make_etag(Provider.__tablename__, *version)
+
+    def fetch_list_etag(self, db: Session) -> str:
+        """
+        Retrieve the ETag shared by the providers list endpoints, from the
+        providers table version raised by every committed write.
+
+        Args:
+            db (Session): The database session.
+
+        Returns:
+            str: The providers list ETag.
+        """
+        return make_etag(Provider.__tablename__, *fetch_versions(db, Provider.__tablename__))
+
     def create(self, db: Session, user: User, provider: ProviderCreate) -> ProviderResponse:
         """
         Creates a provider.
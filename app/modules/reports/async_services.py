@@ -0,0 +1,41 @@
+# Typing Imports
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Report Models and Sync Service
+from .models import ProductMovementReport
+from .models import ProviderMovementReport
+from .services import Movement
+from .services import ReportService
+
+
+class AsyncReportService(ReportService):
+    """
+    Async version of the rollups maintenance, the reports themselves are
+    answered by the sync `ReportService`.
+    """
+    async def apply_movements(self, db: AsyncSession, movements: List[Movement]) -> None:
+        """
+        Add transactions to the daily and monthly rollups.
+
+        Args:
+            db (AsyncSession): The async database session.
+            movements (List[Movement]): The transactions to add.
+        """
+        products_rows, providers_rows = self._make_rollup_rows(movements)
+
+        if len(products_rows) > 0:
+            await db.execute(self._make_rollup_upsert(
+                db,
+                ProductMovementReport,
+                ["period", "date", "product_id"],
+                ["incoming_quantity", "outgoing_quantity", "transactions"]
+            ), products_rows)
+
+        if len(providers_rows) > 0:
+            await db.execute(self._make_rollup_upsert(
+                db,
+                ProviderMovementReport,
+                ["period", "date", "provider_id"],
+                ["incoming_quantity", "transactions"]
+            ), providers_rows)
@@ -0,0 +1,31 @@
+import sqlalchemy as db
+
+from ...db.engine import Base
+from ...db.base import BaseMixin
+
+from .schemas import ReportPeriodEnum
+
+
+class ProductMovementReport(BaseMixin, Base):
+    __tablename__ = 'report_products_movements'
+
+    # Rollup of the transactions of one product, by day or by month (first day of the month)
+    period = db.Column(db.Enum(ReportPeriodEnum), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    product_id = db.Column(db.Integer, db.ForeignKey('base_products.id'), primary_key=True)
+
+    incoming_quantity = db.Column(db.Integer, nullable=False, default=0)
+    outgoing_quantity = db.Column(db.Integer, nullable=False, default=0)
+    transactions = db.Column(db.Integer, nullable=False, default=0)
+
+
+class ProviderMovementReport(BaseMixin, Base):
+    __tablename__ = 'report_providers_movements'
+
+    # Rollup of the incoming transactions of one provider, by day or by month (first day of the month)
+    period = db.Column(db.Enum(ReportPeriodEnum), primary_key=True)
+    date = db.Column(db.Date, primary_key=True)
+    provider_id = db.Column(db.Integer, db.ForeignKey('base_providers.id'), primary_key=True)
+
+    incoming_quantity = db.Column(db.Integer, nullable=False, default=0)
+    transactions = db.Column(db.Integer, nullable=False, default=0)
\ No newline at end of file
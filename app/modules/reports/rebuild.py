@@ -0,0 +1,37 @@
+"""
+Rebuild the movement reports from the stored transactions.
+
+Usage:
+    python -m app.modules.reports.rebuild [--batch-size 1000]
+"""
+# Standard Imports
+from argparse import ArgumentParser
+
+# Database Imports
+from app.db import models
+from app.db.engine import SessionLocal
+
+# Report Service
+from .services import ReportService
+from .services import REBUILD_BATCH_SIZE
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Rebuild the movement reports from the stored transactions.")
+    parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE,
+        help="Amount of transactions read and committed at a time.")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        processed = ReportService().rebuild(
+            db, args.batch_size, on_batch=lambda processed: print(f"{processed} transactions processed")
+        )
+    finally:
+        db.close()
+
+    print(f"Reports rebuilt from {processed} transactions.")
+
+
+if __name__ == "__main__":
+    main()
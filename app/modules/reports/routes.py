@@ -0,0 +1,83 @@
+# Standard Imports
+from datetime import date
+from fastapi import APIRouter
+from fastapi import HTTPException
+from fastapi import Depends
+
+# Database Import
+from app.db.engine import get_db
+
+# Typing Imports
+from typing import List
+from typing import Optional
+from sqlalchemy.orm import Session
+
+# Exception Imports
+from ...utils.exceptions import ItensNotFound
+from ...utils.exceptions import InvalidRangeTime
+
+# Authentication Imports
+from ..users.models import User
+from app.core.auth import manager
+
+# Report Schemas
+from .services import ReportService
+from .schemas import ReportPeriodEnum
+from .schemas import ProductMovementReportResponse
+from .schemas import ProviderMovementReportResponse
+
+
+route = APIRouter()
+report_service = ReportService()
+
+
+@route.get("/reports/products", response_model=List[ProductMovementReportResponse])
+def get_products_report(period: ReportPeriodEnum = ReportPeriodEnum.daily,
+    start_date: Optional[date] = None, finish_date: Optional[date] = None, product_id: Optional[int] = None,
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve the incoming and outgoing quantities per product.
+
+    Read from the daily and monthly rollups kept by the transactions creation.
+
+    ### Args:  
+      >  period (Enum): Rollup period. (DIARIO/MENSAL)  
+      >  start_date (date): Start date to filter. (YYYY-MM-DD)  
+      >  finish_date (date): Finish date to filter. (YYYY-MM-DD)  
+      >  product_id (int): Product id to filter.
+
+    ### Returns:  
+      >  List[ProductMovementReportResponse]: A list of dicts with the quantities per date and product.
+    """
+    try:
+        return report_service.fetch_products_report(db, period, start_date, finish_date, product_id)
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhuma movimentação encontrada para o relatório.")
+    except InvalidRangeTime:
+        raise HTTPException(status_code=400, detail=f"A data de inicio {start_date} deve ser menor que a data final {finish_date}.")
+
+
+@route.get("/reports/providers", response_model=List[ProviderMovementReportResponse])
+def get_providers_report(period: ReportPeriodEnum = ReportPeriodEnum.daily,
+    start_date: Optional[date] = None, finish_date: Optional[date] = None, provider_id: Optional[int] = None,
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve the incoming quantities per provider.
+
+    Read from the daily and monthly rollups kept by the transactions creation.
+
+    ### Args:  
+      >  period (Enum): Rollup period. (DIARIO/MENSAL)  
+      >  start_date (date): Start date to filter. (YYYY-MM-DD)  
+      >  finish_date (date): Finish date to filter. (YYYY-MM-DD)  
+      >  provider_id (int): Provider id to filter.
+
+    ### Returns:  
+      >  List[ProviderMovementReportResponse]: A list of dicts with the quantities per date and provider.
+    """
+    try:
+        return report_service.fetch_providers_report(db, period, start_date, finish_date, provider_id)
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhuma movimentação encontrada para o relatório.")
+    except InvalidRangeTime:
+        raise HTTPException(status_code=400, detail=f"A data de inicio {start_date} deve ser menor que a data final {finish_date}.")
\ No newline at end of file
@@ -0,0 +1,52 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from enum import Enum
+from datetime import date
+
+
+class ReportPeriodEnum(Enum):
+    daily = 'DIARIO'
+    monthly = 'MENSAL'
+
+
+class ProductMovementReportResponse(BaseModel):
+    date: date
+    product_id: int
+    product_name: str
+    product_size: str
+    incoming_quantity: int
+    outgoing_quantity: int
+    transactions: int
+
+    class Config:
+        orm_mode = True
+        schema_extra = {
+            "example": {
+                "date": "2020-01-01",
+                "product_id": 1,
+                "product_name": "Camisa Azul",
+                "product_size": "P",
+                "incoming_quantity": 30,
+                "outgoing_quantity": 12,
+                "transactions": 5
+            }
+        }
+
+class ProviderMovementReportResponse(BaseModel):
+    date: date
+    provider_id: int
+    provider_name: str
+    incoming_quantity: int
+    transactions: int
+
+    class Config:
+        orm_mode = True
+        schema_extra = {
+            "example": {
+                "date": "2020-01-01",
+                "provider_id": 1,
+                "provider_name": "Fornecedor",
+                "incoming_quantity": 30,
+                "transactions": 2
+            }
+        }
\ No newline at end of file
@@ -0,0 +1,266 @@
+# Standard Imports
+from datetime import date
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# Typing Imports
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert, Select
+
+# Exception Imports
+from ...utils.exceptions import ItensNotFound
+from ...utils.exceptions import InvalidRangeTime
+
+# Product and Provider Models
+from app.modules.products.models import Product
+from app.modules.providers.models import Provider
+
+# Transaction Models
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.schemas import TransactionTypeEnum
+from app.modules.transactions_products.models import TransactionProduct
+
+# Report Models and Schemas
+from .models import ProductMovementReport
+from .models import ProviderMovementReport
+from .schemas import ReportPeriodEnum
+from .schemas import ProductMovementReportResponse
+from .schemas import ProviderMovementReportResponse
+
+
+# Transactions read at a time by the rebuild
+REBUILD_BATCH_SIZE = 1000
+
+
+class Movement(NamedTuple):
+    date: date
+    type: TransactionTypeEnum
+    provider_id: Optional[int]
+    # Quantity per product id
+    products: Dict[int, int]
+
+
+class ReportService:
+    def _periods(self, day: date) -> List[Tuple[ReportPeriodEnum, date]]:
+        return [
+            (ReportPeriodEnum.daily, day),
+            (ReportPeriodEnum.monthly, day.replace(day=1))
+        ]
+
+    def _make_rollup_rows(self, movements: List[Movement]) -> Tuple[List[dict], List[dict]]:
+        products: Dict[tuple, dict] = {}
+        providers: Dict[tuple, dict] = {}
+
+        for movement in movements:
+            incoming = movement.type == TransactionTypeEnum.incoming
+            for period, day in self._periods(movement.date):
+                for product_id, quantity in movement.products.items():
+                    row = products.setdefault((period.name, day, product_id), {
+                        "period": period, "date": day, "product_id": product_id,
+                        "incoming_quantity": 0, "outgoing_quantity": 0, "transactions": 0
+                    })
+                    row["incoming_quantity" if incoming else "outgoing_quantity"] += quantity
+                    row["transactions"] += 1
+
+                if incoming and movement.provider_id != None:
+                    row = providers.setdefault((period.name, day, movement.provider_id), {
+                        "period": period, "date": day, "provider_id": movement.provider_id,
+                        "incoming_quantity": 0, "transactions": 0
+                    })
+                    row["incoming_quantity"] += sum(movement.products.values())
+                    row["transactions"] += 1
+
+        # Sorted by key, so concurrent transactions lock the rows in the same order
+        return (
+            [products[key] for key in sorted(products)],
+            [providers[key] for key in sorted(providers)]
+        )
+
+    def _make_rollup_upsert(self, db: Session, model, keys: List[str], increments: List[str]) -> Insert:
+        # The dialect of the session engine, the async sessions have their own engine
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        statement = insert(model)
+
+        values = {name: model.__table__.c[name] + statement.excluded[name] for name in increments}
+        values["updated_on"] = func.now()
+        return statement.on_conflict_do_update(index_elements=keys, set_=values)
+
+    def apply_movements(self, db: Session, movements: List[Movement]) -> None:
+        """
+        Add transactions to the daily and monthly rollups.
+
+        Must run in the same database transaction that stores the transactions.
+
+        Args:
+            db (Session): The database session.
+            movements (List[Movement]): The transactions to add.
+        """
+        products_rows, providers_rows = self._make_rollup_rows(movements)
+
+        if len(products_rows) > 0:
+            db.execute(self._make_rollup_upsert(
+                db,
+                ProductMovementReport,
+                ["period", "date", "product_id"],
+                ["incoming_quantity", "outgoing_quantity", "transactions"]
+            ), products_rows)
+
+        if len(providers_rows) > 0:
+            db.execute(self._make_rollup_upsert(
+                db,
+                ProviderMovementReport,
+                ["period", "date", "provider_id"],
+                ["incoming_quantity", "transactions"]
+            ), providers_rows)
+
+    def _make_batch_movements_select(self, first_id: int, last_id: int) -> Select:
+        return select(
+            Transaction.id,
+            Transaction.date,
+            Transaction.type,
+            Transaction.provider_id,
+            TransactionProduct.product_id,
+            TransactionProduct.quantity
+        ).join(Transaction.products_transaction).where(
+            Transaction.id.between(first_id, last_id)
+        ).order_by(Transaction.id)
+
+    def rebuild(self, db: Session, batch_size: int = REBUILD_BATCH_SIZE,
+        on_batch: Callable[[int], None] = None) -> int:
+        """
+        Recreate the rollups from the stored transactions, committing each batch.
+
+        Transactions created while it runs are added by their own creation,
+        only the ones existing at the start are read.
+
+        Args:
+            db (Session): The database session.
+            batch_size (int): Amount of transactions read at a time.
+            on_batch (Callable): Called with the amount of transactions processed after each batch.
+
+        Returns:
+            int: The amount of transactions processed.
+        """
+        db.execute(delete(ProductMovementReport))
+        db.execute(delete(ProviderMovementReport))
+        last_id = db.execute(select(func.max(Transaction.id))).scalar() or 0
+        db.commit()
+
+        processed, after = 0, 0
+        while True:
+            ids = db.execute(select(Transaction.id).where(and_(
+                Transaction.id > after,
+                Transaction.id <= last_id
+            )).order_by(Transaction.id).limit(batch_size)).scalars().all()
+            if len(ids) == 0:
+                break
+
+            movements: Dict[int, Movement] = {}
+            for row in db.execute(self._make_batch_movements_select(ids[0], ids[-1])):
+                movement = movements.setdefault(row.id, Movement(row.date, row.type, row.provider_id, {}))
+                movement.products[row.product_id] = movement.products.get(row.product_id, 0) + row.quantity
+
+            self.apply_movements(db, list(movements.values()))
+            db.commit()
+
+            processed, after = processed + len(ids), ids[-1]
+            if on_batch != None:
+                on_batch(processed)
+
+        return processed
+
+    def _check_range(self, start_date: Optional[date], finish_date: Optional[date]) -> None:
+        if start_date != None and finish_date != None and start_date > finish_date:
+            raise InvalidRangeTime("Invalid datetime range")
+
+    def fetch_products_report(self, db: Session, period: ReportPeriodEnum, start_date: date = None,
+        finish_date: date = None, product_id: int = None) -> List[ProductMovementReportResponse]:
+        """
+        Retrieve the incoming and outgoing quantities per product and period.
+
+        Args:
+            db (Session): The database session.
+            period (Enum): The rollup period. (DIARIO/MENSAL)
+            start_date (date): Start date to filter. (YYYY-MM-DD)
+            finish_date (date): Finish date to filter. (YYYY-MM-DD)
+            product_id (int): Product id to filter.
+
+        Raises:
+            InvalidRangeTime: If the start date is greater than the finish date.
+            ItensNotFound: If no item was found.
+
+        Returns:
+            List[ProductMovementReportResponse]: The rollups ordered by date and product.
+        """
+        self._check_range(start_date, finish_date)
+
+        query = select(
+            ProductMovementReport.date,
+            ProductMovementReport.product_id,
+            Product.name.label('product_name'),
+            Product.size.label('product_size'),
+            ProductMovementReport.incoming_quantity,
+            ProductMovementReport.outgoing_quantity,
+            ProductMovementReport.transactions
+        ).join(Product, Product.id == ProductMovementReport.product_id).where(
+            ProductMovementReport.period == period
+        )
+
+        if start_date != None:
+            query = query.where(ProductMovementReport.date >= start_date)
+        if finish_date != None:
+            query = query.where(ProductMovementReport.date <= finish_date)
+        if product_id != None:
+            query = query.where(ProductMovementReport.product_id == product_id)
+
+        rows = db.execute(query.order_by(ProductMovementReport.date, ProductMovementReport.product_id)).all()
+        if len(rows) == 0:
+            raise ItensNotFound("No report rows found")
+
+        return [ProductMovementReportResponse.from_orm(row) for row in rows]
+
+    def fetch_providers_report(self, db: Session, period: ReportPeriodEnum, start_date: date = None,
+        finish_date: date = None, provider_id: int = None) -> List[ProviderMovementReportResponse]:
+        """
+        Retrieve the incoming quantities per provider and period.
+
+        Args:
+            db (Session): The database session.
+            period (Enum): The rollup period. (DIARIO/MENSAL)
+            start_date (date): Start date to filter. (YYYY-MM-DD)
+            finish_date (date): Finish date to filter. (YYYY-MM-DD)
+            provider_id (int): Provider id to filter.
+
+        Raises:
+            InvalidRangeTime: If the start date is greater than the finish date.
+            ItensNotFound: If no item was found.
+
+        Returns:
+            List[ProviderMovementReportResponse]: The rollups ordered by date and provider.
+        """
+        self._check_range(start_date, finish_date)
+
+        query = select(
+            ProviderMovementReport.date,
+            ProviderMovementReport.provider_id,
+            Provider.name.label('provider_name'),
+            ProviderMovementReport.incoming_quantity,
+            ProviderMovementReport.transactions
+        ).join(Provider, Provider.id == ProviderMovementReport.provider_id).where(
+            ProviderMovementReport.period == period
+        )
+
+        if start_date != None:
+            query = query.where(ProviderMovementReport.date >= start_date)
+        if finish_date != None:
+            query = query.where(ProviderMovementReport.date <= finish_date)
+        if provider_id != None:
+            query = query.where(ProviderMovementReport.provider_id == provider_id)
+
+        rows = db.execute(query.order_by(ProviderMovementReport.date, ProviderMovementReport.provider_id)).all()
+        if len(rows) == 0:
+            raise ItensNotFound("No report rows found")
+
+        return [ProviderMovementReportResponse.from_orm(row) for row in rows]
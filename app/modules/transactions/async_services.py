@@ -0,0 +1,409 @@
+# Standard Imports
+from datetime import date
+from sqlalchemy import and_, func, select
+
+# Typing Imports
+from typing import List, Optional, Union
+from sqlalchemy.sql import Select
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Exception Imports
+from sqlalchemy_filters.exceptions import InvalidPage
+from ...utils.exceptions import ProductsNotFound
+from ...utils.exceptions import ProviderNotFound
+from ...utils.exceptions import NotEnoughStockQuantity
+from ...utils.exceptions import ItensNotFound
+from ...utils.exceptions import InvalidPageItemsNumber
+from ...utils.exceptions import InvalidRangeTime
+
+# User Model
+from app.modules.users.models import User
+
+# Product Model
+from app.modules.products.models import Product
+
+# Provider Model
+from app.modules.providers.models import Provider
+
+# Transaction Model, Schemas and Sync Service
+from .models import Transaction
+from .services import TransactionService
+from .schemas import IncomingTransactionCreate, OutgoingTransactionCreate
+from .schemas import TransactionProductsData
+from .schemas import TransactionResponse
+from .schemas import TransactionTypeEnum
+from .schemas import make_transaction_record
+
+# Transaction Products Model
+from ..transactions_products.models import TransactionProduct
+
+# Name Search
+from ...db.search import name_search
+
+# ETag Helper
+from ...utils.helpers import make_etag
+from ...db.versions import fetch_versions_async
+
+# Transactions Metrics
+from .metrics import record_transaction
+
+# Inventory Snapshot Service
+from ..inventory_snapshots.async_services import AsyncInventorySnapshotService
+
+# Report Service
+from ..reports.async_services import AsyncReportService
+
+# Pagination Metadata Schema
+from ...utils.pagination import make_pagination_metadata
+from ...utils.pagination import apply_pagination_async
+
+
+class AsyncTransactionService(TransactionService):
+    """
+    Async version of the `TransactionService`, the payload validation
+    helpers that do not touch the database are inherited from it.
+    """
+    inventory_snapshots = AsyncInventorySnapshotService()
+    reports = AsyncReportService()
+
+    async def fetch_one(self, db: AsyncSession, id: int) -> TransactionResponse:
+        """
+        Retrieve one transaction record by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The transaction id.
+
+        Raises:
+            ItensNotFound: If transaction was found.
+
+        Returns:
+            TransactionResponse: A dict with transaction record.
+        """
+        result = await db.execute(
+            select(Transaction).filter(Transaction.id == id).options(
+                selectinload(Transaction.products_transaction)
+            ).execution_options(populate_existing=True)
+        )
+        transaction = result.scalars().first()
+
+        if transaction == None:
+            raise ItensNotFound("Transaction was not found")
+
+        return TransactionResponse.from_orm(transaction)
+
+    async def fetch_etag(self, db: AsyncSession, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of one transaction, without loading it.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The transaction id.
+
+        Returns:
+            str: The transaction ETag, or None if the transaction was not found.
+        """
+        result = await db.execute(self._make_etag_select(id))
+        version = result.first()
+        if not version:
+            return None
+
+        return make_etag(Transaction.__tablename__, *version)
+
+    async def fetch_list_etag(self, db: AsyncSession) -> str:
+        """
+        Retrieve the ETag shared by the transactions list endpoints.
+
+        Args:
+            db (AsyncSession): The async database session.
+
+        Returns:
+            str: The transactions list ETag.
+        """
+        versions = await fetch_versions_async(db, *self._list_etag_tables())
+        return make_etag(Transaction.__tablename__, *versions)
+
+    def _make_transaction_select_with_filters(self, product_name: str = '', provider_name: str = '',
+        description: str = '', transaction_type: TransactionTypeEnum = '',
+        start_date: date = '', finish_date: date = '') -> Select:
+        query = select(Transaction)
+
+        # Filter by range datetimes
+        if type(start_date) == date and type(finish_date) == date:
+            if start_date > finish_date:
+                raise InvalidRangeTime("Invalid datetime range")
+            else:
+                query = query.filter(and_(
+                    Transaction.date >= start_date, Transaction.date <= finish_date
+                ))
+
+        # Filter only by start date
+        elif type(start_date) == date and finish_date == '':
+            query = query.filter(
+                Transaction.date >= start_date
+            )
+
+        # Filter only by finish date
+        elif type(finish_date) == date and start_date == '':
+            query = query.filter(
+                Transaction.date <= finish_date
+            )
+
+        # Filter by provider name
+        if provider_name != '':
+            query = query.join(Transaction.provider).filter(
+                name_search(Provider.name, provider_name)
+            )
+
+        # Filter by description
+        if description != '':
+            query = query.filter(
+                func.lower(Transaction.description).contains(description.lower(), autoescape=True)
+            )
+
+        # Filter by transaction type (incoming or outcoming)
+        if transaction_type != '':
+            query = query.filter(
+                Transaction.type == transaction_type
+            )
+
+        # Filter by product name
+        if product_name != '':
+            query = query.filter(
+                self._make_product_name_filter(product_name)
+            )
+
+        return query
+
+    def _make_records_select(self, query: Select) -> Select:
+        # The provider filter may already join the providers table
+        provider = aliased(Provider)
+
+        # Plain rows, nothing is loaded into the session identity map
+        return query.outerjoin(provider, Transaction.provider_id == provider.id).with_only_columns(
+            *self._make_record_columns(provider)
+        )
+
+    async def fetch_all(self, db: AsyncSession, product_name: str = '', provider_name: str = '',
+        description: str = '', transaction_type: TransactionTypeEnum = '',
+        start_date: date = None, finish_date: date = None) -> List[dict]:
+        """
+        Retrieve all transactions records.
+
+        Args:
+            db (AsyncSession): The async database session.
+            product_name (str): Product name to filter.
+            provider_name (str): Provider name to filter.
+            description (str): Description to filter.
+            transaction_type (Enum): Transaction type to filter.
+            start_date (date): Start date to filter. (YYYY-MM-DD)
+            finish_date (date): Finish date to filter. (YYYY-MM-DD)
+
+        Raises:
+            ItensNotFound: If no item was found.
+
+        Returns:
+            List[dict]: The `TransactionResponse` dicts of the transactions records.
+        """
+        query = self._make_transaction_select_with_filters(
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+        result = await db.execute(self._make_records_select(query).order_by(Transaction.id))
+        transactions = result.all()
+
+        if len(transactions) == 0:
+            raise ItensNotFound("No transactions found")
+
+        # The products of all the filtered transactions, by a semi-join instead of an id list
+        result = await db.execute(self._make_record_products_select(query.with_only_columns(Transaction.id)))
+        return self._make_records(transactions, result.all())
+
+    async def fetch_all_with_pagination(self, db: AsyncSession, page: int, per_page: int = 20, product_name: str = '',
+        provider_name: str = '', description: str = '', transaction_type: TransactionTypeEnum = '',
+        start_date: date = None, finish_date: date = None) -> dict:
+        """
+        Retrieve all transacions records listed by page argument and pagination metadata.
+
+        Args:
+            db (AsyncSession): The async database session.
+            page (int): Page to fetch.
+            per_page (int): Amount of transactions per page.
+            product_name (str): Product name to filter.
+            provider_name (str): Provider name to filter.
+            description (str): Description to filter.
+            transaction_type (Enum): Transaction type to filter.
+            start_date (date): Start date to filter.
+            finish_date (date): Finish date to filter.
+
+        Raises:
+            InvalidPage: If the page informed is invalid.
+            ItensNotFound: If no item was found.
+            InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
+
+        Returns:
+            dict: The `TransactionsResponse` body, with transactions records and pagination metadata.
+        """
+        if page <= 0:
+            raise InvalidPage(f"Page number should be positive and greater than zero: {page}")
+        if per_page <= 0:
+            raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
+
+        query = self._make_transaction_select_with_filters(
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+        query = self._make_records_select(query).order_by(Transaction.id)
+
+        query, pagination = await apply_pagination_async(db, query, page_number=page, page_size=per_page)
+        result = await db.execute(query)
+        transactions = result.all()
+
+        if page > pagination.num_pages and pagination.num_pages > 0:
+            raise InvalidPage(f"Page number invalid, the total of pages is {pagination.num_pages}: {page}")
+        if len(transactions) == 0:
+            raise ItensNotFound("No transactions found")
+
+        # Products of the whole page are loaded by one extra query after the LIMIT
+        result = await db.execute(self._make_record_products_select([row.id for row in transactions]))
+        products = result.all()
+
+        url_args = {
+            "product_name": product_name,
+            "provider_name": provider_name,
+            "description": description,
+            "transaction_type": transaction_type.value if type(transaction_type) == TransactionTypeEnum else '',
+            "start_date": start_date,
+            "finish_date": finish_date
+        }
+        pagination_metadata = make_pagination_metadata(
+            current_page=page,
+            total_pages=pagination.num_pages,
+            per_page=per_page,
+            total_items=pagination.total_results,
+            url_args=url_args
+        )
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": self._make_records(transactions, products)
+        }
+        return response
+
+    async def _check_provider_existence(self, db: AsyncSession, provider_id: int) -> Optional[Provider]:
+        if provider_id != None:
+            provider = await db.get(Provider, provider_id)
+            if provider == None:
+                raise ProviderNotFound(str(provider_id))
+            return provider
+
+    async def _get_products_from_database(self, db: AsyncSession, payload_products_id: List[int]) -> List[Product]:
+        result = await db.execute(
+            select(Product).filter(Product.id.in_(payload_products_id)).order_by(Product.id)
+        )
+        products_found = result.scalars().all()
+
+        if len(products_found) != len(payload_products_id):
+            found_ids = [p_found.id for p_found in products_found]
+            raise ItensNotFound(
+                str([id for id in payload_products_id if id not in found_ids])
+            )
+
+        return products_found
+
+    async def _update_products_inventory(self, db: AsyncSession, products_payload: List[TransactionProductsData], outgoing: bool = False) -> List[int]:
+        not_updated_ids = []
+
+        # The payload is sorted by id, so concurrent transactions lock the rows in the same order
+        for p_payload in products_payload:
+            delta = -p_payload.quantity if outgoing else p_payload.quantity
+            result = await db.execute(self._make_inventory_update(p_payload.product_id, delta))
+            if result.rowcount == 0:
+                not_updated_ids.append(p_payload.product_id)
+
+        return not_updated_ids
+
+    async def _raise_inventory_update_error(self, db: AsyncSession, not_updated_ids: List[int]) -> None:
+        # Raises for the missing products, the remaining ones did not have enough stock
+        await self._get_products_from_database(db, list(not_updated_ids))
+
+        raise NotEnoughStockQuantity(not_updated_ids)
+
+    async def create(self, db: AsyncSession, user: User,
+        transaction: Union[IncomingTransactionCreate,
+                           OutgoingTransactionCreate]) -> TransactionResponse:
+        """
+        Creates a incoming or an outgoing transaction.
+
+        The products stock is changed by conditional updates, and the
+        transaction, its products and the stock changes are stored in a
+        single commit.
+
+        Args:
+            db (AsyncSession): The async database session.
+            user (User): The user model.
+            transaction (IncomingTransactionCreate or OutgoingTransactionCreate): The incoming or outgoing transaction create model.
+
+        Returns:
+            TransactionResponse: The provider response model.
+        """
+        if len(transaction.products) == 0:
+            raise ProductsNotFound("Empty transaction products")
+
+        checked_products = self._sort_by_id_check_and_sum_duplicates(transaction.products)
+        self._check_if_products_payload_is_greater_than_zero(checked_products)
+
+        provider = None
+        if transaction.type == TransactionTypeEnum.incoming:
+            provider = await self._check_provider_existence(db, transaction.provider_id)
+
+        transaction_create = self._make_transaction_create(user, transaction, checked_products)
+        # Already loaded, the response shows its name
+        transaction_create.provider = provider
+        outgoing = transaction.type == TransactionTypeEnum.outgoing
+
+        try:
+            # Increments or decrements products stock
+            not_updated_ids = await self._update_products_inventory(db, checked_products, outgoing)
+            if len(not_updated_ids) == 0:
+                db.add(transaction_create)
+                await db.flush()
+                await self.inventory_snapshots.apply_deltas(
+                    db, self._make_snapshot_deltas(transaction.date, checked_products, outgoing)
+                )
+                await self.reports.apply_movements(db, [self._make_movement(transaction_create, checked_products)])
+                await db.commit()
+        except:
+            await db.rollback()
+            raise
+
+        if len(not_updated_ids) > 0:
+            await db.rollback()
+            await self._raise_inventory_update_error(db, not_updated_ids)
+
+        record_transaction(transaction.type, checked_products)
+
+        # The transaction values are already loaded, only its products names are selected
+        result = await db.execute(self._make_record_products_select([transaction_create.id]))
+        return TransactionResponse.parse_obj(make_transaction_record(transaction_create, result.all()))
+
+    async def make_response(self, db: AsyncSession, products_ids: List[int]):
+        result = await db.execute(select(Product).filter(Product.id.in_(products_ids)))
+
+        data = []
+        for product in result.scalars().all():
+            data.append({
+                "id": product.id,
+                "name": product.name,
+                "inventory": product.inventory
+            })
+
+        return data
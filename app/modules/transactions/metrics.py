@@ -0,0 +1,29 @@
+# Typing Imports
+from typing import List
+
+# Metrics Imports
+from ...utils.metrics import registry
+
+# Schemas Imports
+from .schemas import TransactionTypeEnum
+from .schemas import TransactionProductsData
+
+
+transactions_created = registry.counter(
+    "sbf_transactions_created_total",
+    "Transactions created, by type.",
+    ("type",)
+)
+transaction_units_moved = registry.counter(
+    "sbf_transaction_units_moved_total",
+    "Product units moved in or out of the stock by the created transactions, by type.",
+    ("type",)
+)
+
+
+def record_transaction(transaction_type: TransactionTypeEnum, products: List[TransactionProductsData]) -> None:
+    """
+    Count a committed transaction and the units of its products.
+    """
+    transactions_created.inc(transaction_type.name)
+    transaction_units_moved.inc(transaction_type.name, amount=sum(product.quantity for product in products))
@@ -2,10 +2,11 @@ import sqlalchemy as db
 
 from sqlalchemy.orm import relationship
 
-from typing import List
+from typing import List, Optional
 
 from ...db.engine import Base
 from ...db.base import BaseMixin
+from ...db.versions import add_table_version
 
 from .schemas import TransactionTypeEnum
 from .schemas import TransactionProductsData
@@ -28,6 +29,15 @@ class Transaction(BaseMixin, Base):
     provider = relationship('Provider', lazy='joined', uselist=False)
     user = relationship('User', lazy='select', back_populates='transactions', uselist=False)
 
+    # Define Indexes
+    __table_args__ = (
+        # Date ranges, alone or with the type
+        db.Index('ix_base_transactions_date', date),
+        db.Index('ix_base_transactions_type_date', type, date),
+        db.Index('ix_base_transactions_provider_id', provider_id),
+        db.Index('ix_base_transactions_created_by', created_by),
+    )
+
     @property
     def products(self) -> List[TransactionProductsData]:
         return [
@@ -36,5 +46,9 @@ class Transaction(BaseMixin, Base):
         ]
 
     @property
-    def provider_name(self) -> str:
-        return self.provider.name
\ No newline at end of file
+    def provider_name(self) -> Optional[str]:
+        return self.provider.name if self.provider != None else None
+
+
+# Version of the transactions lists ETag, with the products and providers ones
+add_table_version(Transaction)
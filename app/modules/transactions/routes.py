@@ -1,13 +1,26 @@
 # Standard Imports
+from json import loads
 from datetime import date
 from fastapi import APIRouter
 from fastapi import HTTPException
 from fastapi import Depends
 from fastapi import Path, Query
+from fastapi import Header, Response
+from fastapi import Request
+from fastapi.responses import StreamingResponse
 
 # Database Import
 from app.db.engine import get_db
 
+# Import Configuration
+from app.core.config import TRANSACTION_IMPORT_MAX_ITEMS
+
+# ETag Imports
+from ...utils.helpers import not_modified
+
+# Serialization Imports
+from ...utils.serialization import drop_none, make_json_response
+
 # Typing Imports
 from typing import List
 from typing import Optional
@@ -22,6 +35,7 @@ from ...utils.exceptions import NotEnoughStockQuantity
 from ...utils.exceptions import ProviderNotFound
 from ...utils.exceptions import InvalidPageItemsNumber
 from ...utils.exceptions import InvalidRangeTime
+from ...utils.exceptions import InvalidCursor
 
 # Authentication Imports
 from ..users.models import User
@@ -32,7 +46,10 @@ from .services import TransactionService
 from .schemas import IncomingTransactionCreate, OutgoingTransactionCreate
 from .schemas import IncomingTransactionResponse, OutgoingTransactionResponse
 from .schemas import TransactionResponse, TransactionsResponse
+from .schemas import TransactionsCursorResponse
 from .schemas import TransactionTypeEnum
+from .schemas import TransactionImportResponse
+from .schemas import TransactionExportFormatEnum
 
 
 
@@ -41,9 +58,10 @@ transaction_service = TransactionService()
 
 
 @route.get("/transaction/", response_model_exclude_unset=True, response_model=List[TransactionResponse], response_model_exclude_none=True)
-def get_all_transactions( product_name: Optional[str] = '', provider_name: Optional[str] = '',
+def get_all_transactions(response: Response, product_name: Optional[str] = '', provider_name: Optional[str] = '',
     description: Optional[str] = '', transaction_type: Optional[TransactionTypeEnum] = '',
     start_date: Optional[date] = '' ,finish_date: Optional[date] = '',
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve all transactions.
@@ -59,6 +77,10 @@ def get_all_transactions( product_name: Optional[str] = '', provider_name: Optio
     ### Returns:  
       >  List[TransactionResponse]: A list of dicts with transactions records.
     """
+    response_304 = not_modified(response, if_none_match, transaction_service.fetch_list_etag(db))
+    if response_304:
+        return response_304
+
     try:
         transactions = transaction_service.fetch_all(
             db,
@@ -69,7 +91,7 @@ def get_all_transactions( product_name: Optional[str] = '', provider_name: Optio
             start_date,
             finish_date
         )
-        return transactions
+        return make_json_response(drop_none(transactions), response)
     except ItensNotFound:
 	    raise HTTPException(status_code=404, detail="Nenhuma movimentação foi encontrada.")
     except InvalidRangeTime:
@@ -78,10 +100,11 @@ def get_all_transactions( product_name: Optional[str] = '', provider_name: Optio
 
 
 @route.get("/transaction/page/{page}", response_model=TransactionsResponse)
-def get_all_transactions_in_current_page(page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
+def get_all_transactions_in_current_page(response: Response, page: int = Path(..., gt=0), per_page: int = Query(default=20, gt=0),
     product_name: Optional[str] = '', provider_name: Optional[str] = '',
     description: Optional[str] = '', transaction_type: Optional[TransactionTypeEnum] = '',
     start_date: Optional[date] = '' ,finish_date: Optional[date] = '',
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve all transactions in current page.
@@ -99,6 +122,10 @@ def get_all_transactions_in_current_page(page: int = Path(..., gt=0), per_page:
     ### Returns:  
       >  TransactionsResponse: A dict with transactions records and pagination metadata.
     """
+    response_304 = not_modified(response, if_none_match, transaction_service.fetch_list_etag(db))
+    if response_304:
+        return response_304
+
     try:
         providers = transaction_service.fetch_all_with_pagination(
             db,
@@ -111,7 +138,7 @@ def get_all_transactions_in_current_page(page: int = Path(..., gt=0), per_page:
             start_date,
             finish_date
         )
-        return providers
+        return make_json_response(providers, response)
     except InvalidPage:
 	    raise HTTPException(status_code=400, detail="Não foi possivel recuperar os itens na página informada.")
     except InvalidPageItemsNumber:
@@ -122,8 +149,103 @@ def get_all_transactions_in_current_page(page: int = Path(..., gt=0), per_page:
 	    raise HTTPException(status_code=400, detail=f"A data de inicio {start_date} deve ser menor que a data final {finish_date}.")
 
 
+@route.get("/transaction/cursor", response_model=TransactionsCursorResponse)
+def get_all_transactions_by_cursor(response: Response, limit: int = Query(default=20, gt=0), after: Optional[str] = None,
+    before: Optional[str] = None, product_name: Optional[str] = '', provider_name: Optional[str] = '',
+    description: Optional[str] = '', transaction_type: Optional[TransactionTypeEnum] = '',
+    start_date: Optional[date] = '' ,finish_date: Optional[date] = '',
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+    """
+    ## Retrieve transactions next to a cursor (keyset pagination).
+
+    ### Args:  
+      >  limit (int): Amount of transactions per page.  
+      >  after (str): Cursor to fetch the next page (`next_cursor`).  
+      >  before (str): Cursor to fetch the previous page (`previous_cursor`).  
+      >  product_name (str): Product name to filter.  
+      >  provider_name (str): Provider name to filter.  
+      >  description (str): Description to filter.  
+      >  transaction_type (Enum): Transaction type to filter. (ENTRADA/SAIDA)  
+      >  start_date (date): Start date to filter. (YYYY-MM-DD)  
+      >  finish_date (date): Finish date to filter. (YYYY-MM-DD)
+
+    ### Returns:  
+      >  TransactionsCursorResponse: A dict with transactions records and cursor pagination metadata.
+    """
+    response_304 = not_modified(response, if_none_match, transaction_service.fetch_list_etag(db))
+    if response_304:
+        return response_304
+
+    try:
+        transactions = transaction_service.fetch_all_with_cursor(
+            db,
+            limit,
+            after,
+            before,
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+        return make_json_response(transactions, response)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Cursor de paginação inválido.")
+    except InvalidPageItemsNumber:
+        raise HTTPException(status_code=400, detail="Quantidade de itens por pagina precisa ser maior que zero.")
+    except ItensNotFound:
+        raise HTTPException(status_code=404, detail="Nenhuma movimentação encontrada.")
+    except InvalidRangeTime:
+        raise HTTPException(status_code=400, detail=f"A data de inicio {start_date} deve ser menor que a data final {finish_date}.")
+
+
+@route.get("/transaction/export", response_class=StreamingResponse, responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}})
+def export_transactions(export_format: TransactionExportFormatEnum = Query(TransactionExportFormatEnum.ndjson, alias="format"),
+    product_name: Optional[str] = '', provider_name: Optional[str] = '',
+    description: Optional[str] = '', transaction_type: Optional[TransactionTypeEnum] = '',
+    start_date: Optional[date] = '' ,finish_date: Optional[date] = '',
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+    """
+    ## Export all transactions as a stream.
+
+    ### Args:   
+      >  format (Enum): The export format, one transaction per line on NDJSON and one transaction product per line on CSV. (ndjson/csv)  
+      >  product_name (str): Product name to filter.  
+      >  provider_name (str): Provider name to filter.  
+      >  description (str): Description to filter.  
+      >  transaction_type (Enum): Transaction type to filter. (ENTRADA/SAIDA)  
+      >  start_date (date): Start date to filter. (YYYY-MM-DD)  
+      >  finish_date (date): Finish date to filter. (YYYY-MM-DD)
+
+    ### Returns:  
+      >  StreamingResponse: The transactions records, as NDJSON or CSV.
+    """
+    try:
+        lines = transaction_service.export(
+            db,
+            export_format,
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+    except InvalidRangeTime:
+        raise HTTPException(status_code=400, detail=f"A data de inicio {start_date} deve ser menor que a data final {finish_date}.")
+
+    if export_format == TransactionExportFormatEnum.csv:
+        return StreamingResponse(lines, media_type="text/csv", headers={
+            "Content-Disposition": 'attachment; filename="transactions.csv"'
+        })
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @route.get("/transaction/{id}", response_model_exclude_unset=True, response_model=TransactionResponse)
-def get_one_transaction(id: int, db: Session = Depends(get_db), auth_user: User=Depends(manager)):
+def get_one_transaction(id: int, response: Response, if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db), auth_user: User=Depends(manager)):
     """
     ## Retrieve one transaction by id.
 
@@ -133,6 +255,13 @@ def get_one_transaction(id: int, db: Session = Depends(get_db), auth_user: User=
     ### Returns:  
       >  TransactionsResponse: A dict with transaction record.
     """
+    etag = transaction_service.fetch_etag(db, id)
+    if not etag:
+        raise HTTPException(status_code=404, detail=f"Movimentação de id {id} não foi encontrada.")
+    response_304 = not_modified(response, if_none_match, etag)
+    if response_304:
+        return response_304
+
     try:
         transaction = transaction_service.fetch_one(db, id)
         return transaction
@@ -161,7 +290,7 @@ def create_incoming_transaction(transaction: IncomingTransactionCreate, db: Sess
     except ProviderNotFound as err:
 	    raise HTTPException(status_code=404, detail=f"O fornecedor informado não foi encontrado: {str(err)}")
     except InvalidStockQuantity as err:
-        products_missing = transaction_service.make_response(db, str(err))
+        products_missing = transaction_service.make_response(db, err.products_ids)
         raise HTTPException(status_code=400, detail={
             "message": "A quantidade informada para os seguintes produtos deve ser maior do que zero.",
             "products_missing": products_missing
@@ -187,14 +316,62 @@ def create_outgoing_transaction(transaction: OutgoingTransactionCreate, db: Sess
     except ProductsNotFound as err:
         raise HTTPException(status_code=400, detail="A movimentação a ser registrada deve conter no minimo um produto.")
     except InvalidStockQuantity as err:
-        products_missing = transaction_service.make_response(db, str(err))
+        products_missing = transaction_service.make_response(db, err.products_ids)
         raise HTTPException(status_code=400, detail={
             "message": "A quantidade informada para os seguintes produtos deve ser maior do que zero.",
             "products_missing": products_missing
         })
     except NotEnoughStockQuantity as err:
-        products_missing = transaction_service.make_response(db, str(err))
+        products_missing = transaction_service.make_response(db, err.products_ids)
         raise HTTPException(status_code=422, detail={
             "message": "Os produtos informados não possuem quantidade em estoque suficiente para a saída.",
             "products_missing": products_missing
         })
+
+
+
+async def read_import_payload(request: Request) -> List[dict]:
+    """
+    Read a JSON array or a NDJSON stream (one transaction per line) from the request body.
+    """
+    body = await request.body()
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            payload = [loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            payload = loads(body)
+    except ValueError:
+        payload = None
+
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="O corpo da requisição deve ser uma lista JSON ou NDJSON de movimentações.")
+    if len(payload) > TRANSACTION_IMPORT_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"A importação deve conter no máximo {TRANSACTION_IMPORT_MAX_ITEMS} movimentações.")
+
+    return payload
+
+
+@route.post("/transaction/import", response_model=TransactionImportResponse, response_model_exclude_none=True)
+def import_transactions(payload: List[dict] = Depends(read_import_payload), db: Session = Depends(get_db),
+    auth_user: User=Depends(manager)):
+    """
+    ## Creates a batch of incoming and outgoing transactions.
+
+    The body is a JSON array, or a NDJSON stream when sent as `application/x-ndjson`.
+    Each item is validated as in the single transaction endpoints, invalid items
+    are rejected and the valid ones are stored together.
+
+    ### Args:  
+      >  payload (list): The incoming or outgoing transaction create models.
+
+    ### Returns:  
+      >  TransactionImportResponse: The result of each item, with the created id or the error detail.
+    """
+    try:
+        return transaction_service.import_transactions(db, auth_user, payload)
+    except NotEnoughStockQuantity as err:
+        products_missing = transaction_service.make_response(db, err.products_ids)
+        raise HTTPException(status_code=409, detail={
+            "message": "O estoque dos produtos foi alterado durante a importação, nenhuma movimentação foi registrada.",
+            "products_missing": products_missing
+        })
\ No newline at end of file
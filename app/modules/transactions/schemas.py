@@ -1,17 +1,22 @@
 from pydantic import BaseModel
 from pydantic import PositiveInt
-from typing import List, Optional
+from typing import Any, List, Optional
 from enum import Enum
 from datetime import date
 
-from ...utils.helpers import BaseSchema, MetaDatetimeSchema
+from ...utils.helpers import BaseSchema, MetaDatetimeSchema, make_metadatetime
 from ...utils.pagination import PaginationMetadataSchema
+from ...utils.pagination import CursorPaginationMetadataSchema
 
 
 class TransactionTypeEnum(Enum):
     incoming = 'ENTRADA'
     outgoing = 'SAIDA'
 
+class TransactionExportFormatEnum(Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
+
 class TransactionProductsData(BaseModel):
     product_id: PositiveInt
     product_name: Optional[str]
@@ -200,4 +205,64 @@ class TransactionResponse(BaseSchema):
 
 class TransactionsResponse(BaseSchema):
     pagination_metadata: Optional[PaginationMetadataSchema]
-    records: List[TransactionResponse]
\ No newline at end of file
+    records: List[TransactionResponse]
+
+class TransactionsCursorResponse(BaseSchema):
+    pagination_metadata: CursorPaginationMetadataSchema
+    records: List[TransactionResponse]
+
+
+class TransactionImportItemResult(BaseModel):
+    index: int
+    status_code: int
+    id: Optional[int]
+    detail: Optional[Any]
+
+class TransactionImportResponse(BaseModel):
+    created: int
+    rejected: int
+    results: List[TransactionImportItemResult]
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "created": 1,
+                "rejected": 1,
+                "results": [{
+                    "index": 0,
+                    "status_code": 201,
+                    "id": 1
+                },{
+                    "index": 1,
+                    "status_code": 404,
+                    "detail": "Os seguintes produtos não foram encontrados no sistema: [7]"
+                }]
+            }
+        }
+
+
+def make_transaction_product_record(transaction_product) -> dict:
+    """
+    Make the `TransactionProductsData` dict of a transaction product, without validating it.
+    """
+    return {
+        "product_id": transaction_product.product_id,
+        "product_name": transaction_product.product_name,
+        "product_size": transaction_product.product_size,
+        "quantity": transaction_product.quantity
+    }
+
+def make_transaction_record(transaction, products: list) -> dict:
+    """
+    Make the `TransactionResponse` dict of a transaction row and its products rows, without validating it.
+    """
+    return {
+        "id": transaction.id,
+        "type": transaction.type.value,
+        "description": transaction.description,
+        "date": transaction.date,
+        "provider_id": transaction.provider_id,
+        "provider_name": transaction.provider_name,
+        "products": [make_transaction_product_record(product) for product in products],
+        "metadatetime": make_metadatetime(transaction)
+    }
\ No newline at end of file
@@ -1,13 +1,17 @@
 # Standard Imports
+import csv
+from itertools import groupby
 from datetime import date, timedelta
-from sqlalchemy import and_, func
-from pydantic import parse_obj_as
+from sqlalchemy import and_, func, insert, select, update
+from pydantic import ValidationError
 from sqlalchemy_filters import apply_pagination
 
 # Typing Imports
-from typing import List, Union
-from sqlalchemy.orm import Session, joinedload
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased, joinedload
 from sqlalchemy.orm.query import Query
+from sqlalchemy.sql import ColumnElement, Select, Update
 
 # Exception Imports
 from sqlalchemy_filters.exceptions import InvalidPage
@@ -32,17 +36,57 @@ from app.modules.providers.models import Provider
 from .models import Transaction
 from .schemas import TransactionProductsData
 from .schemas import IncomingTransactionCreate, OutgoingTransactionCreate
-from .schemas import TransactionResponse, TransactionsResponse
+from .schemas import TransactionResponse
+from .schemas import TransactionImportItemResult, TransactionImportResponse
+from .schemas import TransactionExportFormatEnum
 from .schemas import TransactionTypeEnum
+from .schemas import make_transaction_record
 
 # Transaction Products Model
 from ..transactions_products.models import TransactionProduct
 
+# Inventory Snapshot Service
+from ..inventory_snapshots.services import InventorySnapshotService
+
+# Report Service
+from ..reports.services import Movement, ReportService
+
+# Metadatetime Schema
+from ...utils.helpers import MetaDatetimeSchema
+from ...utils.helpers import make_etag
+from ...db.versions import fetch_versions
+from ...db.versions import version_column
+
+# Transactions Metrics
+from .metrics import record_transaction
+
+# Name Search
+from ...db.search import name_search
+
 # Pagination Metadata Schema
 from ...utils.pagination import make_pagination_metadata
+from ...utils.pagination import apply_cursor_pagination
+from ...utils.pagination import make_cursor_pagination_metadata
+
+
+# Transactions fetched from the database at a time by the export
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_CSV_COLUMNS = (
+    'id', 'type', 'description', 'date', 'provider_id', 'provider_name',
+    'product_id', 'product_name', 'product_size', 'quantity', 'created_on', 'updated_on'
+)
+
+
+class _CsvLine:
+    def write(self, line: str) -> str:
+        return line
 
 
 class TransactionService:
+    inventory_snapshots = InventorySnapshotService()
+    reports = ReportService()
+
     def fetch_one(self, db: Session, id: int) -> TransactionResponse:
         """
         Retrieve one transaction record by id.
@@ -69,6 +113,56 @@ class TransactionService:
 
         return transaction
 
+    def _list_etag_tables(self) -> Tuple[str, ...]:
+        # The responses also show the names of the products and providers
+        return (Transaction.__tablename__, Product.__tablename__, Provider.__tablename__)
+
+    def _make_etag_select(self, id: int) -> Select:
+        return select(
+            Transaction.id, *[version_column(name) for name in self._list_etag_tables()]
+        ).where(Transaction.id == id)
+
+    def fetch_etag(self, db: Session, id: int) -> Optional[str]:
+        """
+        Retrieve the ETag of one transaction, without loading it.
+
+        Args:
+            db (Session): The database session.
+            id (int): The transaction id.
+
+        Returns:
+            str: The transaction ETag, or None if the transaction was not found.
+        """
+        version = db.execute(self._make_etag_select(id)).first()
+        if not version:
+            return None
+
+        return make_etag(Transaction.__tablename__, *version)
+
+    def fetch_list_etag(self, db: Session) -> str:
+        """
+        Retrieve the ETag shared by the transactions list endpoints.
+
+        Made from the transactions, products and providers table versions,
+        raised by every committed write, as their names are part of the
+        transactions responses.
+
+        Args:
+            db (Session): The database session.
+
+        Returns:
+            str: The transactions list ETag.
+        """
+        return make_etag(Transaction.__tablename__, *fetch_versions(db, *self._list_etag_tables()))
+
+    def _make_product_name_filter(self, product_name: str) -> ColumnElement:
+        # Uncorrelated semi-join, the matching products are searched once instead of per transaction
+        return Transaction.id.in_(
+            select(TransactionProduct.transaction_id).where(TransactionProduct.product_id.in_(
+                select(Product.id).where(name_search(Product.name, product_name))
+            ))
+        )
+
     def _make_transaction_query_with_filters(self, db: Session, product_name: str = '', provider_name: str = '',
         description: str = '', transaction_type: TransactionTypeEnum = '',
         start_date: date = '', finish_date: date = '') -> Query:
@@ -98,7 +192,7 @@ class TransactionService:
         # Filter by provider name
         if provider_name != '':
             query = query.join(Transaction.provider).filter(
-                func.lower(Provider.name).contains(provider_name.lower(), autoescape=True)
+                name_search(Provider.name, provider_name)
             )
 
         # Filter by description
@@ -115,22 +209,57 @@ class TransactionService:
 
         # Filter by product name
         if product_name != '':
-            ids = db.query(TransactionProduct).join(TransactionProduct.product).filter(
-                func.lower(Product.name).contains(product_name.lower(), autoescape=True)
-            ).with_entities(
-                TransactionProduct.transaction_id
-            ).all()
-            ids: List[int] = [id[0] for id in ids]
-
             query = query.filter(
-                Transaction.id.in_(ids)
+                self._make_product_name_filter(product_name)
             )
 
         return query
 
+    def _make_record_columns(self, provider: Provider) -> tuple:
+        return (
+            Transaction.id,
+            Transaction.type,
+            Transaction.description,
+            Transaction.date,
+            Transaction.provider_id,
+            provider.name.label('provider_name'),
+            Transaction.created_on,
+            Transaction.updated_on
+        )
+
+    def _make_records_query(self, query: Query) -> Query:
+        # The provider filter may already join the providers table
+        provider = aliased(Provider)
+
+        # Plain rows, nothing is loaded into the session identity map
+        return query.outerjoin(provider, Transaction.provider_id == provider.id).with_entities(
+            *self._make_record_columns(provider)
+        )
+
+    def _make_record_products_select(self, transaction_ids: Union[List[int], Query]) -> Select:
+        return select(
+            TransactionProduct.transaction_id,
+            TransactionProduct.product_id,
+            Product.name.label('product_name'),
+            Product.size.label('product_size'),
+            TransactionProduct.quantity
+        ).join(TransactionProduct.product).where(
+            TransactionProduct.transaction_id.in_(transaction_ids)
+        ).order_by(TransactionProduct.transaction_id, TransactionProduct.id)
+
+    def _make_records(self, transactions: List[Row], products: List[Row]) -> List[dict]:
+        transactions_products: Dict[int, List[Row]] = {}
+        for product in products:
+            transactions_products.setdefault(product.transaction_id, []).append(product)
+
+        return [
+            make_transaction_record(transaction, transactions_products.get(transaction.id, []))
+            for transaction in transactions
+        ]
+
     def fetch_all(self, db: Session, product_name: str = '', provider_name: str = '',
         description: str = '', transaction_type: TransactionTypeEnum = '',
-        start_date: date = None, finish_date: date = None) -> List[TransactionResponse]:
+        start_date: date = None, finish_date: date = None) -> List[dict]:
         """
         Retrieve all transactions records.
 
@@ -147,7 +276,7 @@ class TransactionService:
             ItensNotFound: If no item was found.
 
         Returns:
-            List[TransactionResponse]: A list of dicts with transactions records.
+            List[dict]: The `TransactionResponse` dicts of the transactions records.
         """
         query = self._make_transaction_query_with_filters(
             db,
@@ -158,21 +287,18 @@ class TransactionService:
             start_date,
             finish_date
         )
-        query_result = query.order_by(Transaction.id).options(
-            joinedload(Transaction.products_transaction).options(
-                joinedload(TransactionProduct.product)
-            )
-        ).all()
-        transactions = parse_obj_as(List[TransactionResponse], query_result)
+        transactions = self._make_records_query(query).order_by(Transaction.id).all()
 
         if len(transactions) == 0:
             raise ItensNotFound("No transactions found")
 
-        return transactions
+        # The products of all the filtered transactions, by a semi-join instead of an id list
+        products = db.execute(self._make_record_products_select(query.with_entities(Transaction.id))).all()
+        return self._make_records(transactions, products)
 
     def fetch_all_with_pagination(self, db: Session, page: int, per_page: int = 20, product_name: str = '',
         provider_name: str = '', description: str = '', transaction_type: TransactionTypeEnum = '',
-        start_date: date = None, finish_date: date = None) -> TransactionsResponse:
+        start_date: date = None, finish_date: date = None) -> dict:
         """
         Retrieve all transacions records listed by page argument and pagination metadata.
 
@@ -192,7 +318,7 @@ class TransactionService:
             InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
 
         Returns:
-            TransactionsResponse: A dict with providers records and pagination metadata.
+            dict: The `TransactionsResponse` body, with transactions records and pagination metadata.
         """
         if page <= 0:
             raise InvalidPage(f"Page number should be positive and greater than zero: {page}")
@@ -208,16 +334,19 @@ class TransactionService:
             start_date,
             finish_date
         )
-        query = query.order_by(Transaction.id)
+        query = self._make_records_query(query).order_by(Transaction.id)
 
         query, pagination = apply_pagination(query, page_number=page, page_size=per_page)
-        transactions = parse_obj_as(List[TransactionResponse], query.all())
+        transactions = query.all()
 
         if page > pagination.num_pages and pagination.num_pages > 0:
             raise InvalidPage(f"Page number invalid, the total of pages is {pagination.num_pages}: {page}")
         if len(transactions) == 0:
             raise ItensNotFound("No transactions found")
 
+        # Products of the whole page are loaded by one extra query after the LIMIT
+        products = db.execute(self._make_record_products_select([row.id for row in transactions])).all()
+
         url_args = {
             "product_name": product_name,
             "provider_name": provider_name,
@@ -233,17 +362,189 @@ class TransactionService:
             total_items=pagination.total_results,
             url_args=url_args
         )
-        response = TransactionsResponse(
-            pagination_metadata = pagination_metadata,
-            records = transactions
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": self._make_records(transactions, products)
+        }
+        return response
+
+    def fetch_all_with_cursor(self, db: Session, limit: int = 20, after: str = None, before: str = None,
+        product_name: str = '', provider_name: str = '', description: str = '',
+        transaction_type: TransactionTypeEnum = '', start_date: date = None,
+        finish_date: date = None) -> dict:
+        """
+        Retrieve the transactions records next to a cursor, without counting or offsetting rows.
+
+        Args:
+            db (Session): The database session.
+            limit (int): Amount of transactions per page.
+            after (str): Cursor of the last transaction of the previous page.
+            before (str): Cursor of the first transaction of the next page.
+            product_name (str): Product name to filter.
+            provider_name (str): Provider name to filter.
+            description (str): Description to filter.
+            transaction_type (Enum): Transaction type to filter.
+            start_date (date): Start date to filter.
+            finish_date (date): Finish date to filter.
+
+        Raises:
+            InvalidCursor: If the cursor informed is invalid.
+            ItensNotFound: If no item was found.
+            InvalidPageItemsNumber: Numbers of items per page must be greater than 0.
+
+        Returns:
+            dict: The `TransactionsCursorResponse` body, with transactions records and cursor pagination metadata.
+        """
+        if limit <= 0:
+            raise InvalidPageItemsNumber(f"Numbers of items per page must be greater than zero")
+
+        query = self._make_transaction_query_with_filters(
+            db,
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+        query = self._make_records_query(query)
+
+        transactions, has_previous, has_next = apply_cursor_pagination(query, Transaction.id, limit, after, before)
+        if len(transactions) == 0:
+            raise ItensNotFound("No transactions found")
+
+        products = db.execute(self._make_record_products_select([row.id for row in transactions])).all()
+
+        url_args = {
+            "product_name": product_name,
+            "provider_name": provider_name,
+            "description": description,
+            "transaction_type": transaction_type.value if type(transaction_type) == TransactionTypeEnum else '',
+            "start_date": start_date,
+            "finish_date": finish_date
+        }
+        pagination_metadata = make_cursor_pagination_metadata(
+            first_id=transactions[0].id,
+            last_id=transactions[-1].id,
+            limit=limit,
+            has_previous=has_previous,
+            has_next=has_next,
+            url_args=url_args,
+            after=after,
+            before=before
         )
+        response = {
+            "pagination_metadata": pagination_metadata.dict(),
+            "records": self._make_records(transactions, products)
+        }
         return response
 
-    def _check_provider_existence(self, db: Session, provider_id: int) -> None:
+    def _make_transaction_export_query(self, db: Session, product_name: str = '', provider_name: str = '',
+        description: str = '', transaction_type: TransactionTypeEnum = '',
+        start_date: date = '', finish_date: date = '') -> Query:
+        query = self._make_transaction_query_with_filters(
+            db,
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+
+        # The provider filter may already join the providers table
+        provider = aliased(Provider)
+
+        # One row per transaction product, without loading ORM objects
+        return query.join(Transaction.products_transaction).join(TransactionProduct.product).outerjoin(
+            provider, Transaction.provider_id == provider.id
+        ).with_entities(
+            Transaction.id,
+            Transaction.type,
+            Transaction.description,
+            Transaction.date,
+            Transaction.provider_id,
+            provider.name.label('provider_name'),
+            TransactionProduct.product_id,
+            Product.name.label('product_name'),
+            Product.size.label('product_size'),
+            TransactionProduct.quantity,
+            Transaction.created_on,
+            Transaction.updated_on
+        ).order_by(
+            Transaction.id, TransactionProduct.product_id
+        ).yield_per(EXPORT_BATCH_SIZE)
+
+    def _export_as_ndjson(self, query: Query) -> Iterator[str]:
+        # Rows are ordered by transaction, so each group holds all the products of one transaction
+        for _, rows in groupby(query, key=lambda row: row.id):
+            rows = list(rows)
+            transaction = TransactionResponse(
+                **rows[0]._asdict(),
+                products = [TransactionProductsData(**row._asdict()) for row in rows],
+                metadatetime = MetaDatetimeSchema(**rows[0]._asdict())
+            )
+            yield transaction.json(exclude_none=True) + "\n"
+
+    def _export_as_csv(self, query: Query) -> Iterator[str]:
+        # The writer returns each formatted line instead of writing it to a file
+        writer = csv.writer(_CsvLine())
+
+        yield writer.writerow(EXPORT_CSV_COLUMNS)
+        for row in query:
+            yield writer.writerow([
+                row.type.value if column == 'type' else getattr(row, column)
+                for column in EXPORT_CSV_COLUMNS
+            ])
+
+    def export(self, db: Session, export_format: TransactionExportFormatEnum, product_name: str = '',
+        provider_name: str = '', description: str = '', transaction_type: TransactionTypeEnum = '',
+        start_date: date = '', finish_date: date = '') -> Iterator[str]:
+        """
+        Export the transactions records as NDJSON (one transaction per line)
+        or CSV (one transaction product per line).
+
+        The rows are fetched in batches while the lines are consumed, so the
+        memory used does not grow with the number of transactions.
+
+        Args:
+            db (Session): The database session.
+            export_format (Enum): The export format. (ndjson/csv)
+            product_name (str): Product name to filter.
+            provider_name (str): Provider name to filter.
+            description (str): Description to filter.
+            transaction_type (Enum): Transaction type to filter.
+            start_date (date): Start date to filter. (YYYY-MM-DD)
+            finish_date (date): Finish date to filter. (YYYY-MM-DD)
+
+        Raises:
+            InvalidRangeTime: If the start date is greater than the finish date.
+
+        Returns:
+            Iterator[str]: The exported lines.
+        """
+        # Built before streaming, so the filters errors are raised by the request
+        query = self._make_transaction_export_query(
+            db,
+            product_name,
+            provider_name,
+            description,
+            transaction_type,
+            start_date,
+            finish_date
+        )
+
+        if export_format == TransactionExportFormatEnum.csv:
+            return self._export_as_csv(query)
+
+        return self._export_as_ndjson(query)
+
+    def _check_provider_existence(self, db: Session, provider_id: int) -> Optional[Provider]:
         if provider_id != None:
             provider = db.query(Provider).filter(Provider.id == provider_id).first()
             if provider == None:
-                raise ProviderNotFound(provider.name)
+                raise ProviderNotFound(str(provider_id))
+            return provider
 
     def _sort_by_id_check_and_sum_duplicates(self, payload: List[TransactionProductsData]) -> List[TransactionProductsData]:
         already_added = []
@@ -271,9 +572,7 @@ class TransactionService:
                 invalid_stock_ids.append(value.product_id)
 
         if len(invalid_stock_ids) > 0:
-            raise InvalidStockQuantity(
-                str(invalid_stock_ids)
-            )
+            raise InvalidStockQuantity(invalid_stock_ids)
 
         return products_ids
 
@@ -288,24 +587,10 @@ class TransactionService:
                 invalid_stock_ids.append(value.product_id)
 
         if len(invalid_stock_ids) > 0:
-            raise InvalidStockQuantity(
-                str(invalid_stock_ids)
-            )
+            raise InvalidStockQuantity(invalid_stock_ids)
 
         return products_ids
 
-    def _check_if_stock_has_enough_outgoing_quantity(self, products_found: List[Product], products_payload: List[TransactionProductsData]) -> None:
-        invalid_stock_ids = []
-
-        for p_found, p_payload in zip(products_found, products_payload):
-            if p_payload.quantity > p_found.inventory:
-                invalid_stock_ids.append(p_found.id)
-
-        if len(invalid_stock_ids) > 0:
-            raise NotEnoughStockQuantity(
-                str(invalid_stock_ids)
-            )
-
     def _get_products_from_database(self, db: Session, payload_products_id: List[int]) -> List[Product]:
         products_found = db.query(Product).filter(Product.id.in_(payload_products_id)).order_by(Product.id).all()
 
@@ -324,26 +609,75 @@ class TransactionService:
 
         else:
             return products_found
-    
-    def _update_products_inventory(self, db: Session, products_found: List[Product], products_payload: List[TransactionProductsData]) -> None:
-        dict_products = []
-        for p_found, p_payload in zip(products_found, products_payload):
-            p_found.inventory = p_found.inventory + p_payload.quantity
-            
-            dict_products.append(p_found.__dict__)
-        
-        db.bulk_update_mappings(Product, dict_products)
-        db.commit()
 
-    def _update_products_inventory_outgoing(self, db: Session, products_found: List[Product], products_payload: List[TransactionProductsData]) -> None:
-        dict_products = []
-        for p_found, p_payload in zip(products_found, products_payload):
-            p_found.inventory = p_found.inventory - p_payload.quantity
-            
-            dict_products.append(p_found.__dict__)
-        
-        db.bulk_update_mappings(Product, dict_products)
-        db.commit()
+    def _make_inventory_update(self, product_id: int, delta: int) -> Update:
+        statement = update(Product).where(Product.id == product_id).values(
+            inventory = Product.inventory + delta
+        )
+
+        # The stock is checked by the same statement that decrements it
+        if delta < 0:
+            statement = statement.where(Product.inventory >= -delta)
+
+        return statement.execution_options(synchronize_session=False)
+
+    def _update_products_inventory(self, db: Session, products_payload: List[TransactionProductsData], outgoing: bool = False) -> List[int]:
+        not_updated_ids = []
+
+        # The payload is sorted by id, so concurrent transactions lock the rows in the same order
+        for p_payload in products_payload:
+            delta = -p_payload.quantity if outgoing else p_payload.quantity
+            result = db.execute(self._make_inventory_update(p_payload.product_id, delta))
+            if result.rowcount == 0:
+                not_updated_ids.append(p_payload.product_id)
+
+        return not_updated_ids
+
+    def _raise_inventory_update_error(self, db: Session, not_updated_ids: List[int]) -> None:
+        # Raises for the missing products, the remaining ones did not have enough stock
+        self._get_products_from_database(db, list(not_updated_ids))
+
+        raise NotEnoughStockQuantity(not_updated_ids)
+
+    def _make_snapshot_deltas(self, day: date, products_payload: List[TransactionProductsData],
+        outgoing: bool) -> Dict[Tuple[int, date], int]:
+        sign = -1 if outgoing else 1
+        return {
+            (p_payload.product_id, day): sign * p_payload.quantity
+            for p_payload in products_payload
+        }
+
+    def _make_movement(self, transaction_create: Transaction,
+        checked_products: List[TransactionProductsData]) -> Movement:
+        return Movement(
+            date = transaction_create.date,
+            type = transaction_create.type,
+            provider_id = transaction_create.provider_id,
+            products = {p_payload.product_id: p_payload.quantity for p_payload in checked_products}
+        )
+
+    def _make_transaction_create(self, user: User,
+        transaction: Union[IncomingTransactionCreate, OutgoingTransactionCreate],
+        checked_products: List[TransactionProductsData]) -> Transaction:
+        exclude = {'products'}
+        if transaction.type == TransactionTypeEnum.outgoing:
+            exclude.add('provider_id')
+
+        # Creates the record of the current transaction
+        transaction_create = Transaction(
+            **transaction.dict(exclude_unset=True, exclude=exclude)
+        )
+        transaction_create.created_by = user.id
+
+        # Creates product transactions records
+        transaction_create.products_transaction = [
+            TransactionProduct(
+                quantity = product.quantity,
+                product_id = product.product_id
+            ) 
+            for product in checked_products
+        ]
+        return transaction_create
     
     def create(self, db: Session, user: User,
         transaction: Union[IncomingTransactionCreate, 
@@ -351,83 +685,254 @@ class TransactionService:
         """
         Creates a incoming or an outgoing transaction.
 
+        The products stock is changed by conditional updates, so concurrent
+        outgoing transactions can not take more than the available stock.
+        The transaction, its products and the stock changes are stored in a
+        single commit.
+
         Args:
             db (Session): The database session.
             user (User): The user model.
             transaction (IncomingTransactionCreate or OutgoingTransactionCreate): The incoming or outgoing transaction create model.
 
+        Raises:
+            ProductsNotFound: If the transaction has no products.
+            InvalidStockQuantity: If some product quantity is not greater than zero.
+            ProviderNotFound: If the provider was not found.
+            ItensNotFound: If some product was not found.
+            NotEnoughStockQuantity: If some product has not enough stock to outgoing.
+
         Returns:
             TransactionResponse: The provider response model.
         """
         if len(transaction.products) == 0:
             raise ProductsNotFound("Empty transaction products")
 
-        if transaction.type == TransactionTypeEnum.incoming:
-            self._check_provider_existence(db, transaction.provider_id)
+        checked_products = self._sort_by_id_check_and_sum_duplicates(transaction.products)
+        self._check_if_products_payload_is_greater_than_zero(checked_products)
 
-            checked_products = self._sort_by_id_check_and_sum_duplicates(transaction.products)
-            products_ids = self._check_if_products_payload_is_greater_than_zero(checked_products)
+        provider = None
+        if transaction.type == TransactionTypeEnum.incoming:
+            provider = self._check_provider_existence(db, transaction.provider_id)
+
+        transaction_create = self._make_transaction_create(user, transaction, checked_products)
+        # Already loaded, the response shows its name
+        transaction_create.provider = provider
+        outgoing = transaction.type == TransactionTypeEnum.outgoing
+
+        try:
+            # Increments or decrements products stock
+            not_updated_ids = self._update_products_inventory(db, checked_products, outgoing)
+            if len(not_updated_ids) == 0:
+                db.add(transaction_create)
+                db.flush()
+                self.inventory_snapshots.apply_deltas(
+                    db, self._make_snapshot_deltas(transaction.date, checked_products, outgoing)
+                )
+                self.reports.apply_movements(db, [self._make_movement(transaction_create, checked_products)])
+                db.commit()
+        except:
+            db.rollback()
+            raise
+
+        if len(not_updated_ids) > 0:
+            db.rollback()
+            self._raise_inventory_update_error(db, not_updated_ids)
+
+        record_transaction(transaction.type, checked_products)
+
+        # The transaction values are already loaded, only its products names are selected
+        products = db.execute(self._make_record_products_select([transaction_create.id])).all()
+        return TransactionResponse.parse_obj(make_transaction_record(transaction_create, products))
+
+    def _parse_import_item(self, item: dict) -> Union[IncomingTransactionCreate, OutgoingTransactionCreate]:
+        if isinstance(item, dict) and item.get('type') == TransactionTypeEnum.outgoing.value:
+            return OutgoingTransactionCreate.parse_obj(item)
+
+        return IncomingTransactionCreate.parse_obj(item)
+
+    def _make_products_missing(self, products_found: Dict[int, Product], inventory: Dict[int, int],
+        err: Union[InvalidStockQuantity, NotEnoughStockQuantity]) -> List[dict]:
+        return [
+            {
+                "id": id,
+                "name": products_found[id].name,
+                "inventory": inventory[id]
+            }
+            for id in err.products_ids if id in products_found
+        ]
+
+    def _make_import_error(self, index: int, err: Exception, products_found: Dict[int, Product],
+        inventory: Dict[int, int]) -> TransactionImportItemResult:
+        # Same status codes and messages of the single transaction endpoints
+        if isinstance(err, ValidationError):
+            status_code, detail = 422, err.errors()
+        elif isinstance(err, ProductsNotFound):
+            status_code, detail = 400, "A movimentação a ser registrada deve conter no minimo um produto."
+        elif isinstance(err, ItensNotFound):
+            status_code, detail = 404, f"Os seguintes produtos não foram encontrados no sistema: {str(err)}"
+        elif isinstance(err, ProviderNotFound):
+            status_code, detail = 404, f"O fornecedor informado não foi encontrado: {str(err)}"
+        elif isinstance(err, InvalidStockQuantity):
+            status_code, detail = 400, {
+                "message": "A quantidade informada para os seguintes produtos deve ser maior do que zero.",
+                "products_missing": self._make_products_missing(products_found, inventory, err)
+            }
+        else:
+            status_code, detail = 422, {
+                "message": "Os produtos informados não possuem quantidade em estoque suficiente para a saída.",
+                "products_missing": self._make_products_missing(products_found, inventory, err)
+            }
 
-            # Updates products inventory quantity
-            products_to_update = self._get_products_from_database(db, products_ids)
+        return TransactionImportItemResult(index=index, status_code=status_code, detail=detail)
 
-            # Creates the record of the current transaction
-            transaction_create = Transaction(
-                **transaction.dict(exclude_unset=True, exclude={'products'})
-            )
-            transaction_create.created_by = user.id
+    def _check_import_item(self, transaction: Union[IncomingTransactionCreate, OutgoingTransactionCreate],
+        products_found: Dict[int, Product], providers_ids: Set[int], inventory: Dict[int, int]) -> List[TransactionProductsData]:
+        if len(transaction.products) == 0:
+            raise ProductsNotFound("Empty transaction products")
 
-            # Creates product transactions records
-            products_transaction = [
-                TransactionProduct(
-                    quantity = product.quantity,
-                    product_id = product.product_id
-                ) 
-                for product in checked_products
-            ]
-            transaction_create.products_transaction = products_transaction
-            transaction = transaction_create.insert(db)
+        checked_products = self._sort_by_id_check_and_sum_duplicates(transaction.products)
+        products_ids = self._check_if_products_payload_is_greater_than_zero(checked_products)
 
-            # Increments products stock
-            self._update_products_inventory(db, products_to_update, checked_products)
+        missing_ids = [id for id in products_ids if id not in products_found]
+        if len(missing_ids) > 0:
+            raise ItensNotFound(str(missing_ids))
 
+        if transaction.type == TransactionTypeEnum.incoming:
+            if transaction.provider_id != None and transaction.provider_id not in providers_ids:
+                raise ProviderNotFound(str(transaction.provider_id))
 
         elif transaction.type == TransactionTypeEnum.outgoing:
-            checked_products = self._sort_by_id_check_and_sum_duplicates(transaction.products)
-            products_ids = self._check_if_products_payload_is_greater_than_zero(checked_products)
+            # Previous items of the batch already changed the stock
+            invalid_stock_ids = [
+                p_payload.product_id for p_payload in checked_products
+                if p_payload.quantity > inventory[p_payload.product_id]
+            ]
+            if len(invalid_stock_ids) > 0:
+                raise NotEnoughStockQuantity(invalid_stock_ids)
 
-            # Get products inventory
-            products_to_update = self._get_products_from_database(db, products_ids)
-            
-            # Check if stock has enough quantity to outgoing
-            self._check_if_stock_has_enough_outgoing_quantity(products_to_update, checked_products)
+        return checked_products
 
-            # Creates the record of the current transaction
-            transaction_create = Transaction(
-                **transaction.dict(exclude_unset=True, exclude={'products', 'provider_id'})
-            )
-            transaction_create.created_by = user.id
+    def import_transactions(self, db: Session, user: User, payload: List[dict]) -> TransactionImportResponse:
+        """
+        Creates a batch of incoming and outgoing transactions.
 
-            # Creates product transactions records
-            products_transaction = [
-                TransactionProduct(
-                    quantity = product.quantity,
-                    product_id = product.product_id
-                ) 
-                for product in checked_products
-            ]
-            transaction_create.products_transaction = products_transaction
-            transaction = transaction_create.insert(db)
+        Each item is validated as the single transaction endpoints do, against
+        the stock left by the previous items. Rejected items are reported and
+        skipped, the accepted ones are stored in a single commit.
 
-            # Decrements products stock
-            self._update_products_inventory_outgoing(db, products_to_update, checked_products)
+        Args:
+            db (Session): The database session.
+            user (User): The user model.
+            payload (List[dict]): The incoming or outgoing transactions to create.
 
+        Raises:
+            NotEnoughStockQuantity: If the stock changed while the batch was stored, nothing is stored.
 
-        # transaction = self.fetch_one(db, transaction.id)
-        return TransactionResponse.from_orm(transaction)
+        Returns:
+            TransactionImportResponse: The created and rejected counts, and the result of each item.
+        """
+        results: List[TransactionImportItemResult] = [None] * len(payload)
+        transactions = []
+
+        for index, item in enumerate(payload):
+            try:
+                transactions.append((index, self._parse_import_item(item)))
+            except ValidationError as err:
+                results[index] = self._make_import_error(index, err, {}, {})
+
+        # Validates all the products and providers of the batch with one query each
+        products_ids = {p.product_id for _, transaction in transactions for p in transaction.products}
+        providers_ids = {
+            transaction.provider_id for _, transaction in transactions
+            if transaction.type == TransactionTypeEnum.incoming and transaction.provider_id != None
+        }
+        products_found = {
+            product.id: product
+            for product in db.query(Product).filter(
+                Product.id.in_(products_ids)
+            ).order_by(Product.id).with_for_update().all()
+        }
+        providers_ids = {
+            provider_id for provider_id, in db.query(Provider.id).filter(Provider.id.in_(providers_ids))
+        }
+        inventory = {id: product.inventory for id, product in products_found.items()}
+
+        # Aggregates the stock changes of the accepted items per product
+        deltas: Dict[int, int] = {}
+        snapshot_deltas: Dict[Tuple[int, date], int] = {}
+        accepted = []
+        for index, transaction in transactions:
+            try:
+                checked_products = self._check_import_item(transaction, products_found, providers_ids, inventory)
+            except (ProductsNotFound, InvalidStockQuantity, ItensNotFound,
+                    ProviderNotFound, NotEnoughStockQuantity) as err:
+                results[index] = self._make_import_error(index, err, products_found, inventory)
+                continue
+
+            sign = -1 if transaction.type == TransactionTypeEnum.outgoing else 1
+            for p_payload in checked_products:
+                inventory[p_payload.product_id] += sign * p_payload.quantity
+                deltas[p_payload.product_id] = deltas.get(p_payload.product_id, 0) + sign * p_payload.quantity
+
+                key = (p_payload.product_id, transaction.date)
+                snapshot_deltas[key] = snapshot_deltas.get(key, 0) + sign * p_payload.quantity
+
+            accepted.append((index, self._make_transaction_create(user, transaction, []), checked_products))
+
+        try:
+            # Rows are updated in id order, as on the single transaction creation
+            not_updated_ids = []
+            for product_id in sorted(deltas):
+                if deltas[product_id] == 0:
+                    continue
+                result = db.execute(self._make_inventory_update(product_id, deltas[product_id]))
+                if result.rowcount == 0:
+                    not_updated_ids.append(product_id)
+
+            if len(not_updated_ids) > 0:
+                raise NotEnoughStockQuantity(not_updated_ids)
+
+            db.add_all([transaction_create for _, transaction_create, _ in accepted])
+            db.flush()
+            created_ids = [(index, transaction_create.id) for index, transaction_create, _ in accepted]
+
+            # Products of all transactions are inserted by a single executemany
+            products_transaction = [
+                {
+                    "transaction_id": transaction_create.id,
+                    "product_id": p_payload.product_id,
+                    "quantity": p_payload.quantity
+                }
+                for _, transaction_create, checked_products in accepted
+                for p_payload in checked_products
+            ]
+            if len(products_transaction) > 0:
+                db.execute(insert(TransactionProduct), products_transaction)
+
+            self.inventory_snapshots.apply_deltas(db, snapshot_deltas)
+            self.reports.apply_movements(db, [
+                self._make_movement(transaction_create, checked_products)
+                for _, transaction_create, checked_products in accepted
+            ])
+            db.commit()
+        except:
+            db.rollback()
+            raise
+
+        for _, transaction_create, checked_products in accepted:
+            record_transaction(transaction_create.type, checked_products)
+
+        for index, transaction_id in created_ids:
+            results[index] = TransactionImportItemResult(index=index, status_code=201, id=transaction_id)
+
+        return TransactionImportResponse(
+            created = len(accepted),
+            rejected = len(payload) - len(accepted),
+            results = results
+        )
 
-    def make_response(self, db: Session, err: str):
-        products_ids: List[int] = eval(err)
+    def make_response(self, db: Session, products_ids: List[int]):
         products = db.query(Product).filter(Product.id.in_(products_ids)).all()
         
         data = []
@@ -10,6 +10,9 @@ from ...db.base import BaseMixin
 class TransactionProduct(BaseMixin, Base):
     __tablename__ = 'base_transactions_products'
 
+    # Its timestamps are not part of any response, there is no need to fetch them
+    __mapper_args__ = {'eager_defaults': False}
+
     id = db.Column(db.Integer, primary_key=True)
     quantity = db.Column(db.Integer, nullable=False)
 
@@ -32,4 +35,6 @@ class TransactionProduct(BaseMixin, Base):
     # Define Indexes
     __table_args__ = (
         db.Index('combined_single_value', transaction_id, product_id),
+        # Transactions of a product, `combined_single_value` only starts with the transaction
+        db.Index('ix_base_transactions_products_product_id', product_id),
     )
\ No newline at end of file
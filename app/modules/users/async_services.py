@@ -0,0 +1,125 @@
+# Standard Imports
+from time import time as timestamp
+from sqlalchemy import and_, select
+
+# Typing Imports
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Authenticated users cache
+from app.core.auth import invalidate_user
+
+# User Model and Schemas
+from .models import User
+from .schemas import UserCreate
+from .schemas import UserUpdate
+from .schemas import UserResponse
+
+
+class AsyncUserService:
+    async def _get_user(self, db: AsyncSession, id: int) -> User:
+        result = await db.execute(select(User).filter(and_(
+            User.id == id,
+            User.is_deleted == False
+        )))
+        return result.scalars().first()
+
+    async def fetch_all(self, db: AsyncSession, only_admin=False) -> List[UserResponse]:
+        """
+        Retrieve a list of users.
+
+        Args:
+            db (AsyncSession): The async database session.
+
+        Returns:
+            List[UserResponse]: A List of users response models.
+        """
+        users = select(User).filter(
+            User.is_deleted == False
+        )
+
+        if only_admin == True:
+            users = users.filter(User.admin == True)
+
+        result = await db.execute(users)
+        return result.scalars().all()
+
+    async def fetch(self, db: AsyncSession, id: int) -> UserResponse:
+        """
+        Retrieve one user.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The user ID.
+
+        Returns:
+            UserResponse: The user response model.
+        """
+        return await self._get_user(db, id)
+
+    async def create(self, db: AsyncSession, user: UserCreate) -> UserResponse:
+        """
+        Creates an user.
+
+        Args:
+            db (AsyncSession): The async database session.
+            user (UserCreate): The user create model.
+
+        Returns:
+            UserResponse: The user response model.
+        """
+        user_create = User(**user.dict())
+        user_create.hash_password()
+        user = await user_create.insert_async(db)
+
+        return UserResponse.from_orm(user)
+
+    async def update(self, db: AsyncSession, id: int, user: UserUpdate) -> UserResponse:
+        """
+        Edits an user by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The user ID.
+            user (UserUpdate): The user update model.
+
+        Returns:
+            UserResponse: The User Response model.
+        """
+        db_user = await self._get_user(db, id)
+        if not db_user:
+            return None
+
+        if user.password != None:
+            db_user.password = user.password
+            db_user.hash_password()
+            user.password = db_user.password
+
+        # A new token version revokes the tokens issued before the edit
+        await db_user.update_async(db, token_version=db_user.token_version + 1, **user.dict(exclude_unset=True))
+        # Dropped after the commit, a request loading it meanwhile would cache the old row again
+        invalidate_user(db_user.email)
+        new_user = UserResponse.from_orm(db_user)
+        return new_user
+
+    async def delete(self, db: AsyncSession, id: int) -> UserResponse:
+        """
+        Deletes an user by id.
+
+        Args:
+            db (AsyncSession): The async database session.
+            id (int): The user ID.
+
+        Returns:
+            UserResponse: The User Response model.
+        """
+        db_user = await self._get_user(db, id)
+        if not db_user:
+            return None
+
+        email = db_user.email
+        await db_user.update_async(db, is_deleted=True, email=f'{timestamp()}_{email}',
+            token_version=db_user.token_version + 1)
+        invalidate_user(email)
+        db_user = UserResponse.from_orm(db_user)
+        return db_user
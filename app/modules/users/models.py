@@ -1,10 +1,11 @@
 import sqlalchemy as db
 
 from sqlalchemy.orm import relationship
-from passlib.hash import pbkdf2_sha256
 
 from ...db.engine import Base
 from ...db.base import BaseMixin
+from ...db.base import active_rows_index
+from ...core.passwords import password_hasher
 
 
 class User(BaseMixin, Base):
@@ -18,15 +19,22 @@ class User(BaseMixin, Base):
 
     admin = db.Column("is_admin", db.Boolean, default=False)
     is_deleted = db.Column(db.Boolean, default=False)
+    # Raised by every edit, the stateless tokens of older versions are revoked
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     products_created = relationship("Product", lazy="select", back_populates="user")
     providers_created = relationship("Provider", lazy="select", back_populates="user")
     transactions = relationship("Transaction", lazy="select", back_populates="user")
+
+    # Define Indexes
+    __table_args__ = (
+        active_rows_index('ix_base_users_active_id', is_deleted, id),
+    )
     
 
     def hash_password(self) -> None:
-        self.password = pbkdf2_sha256.hash(self.password)
+        self.password = password_hasher.hash(self.password)
 
     def verify_password(self, password: str) -> bool:
-        return pbkdf2_sha256.verify(password, self.password)
\ No newline at end of file
+        return password_hasher.verify(password, self.password)
\ No newline at end of file
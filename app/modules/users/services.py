@@ -6,6 +6,9 @@ from sqlalchemy.sql.expression import and_
 from typing import List
 from sqlalchemy.orm import Session
 
+# Authenticated users cache
+from app.core.auth import invalidate_user
+
 # User Model and Schemas
 from .models import User
 from .schemas import UserCreate
@@ -91,7 +94,10 @@ class UserService:
             db_user.hash_password()
             user.password = db_user.password
 
-        db_user.update(db, **user.dict(exclude_unset=True))
+        # A new token version revokes the tokens issued before the edit
+        db_user.update(db, token_version=db_user.token_version + 1, **user.dict(exclude_unset=True))
+        # Dropped after the commit, a request loading it meanwhile would cache the old row again
+        invalidate_user(db_user.email)
         new_user = UserResponse.from_orm(db_user)
         return new_user
 
@@ -112,6 +118,9 @@ class UserService:
         if not db_user:
             return None
 
-        db_user.update(db, is_deleted=True, email=f'{timestamp()}_{db_user.email}')
+        email = db_user.email
+        db_user.update(db, is_deleted=True, email=f'{timestamp()}_{email}',
+            token_version=db_user.token_version + 1)
+        invalidate_user(email)
         db_user = UserResponse.from_orm(db_user)
         return db_user
\ No newline at end of file
@@ -1,11 +1,23 @@
 # Framework imports
 from fastapi import APIRouter
+from fastapi import Response
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 # Prefix Import
 from . import API_PREFIX
 
-from .db.engine import create_all
-from .db.engine import drop_all
+from .db.engine import engine
+from .db.async_engine import AsyncSessionLocal
+from .db.pool import checkout_latency
+from .db.pool import get_pool_status
+from .core.auth import user_cache
+from .core.metrics import CONTENT_TYPE
+from .core.metrics import collect_metrics
+from .core.passwords import password_hasher
+from .core.tokens import token_versions
+from .utils.query_cache import query_cache
 
 route = APIRouter()
 
@@ -21,13 +33,66 @@ def health_check():
     return {"message": "Health check ok."}
 
 
-@route.get("/create-all")
-def create_all_tables():
-    create_all()
-    return {"message": "All tables created."}
+@route.get("/health/database")
+def database_health_check(response: Response):
+    """
+    ## Database connectivity and connection pool diagnostics.
 
+    ### Returns:  
+      >  dict: Pool connection counters and the checkout latency histogram (seconds).
+    """
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        database = "ok"
+    except SQLAlchemyError:
+        response.status_code = 503
+        database = "unavailable"
 
-@route.get("/drop-all")
-def drop_all_content_on_database():
-    drop_all()
-    return {"message": "Database dropped."}
+    return {
+        "database": database,
+        "pool": get_pool_status(engine),
+        "async_pool": get_pool_status(AsyncSessionLocal.kw['bind'].sync_engine) if AsyncSessionLocal else None,
+        "checkout_latency": checkout_latency.snapshot()
+    }
+
+
+@route.get("/health/cache")
+def cache_health_check():
+    """
+    ## In-process and query caches counters.
+
+    ### Returns:  
+      >  dict: Hits, misses, evictions and hit ratio of the list endpoints cache and of the authenticated users cache.
+    """
+    return {
+        "query_cache": query_cache.stats(),
+        "user_cache": user_cache.stats()
+    }
+
+
+@route.get("/health/auth")
+def auth_health_check():
+    """
+    ## Password hasher and stateless tokens counters.
+
+    ### Returns:  
+      >  dict: The hashing scheme, the hasher threads usage, the rejected logins, the rehashed passwords and the verification latency histogram (seconds).  
+      >  The users in the token versions map and its reloads.
+    """
+    return {
+        "password_hasher": password_hasher.stats(),
+        "token_versions": token_versions.stats()
+    }
+
+
+@route.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    ## Prometheus metrics of all the workers.
+
+    ### Returns:  
+      >  text: Requests latency histograms and counters by route, requests in flight and SQL statements by route.  
+      >  Threadpools usage, database pools, caches hits and misses, transactions created and units moved by type.
+    """
+    return PlainTextResponse(collect_metrics(), media_type=CONTENT_TYPE)
@@ -1,3 +1,7 @@
+# Typing Imports
+from typing import List
+
+
 class ProviderNotFound(Exception):
     pass
 
@@ -11,10 +15,21 @@ class InvalidPageItemsNumber(Exception):
     pass
 
 class InvalidStockQuantity(Exception):
-    pass
+    def __init__(self, products_ids: List[int]):
+        super().__init__(str(products_ids))
+        self.products_ids = products_ids
 
 class NotEnoughStockQuantity(Exception):
-    pass
+    def __init__(self, products_ids: List[int]):
+        super().__init__(str(products_ids))
+        self.products_ids = products_ids
 
 class InvalidRangeTime(Exception):
     pass
+
+class InvalidCursor(Exception):
+    pass
+
+
+class PasswordHasherBusy(Exception):
+    pass
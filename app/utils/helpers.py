@@ -1,6 +1,10 @@
+from hashlib import sha1
 from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime
+from fastapi import Response
+
+from ..core.config import HTTP_CACHE_CONTROL
 
 
 
@@ -15,3 +19,45 @@ class BaseSchema(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+def make_metadatetime(row) -> dict:
+    """
+    Make the `MetaDatetimeSchema` dict of a model or row, without validating it.
+    """
+    return {"created_on": row.created_on, "updated_on": row.updated_on}
+
+
+def make_etag(*values) -> str:
+    """
+    Make a strong ETag from the values that identify a resource version.
+
+    Example:
+        input: (1, datetime(2020, 1, 1))
+        output: '"44db6ab91006fbdf"'
+    """
+    version = ":".join(str(value) for value in values)
+    return '"' + sha1(version.encode()).hexdigest()[:16] + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an `If-None-Match` request header against the current ETag.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+def not_modified(response: Response, if_none_match: Optional[str], etag: str,
+    cache_control: str = HTTP_CACHE_CONTROL) -> Optional[Response]:
+    """
+    Set the `ETag` and `Cache-Control` headers of a read endpoint response.
+
+    Returns:
+        Response: An empty 304 response if the client copy is still valid, None otherwise.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    response.headers.update(headers)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return None
@@ -0,0 +1,366 @@
+# Standard Imports
+import os
+import json
+from time import time
+from uuid import uuid4
+from bisect import bisect_left
+from threading import Event, Lock, Thread
+
+# Typing Imports
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Default latency buckets, in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Thread safe histogram with fixed upper bounds, cumulative like Prometheus.
+    """
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """
+        Current histogram values.
+
+        Returns:
+            dict: Cumulative counts per upper bound ("+Inf" included), sum and count.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+
+        return {
+            "buckets": buckets,
+            "sum": total_sum,
+            "count": total_count
+        }
+
+
+class Counter:
+    """
+    Thread safe counters, one per combination of label values.
+    """
+    def __init__(self, labels: Sequence[str] = ()):
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = Lock()
+
+    def inc(self, *values: str, amount: float = 1) -> None:
+        """
+        Add to the counter of the label values, in the `labels` order.
+        """
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + amount
+
+    def snapshot(self) -> List[Tuple[dict, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labels, values)), value) for values, value in items]
+
+
+class Gauge(Counter):
+    """
+    Thread safe values that go up and down, one per combination of label values.
+    """
+    def dec(self, *values: str, amount: float = 1) -> None:
+        self.inc(*values, amount=-amount)
+
+
+class HistogramGroup:
+    """
+    Histograms with the same buckets, one per combination of label values.
+    """
+    def __init__(self, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.labels = tuple(labels)
+        self.buckets = buckets
+        self._histograms: Dict[Tuple[str, ...], Histogram] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *values: str) -> None:
+        """
+        Record one observation on the histogram of the label values, in the `labels` order.
+        """
+        histogram = self._histograms.get(values)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(values, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def snapshot(self) -> List[Tuple[dict, dict]]:
+        with self._lock:
+            items = list(self._histograms.items())
+        return [(dict(zip(self.labels, values)), histogram.snapshot()) for values, histogram in items]
+
+
+# A collected value: metric name, labels and value (a `Histogram.snapshot` for histograms)
+Sample = Tuple[str, dict, Any]
+
+
+class MetricsRegistry:
+    """
+    Metrics of the process, collected as plain values to be merged with
+    the other workers ones and exposed in the Prometheus text format.
+
+    Counters and histograms are updated where things happen. Values owned
+    by other objects (pools, caches) are read by the collectors on each
+    collection, so they cost nothing to the requests.
+    """
+    def __init__(self):
+        self._descriptions: Dict[str, Tuple[str, str]] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+
+    def describe(self, name: str, type: str, documentation: str) -> None:
+        """
+        Declare a metric, its type is "counter", "gauge" or "histogram".
+        """
+        self._descriptions[name] = (type, documentation)
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        self._collectors.append(collector)
+
+    def _add_metric(self, name: str, type: str, documentation: str, metric: Any) -> Any:
+        self.describe(name, type, documentation)
+        self.add_collector(lambda: [(name, labels, value) for labels, value in metric.snapshot()])
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._add_metric(name, "counter", documentation, Counter(labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._add_metric(name, "gauge", documentation, Gauge(labels))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS) -> HistogramGroup:
+        return self._add_metric(name, "histogram", documentation, HistogramGroup(labels, buckets))
+
+    def snapshot(self) -> dict:
+        """
+        Current values of all the metrics.
+
+        Returns:
+            dict: The type, documentation and samples (labels and value) of each metric, by name.
+        """
+        metrics = {
+            name: {"type": type, "help": documentation, "samples": []}
+            for name, (type, documentation) in self._descriptions.items()
+        }
+        for collector in self._collectors:
+            for name, labels, value in collector():
+                metrics[name]["samples"].append([labels, value])
+        return metrics
+
+
+def merge_snapshots(snapshots: Iterable[Tuple[dict, bool]]) -> dict:
+    """
+    Sum the snapshots of several processes, sample by sample.
+
+    Counters and histograms of stopped processes are kept, so the totals
+    never go down. Their gauges are left out.
+
+    Args:
+        snapshots (Iterable): The `MetricsRegistry.snapshot` of each process, and whether it is running.
+
+    Returns:
+        dict: The merged snapshot.
+    """
+    merged: Dict[str, dict] = {}
+    for snapshot, running in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {"type": metric["type"], "help": metric["help"], "samples": {}})
+            if metric["type"] == "gauge" and not running:
+                continue
+
+            for labels, value in metric["samples"]:
+                key = tuple(sorted(labels.items()))
+                current = target["samples"].get(key)
+                if current is None:
+                    target["samples"][key] = value
+                elif metric["type"] == "histogram":
+                    target["samples"][key] = {
+                        "buckets": {bound: count + value["buckets"].get(bound, 0) for bound, count in current["buckets"].items()},
+                        "sum": current["sum"] + value["sum"],
+                        "count": current["count"] + value["count"]
+                    }
+                else:
+                    target["samples"][key] = current + value
+
+    for metric in merged.values():
+        metric["samples"] = [[dict(key), value] for key, value in metric["samples"].items()]
+    return merged
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_snapshot(snapshot: dict) -> str:
+    """
+    Write a snapshot in the Prometheus text exposition format (version 0.0.4).
+    """
+    lines = []
+    for name, metric in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for labels, value in metric["samples"]:
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+
+            for bound, count in value["buckets"].items():
+                lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {value['sum']}")
+            lines.append(f"{name}_count{_format_labels(labels)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsFiles:
+    """
+    Share the metrics of the worker processes through a directory.
+
+    Each worker writes its snapshot to `metrics-<pid>-<token>.json` every
+    `interval` seconds, from a background thread. The worker answering a
+    scrape merges its current values with the files of the others, so their
+    values are at most `interval` seconds old. The directory must be emptied
+    before the workers start, files of previous runs would add to the counters.
+
+    The random token keeps a restarted worker that got a recycled pid from
+    replacing the file of the stopped one, which would make the counters go
+    down. Of the files sharing a pid, only the last started can be running.
+    """
+    def __init__(self, registry: MetricsRegistry, directory: str, interval: float = 5.0):
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self.errors = 0
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+        self._pid: Optional[int] = None
+        self._started = 0.0
+        self._filename = ""
+
+    def _path(self) -> str:
+        # Named again in a forked process
+        pid = os.getpid()
+        if self._pid != pid:
+            self._pid, self._started = pid, time()
+            self._filename = f"metrics-{pid}-{uuid4().hex[:8]}.json"
+        return os.path.join(self.directory, self._filename)
+
+    def write(self, running: bool = True) -> None:
+        """
+        Write the snapshot of this process, replacing the previous one at once.
+        """
+        path = self._path()
+        with open(path + ".tmp", "w") as file:
+            json.dump({
+                "pid": self._pid,
+                "started": self._started,
+                "running": running,
+                "metrics": self.registry.snapshot()
+            }, file)
+        os.replace(path + ".tmp", path)
+
+    def _is_running(self, pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def read(self) -> List[Tuple[dict, bool]]:
+        """
+        Snapshots written by the other processes, and whether they are running.
+        """
+        self._path()
+        contents = []
+        for filename in os.listdir(self.directory):
+            if not (filename.startswith("metrics-") and filename.endswith(".json")) or filename == self._filename:
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as file:
+                    contents.append(json.load(file))
+            except (OSError, ValueError):
+                continue
+
+        # A pid is held by the last process started with it
+        last_started = {self._pid: self._started}
+        for content in contents:
+            if content["started"] > last_started.get(content["pid"], 0):
+                last_started[content["pid"]] = content["started"]
+        return [(
+            content["metrics"],
+            content["running"] and content["started"] == last_started[content["pid"]] and self._is_running(content["pid"])
+        ) for content in contents]
+
+    def collect(self) -> dict:
+        """
+        The metrics of all the processes, current ones for this process.
+        """
+        return merge_snapshots([(self.registry.snapshot(), True)] + self.read())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                self.errors += 1
+
+    def start(self) -> None:
+        """
+        Write the snapshot now and then every `interval` seconds in the background.
+        """
+        with self._lock:
+            if self._thread is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self.write()
+                self._stop.clear()
+                self._thread = Thread(target=self._run, name="metrics-files", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+            # The counters stay in the totals, the gauges are left out
+            self.write(running=False)
+
+
+registry = MetricsRegistry()
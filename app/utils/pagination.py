@@ -1,6 +1,24 @@
+# Standard imports
+from math import ceil
+from binascii import Error as DecodeError
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import namedtuple
+from sqlalchemy import func, select
+
 # Typing imports
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
+from sqlalchemy.sql import Select
+from sqlalchemy.orm import Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+# Exception imports
+from .exceptions import InvalidCursor
+
 
+# Greatest id of a cursor, the 64 bits integer limit
+MAX_CURSOR_ID = 2 ** 63
 
 
 class PaginationLinksSchema(BaseModel):
@@ -48,6 +66,67 @@ class PaginationMetadataSchema(BaseModel):
         }
 
 
+class CursorPaginationLinksSchema(BaseModel):
+    current: str
+    previous: Optional[str]
+    next: Optional[str]
+
+    class Config:
+        orm_mode = True
+        schema_extra = {
+            "example": {
+                "current": "cursor?limit=20&after=aWQ6NDA&name=test",
+                "previous": "cursor?limit=20&before=aWQ6NDE&name=test",
+                "next": "cursor?limit=20&after=aWQ6NjA&name=test"
+            }
+        }
+
+class CursorPaginationMetadataSchema(BaseModel):
+    limit: int
+    previous_cursor: Optional[str]
+    next_cursor: Optional[str]
+    links: CursorPaginationLinksSchema
+
+    class Config:
+        orm_mode = True
+        schema_extra = {
+            "example": {
+                "limit": 20,
+                "previous_cursor": "aWQ6NDE",
+                "next_cursor": "aWQ6NjA",
+                "links": {
+                    "current": "cursor?limit=20&after=aWQ6NDA&name=test",
+                    "previous": "cursor?limit=20&before=aWQ6NDE&name=test",
+                    "next": "cursor?limit=20&after=aWQ6NjA&name=test"
+                }
+            }
+        }
+
+
+Pagination = namedtuple('Pagination', ['page_number', 'page_size', 'num_pages', 'total_results'])
+
+
+async def apply_pagination_async(db: AsyncSession, query: Select, page_number: int, page_size: int):
+    """
+    Async counterpart of `sqlalchemy_filters.apply_pagination` for 2.0 style selects.
+
+    Args:
+        db (AsyncSession): The async database session.
+        query (Select): The select statement to paginate.
+        page_number (int): Page to fetch.
+        page_size (int): Quantity of items per page.
+
+    Returns:
+        Tuple[Select, Pagination]: The paginated statement and the pagination values.
+    """
+    total_results = await db.scalar(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    )
+    query = query.limit(page_size).offset((page_number - 1) * page_size)
+    num_pages = ceil(total_results / page_size) if page_size > 0 else 0
+
+    return query, Pagination(page_number, page_size, num_pages, total_results)
+
 def _make_url_args(url_args: dict):
     """
     Make url parameters
@@ -124,4 +203,116 @@ def make_pagination_metadata(current_page: int, total_pages: int, per_page: int,
         links = links
     )
 
-    return metadata
\ No newline at end of file
+    return metadata
+
+
+def encode_cursor(id: int) -> str:
+    """
+    Make an opaque cursor from a record id.
+
+    Args:
+        id (int): The record id.
+
+    Returns:
+        str: The url safe cursor.
+    """
+    return urlsafe_b64encode(f"id:{id}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Read the record id from an opaque cursor.
+
+    Args:
+        cursor (str): The url safe cursor.
+
+    Raises:
+        InvalidCursor: If the cursor was not made by `encode_cursor`.
+
+    Returns:
+        int: The record id.
+    """
+    try:
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        prefix, id = urlsafe_b64decode(padded_cursor.encode()).decode().split(":")
+        if prefix != "id":
+            raise ValueError(prefix)
+        id = int(id)
+        # Tampered ids out of the 64 bits integers would fail on the database
+        if not 0 <= id < MAX_CURSOR_ID:
+            raise ValueError(id)
+        return id
+    except (ValueError, DecodeError, UnicodeDecodeError):
+        raise InvalidCursor(f"Invalid cursor: {cursor}")
+
+def apply_cursor_pagination(query: Query, column: InstrumentedAttribute, limit: int,
+    after: Optional[str] = None, before: Optional[str] = None) -> Tuple[List, bool, bool]:
+    """
+    Fetch one page of a query ordered by an unique column (keyset pagination).
+
+    The page is found by the index on the column, without OFFSET and without counting rows.
+
+    Args:
+        query (Query): The filtered query.
+        column (InstrumentedAttribute): The unique column used as cursor, usually the id.
+        limit (int): Quantity of items per page.
+        after (str): Cursor of the item just before the page.
+        before (str): Cursor of the item just after the page.
+
+    Raises:
+        InvalidCursor: If a cursor is invalid or both cursors were informed.
+
+    Returns:
+        Tuple[List, bool, bool]: The page items, if there is a previous page and if there is a next page.
+    """
+    if after and before:
+        raise InvalidCursor("Only one of the cursors must be informed")
+
+    # One extra item tells if there is another page in the same direction
+    if before:
+        items = query.filter(column < decode_cursor(before)).order_by(None).order_by(
+            column.desc()
+        ).limit(limit + 1).all()
+        has_previous = len(items) > limit
+        return list(reversed(items[:limit])), has_previous, True
+
+    if after:
+        query = query.filter(column > decode_cursor(after))
+    items = query.order_by(None).order_by(column).limit(limit + 1).all()
+    has_next = len(items) > limit
+    return items[:limit], bool(after), has_next
+
+def make_cursor_pagination_metadata(first_id: int, last_id: int, limit: int, has_previous: bool,
+    has_next: bool, url_args: dict, after: Optional[str] = None,
+    before: Optional[str] = None) -> CursorPaginationMetadataSchema:
+    """
+    Make cursor pagination metadata.
+
+    Args:
+        first_id (int): Id of the first item on the page.
+        last_id (int): Id of the last item on the page.
+        limit (int): Quantity of items per page.
+        has_previous (bool): If there are items before the page.
+        has_next (bool): If there are items after the page.
+        url_args (dict): Dict of url parametes.
+        after (str): Cursor used to fetch the current page.
+        before (str): Cursor used to fetch the current page.
+    """
+    url_params = _make_url_args(url_args)
+    previous_cursor = encode_cursor(first_id) if has_previous else None
+    next_cursor = encode_cursor(last_id) if has_next else None
+
+    current = f"cursor?limit={limit}{_make_url_args({'after': after, 'before': before})}{url_params}"
+    links = CursorPaginationLinksSchema(
+        current = current,
+        previous = f"cursor?limit={limit}&before={previous_cursor}{url_params}" if previous_cursor else None,
+        next = f"cursor?limit={limit}&after={next_cursor}{url_params}" if next_cursor else None
+    )
+
+    metadata = CursorPaginationMetadataSchema(
+        limit = limit,
+        previous_cursor = previous_cursor,
+        next_cursor = next_cursor,
+        links = links
+    )
+
+    return metadata
@@ -0,0 +1,175 @@
+# Standard Imports
+import json
+
+# Typing Imports
+from typing import Any, Hashable
+
+# Cache Imports
+from .cache import TTLCache
+from .serialization import dumps
+
+# Cache Configuration
+from ..core.config import QUERY_CACHE_URL
+from ..core.config import QUERY_CACHE_TTL_SECONDS
+from ..core.config import QUERY_CACHE_MAX_SIZE
+
+
+class MemoryCacheBackend:
+    """
+    In-process backend, each worker keeps its own entries.
+    """
+    def __init__(self, max_size: int = 256, ttl: float = 30.0):
+        self.entries = TTLCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key: str) -> Any:
+        return self.entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self.entries.set(key, value)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> dict:
+        return {"backend": "memory", **self.entries.stats()}
+
+
+class RedisCacheBackend:
+    """
+    Out-of-process backend shared by all the workers (requires the `redis` package).
+
+    Values are stored as JSON, never unpickled, since any client of the
+    server could write them. Dates and enums are read back as strings,
+    which the responses encode the same way.
+
+    Entries expire after `ttl` seconds and are evicted by the Redis server
+    `maxmemory-policy`. Unavailable servers are counted as errors and
+    answered as misses, so the database is queried instead.
+    """
+    def __init__(self, url: str, ttl: float = 30.0, prefix: str = "sbf:query:"):
+        import redis
+
+        # Short timeouts, an unreachable server must not hold the requests
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.error = redis.RedisError
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Any:
+        try:
+            value = self.client.get(self.prefix + key)
+        except self.error:
+            self.errors += 1
+            value = None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        try:
+            value = json.loads(value)
+        except ValueError:
+            self.errors += 1
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        try:
+            self.client.set(self.prefix + key, dumps(value), ex=max(int(self.ttl), 1))
+        except self.error:
+            self.errors += 1
+
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        try:
+            evictions = self.client.info("stats").get("evicted_keys", 0)
+        except self.error:
+            evictions = None
+
+        return {
+            "backend": "redis",
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "evictions": evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0
+        }
+
+
+class QueryCache:
+    """
+    Cache of the list endpoints results, keyed by entity, version, filters and page.
+
+    The version is the list ETag sent with the response, so a cached
+    result is only served along the ETag of the data it was read from, on
+    every worker. Writes raise the ETag, the old entries are never looked
+    up again and just expire.
+    """
+    def __init__(self, backend):
+        self.backend = backend
+
+    def key(self, entity: str, version: str, *params: Hashable) -> str:
+        """
+        Make the cache key of a result.
+
+        The version must be read before querying the database.
+
+        Args:
+            entity (str): The cached entity, usually its table name.
+            version (str): The entity list ETag.
+            params (Hashable): The filters and page of the result.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"{entity}:{version}:{params!r}"
+
+    def get(self, key: str) -> Any:
+        """
+        Retrieve a cached result, None if it is missing or expired.
+        """
+        return self.backend.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a result. Cached values are shared, they must not be changed.
+        """
+        self.backend.set(key, value)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        """
+        Cache counters.
+
+        Returns:
+            dict: The backend counters (hits, misses, evictions, hit ratio).
+        """
+        return self.backend.stats()
+
+
+def make_query_cache(url: str = QUERY_CACHE_URL, ttl: float = QUERY_CACHE_TTL_SECONDS,
+    max_size: int = QUERY_CACHE_MAX_SIZE) -> QueryCache:
+    """
+    Create the query cache for the configured backend (`memory://` or `redis://...`).
+    """
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return QueryCache(RedisCacheBackend(url, ttl=ttl))
+    return QueryCache(MemoryCacheBackend(max_size=max_size, ttl=ttl))
+
+
+query_cache = make_query_cache()
\ No newline at end of file
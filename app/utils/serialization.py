@@ -0,0 +1,72 @@
+# Standard Imports
+import json
+from enum import Enum
+from datetime import date
+from fastapi import Response
+
+# Typing Imports
+from typing import Any, Optional
+
+# orjson is optional, the standard library encoder is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode plain values (dicts, lists, dates and enums) as JSON, the same way
+    FastAPI encodes a response model.
+
+    Args:
+        content (Any): The value to encode.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def drop_none(content: Any) -> Any:
+    """
+    Remove the None values of the dicts, as `response_model_exclude_none` does.
+    """
+    if isinstance(content, dict):
+        return {key: drop_none(value) for key, value in content.items() if value is not None}
+    if isinstance(content, list):
+        return [drop_none(value) for value in content]
+    return content
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def make_json_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """
+    Serialize a response body that was already built with the shape of the
+    route `response_model`, skipping its validation.
+
+    Args:
+        content (Any): The response body, made of plain values.
+        response (Response): The route response, whose headers (like the ETag) are kept.
+
+    Returns:
+        FastJSONResponse: The JSON response.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, headers=headers)
@@ -0,0 +1,161 @@
+"""
+Compare loading the list endpoints records as ORM entities against column rows.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.list_queries [records]
+
+The entities are loaded the way the list endpoints did before, with their
+relationships and the session identity map. The rows are loaded with the
+column queries the services use now. Each load runs on a new session.
+
+Without `DATABASE_URL` a temporary SQLite database is used. The tables are
+created and seeded, so never point it to a database in use.
+"""
+# Standard Imports
+import os
+import sys
+import tracemalloc
+from datetime import date, timedelta
+from statistics import median
+from tempfile import mkstemp
+from time import perf_counter
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = "sqlite:///" + mkstemp(suffix=".db")[1]
+
+from sqlalchemy import insert
+from sqlalchemy.orm import joinedload
+
+import app.main  # noqa: F401, configures all the mappers
+from app.db.engine import SessionLocal, create_all, drop_all
+from app.modules.users.models import User
+from app.modules.products.models import Product
+from app.modules.products.services import PRODUCT_RECORD_COLUMNS
+from app.modules.providers.models import Provider
+from app.modules.providers.services import PROVIDER_RECORD_COLUMNS
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.services import TransactionService
+from app.modules.transactions_products.models import TransactionProduct
+
+
+PRODUCTS_PER_TRANSACTION = 3
+ROUNDS = 3
+
+
+def seed(db, records: int) -> None:
+    db.execute(insert(User), [{
+        "first_name": "Bench", "last_name": "Mark", "email": "bench@mark.com",
+        "password": "-", "admin": True
+    }])
+    db.execute(insert(Provider), [
+        {
+            "name": f"Fornecedor {id}", "cnpj": "11222333000181", "phone_number": "1",
+            "email": "fornecedor@sbf.com", "contact_name": "Ciclano", "created_by": 1
+        }
+        for id in range(1, records + 1)
+    ])
+    db.execute(insert(Product), [
+        {"name": f"Camisa {id}", "size": "M", "inventory": 10, "weight": 1.5, "created_by": 1}
+        for id in range(1, records + 1)
+    ])
+    db.execute(insert(Transaction), [
+        {
+            "type": "incoming" if id % 2 else "outgoing",
+            "description": f"Movimentação {id}",
+            "date": date(2021, 1, 1) + timedelta(days=id % 365),
+            "provider_id": id if id % 2 else None,
+            "created_by": 1
+        }
+        for id in range(1, records + 1)
+    ])
+    db.execute(insert(TransactionProduct), [
+        {"transaction_id": id, "product_id": (id * 7 + offset) % records + 1, "quantity": 1}
+        for id in range(1, records + 1)
+        for offset in range(PRODUCTS_PER_TRANSACTION)
+    ])
+    db.commit()
+
+
+def load_products_entities(db) -> int:
+    return len(db.query(Product).filter(Product.is_deleted == False).order_by(Product.id).all())
+
+
+def load_products_rows(db) -> int:
+    return len(db.query(*PRODUCT_RECORD_COLUMNS).filter(Product.is_deleted == False).order_by(Product.id).all())
+
+
+def load_providers_entities(db) -> int:
+    return len(db.query(Provider).filter(Provider.is_deleted == False).order_by(Provider.id).all())
+
+
+def load_providers_rows(db) -> int:
+    return len(db.query(*PROVIDER_RECORD_COLUMNS).filter(Provider.is_deleted == False).order_by(Provider.id).all())
+
+
+def load_transactions_entities(db) -> int:
+    transactions = db.query(Transaction).order_by(Transaction.id).options(
+        joinedload(Transaction.products_transaction).options(
+            joinedload(TransactionProduct.product)
+        )
+    ).all()
+    return len(transactions)
+
+
+def load_transactions_rows(db) -> int:
+    service = TransactionService()
+    query = service._make_transaction_query_with_filters(db)
+    transactions = service._make_records_query(query).order_by(Transaction.id).all()
+    products = db.execute(service._make_record_products_select(query.with_entities(Transaction.id))).all()
+    return len(service._make_records(transactions, products))
+
+
+def measure(function) -> tuple:
+    timings = []
+    for _ in range(ROUNDS):
+        db = SessionLocal()
+        try:
+            start = perf_counter()
+            result = function(db)
+            timings.append(perf_counter() - start)
+        finally:
+            db.close()
+
+    # Measured apart, tracing slows the load down
+    db = SessionLocal()
+    try:
+        tracemalloc.start()
+        function(db)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        db.close()
+
+    return result, median(timings) * 1000, peak / 2 ** 20
+
+
+def main(records: int) -> None:
+    drop_all()
+    create_all()
+    db = SessionLocal()
+    try:
+        seed(db, records)
+    finally:
+        db.close()
+
+    try:
+        for name, function in (
+            ("products entities", load_products_entities),
+            ("products rows", load_products_rows),
+            ("providers entities", load_providers_entities),
+            ("providers rows", load_providers_rows),
+            ("transactions entities", load_transactions_entities),
+            ("transactions rows", load_transactions_rows)
+        ):
+            result, elapsed, peak = measure(function)
+            print(f"{name:>21}: {result} records, median {elapsed:.0f} ms, peak {peak:.1f} MiB")
+    finally:
+        drop_all()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,252 @@
+"""
+Load test the API routes on a seeded database.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.load [--preset small|medium|large]
+        [--requests 200] [--concurrency 8] [--scenario NAME] [--reuse]
+        [--save BASELINE.json] [--compare BASELINE.json] [--tolerance 0.25]
+
+The tables are created and seeded with the preset volumes (see
+`benchmarks.load.seed.PRESETS`, each one can be changed with its own
+option, as `--products 100000`). The real application is then driven
+in-process through ASGI by `--concurrency` clients, one scenario at a time
+(see `benchmarks.load.scenarios`). Each scenario is warmed up and then
+sent `--requests` requests, reporting the p50/p95/p99 latency, the
+throughput and the SQL statements per request. The results are for a
+single worker process, with the configuration of the environment
+(`DATABASE_ASYNC`, `QUERY_CACHE_TTL_SECONDS`...).
+
+`--save` writes the results as a JSON baseline. `--compare` reads one and
+exits with status 1 when a scenario p95 latency grew more than
+`--tolerance`, or when it sends more statements per request.
+
+Without `DATABASE_URL` a temporary SQLite database is used, and deleted at
+the end. The tables are dropped, created and seeded, so never point it to a
+database in use. With `--reuse` a database seeded by a previous run is kept
+as is, including the records the previous writes changed, and it is not
+dropped at the end.
+"""
+# Standard Imports
+import os
+import sys
+import json
+import asyncio
+import argparse
+import platform
+from datetime import datetime
+from tempfile import mkstemp
+from time import perf_counter
+from urllib.parse import urlencode
+
+# Temporary database created by this run, deleted at the end
+TEMPORARY_DATABASE = None
+
+if "DATABASE_URL" not in os.environ:
+    file, TEMPORARY_DATABASE = mkstemp(suffix=".db")
+    os.close(file)
+    # The sessions of the sync routes are opened and closed on different threadpool threads
+    os.environ["DATABASE_URL"] = "sqlite:///" + TEMPORARY_DATABASE + "?check_same_thread=false"
+# The statements per request are read from the requests instrumentation
+os.environ["SQL_INSTRUMENTATION"] = "true"
+
+# Typing Imports
+from typing import List
+
+from app import API_PREFIX
+from app.main import create_app
+from app.core.config import DATABASE_ASYNC
+from app.core.passwords import password_hasher
+from app.db.engine import create_all, drop_all, engine
+
+from .client import Result, percentile, request, run_concurrently
+from .scenarios import SCENARIOS, Context, Scenario, find_uncovered_routes
+from .seed import ADMIN_EMAIL, PASSWORD, PRESETS, Volumes, count_records, seed
+
+
+# A scenario sends more statements per request than its baseline above this difference
+QUERIES_TOLERANCE = 0.5
+
+
+def parse_arguments(arguments: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load", description="Load test the API routes.")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    for field in Volumes._fields:
+        parser.add_argument(f"--{field}", type=int, help=f"overrides the preset {field}")
+    parser.add_argument("--seed", type=int, default=0, help="random generator seed of the records and requests")
+    parser.add_argument("--requests", type=int, default=200, help="requests of each scenario")
+    parser.add_argument("--concurrency", type=int, default=8, help="clients sending the requests")
+    parser.add_argument("--scenario", action="append", default=[], help="run the scenarios containing this text")
+    parser.add_argument("--reuse", action="store_true", help="keep the records of a previous run")
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare the results to this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="accepted p95 latency growth (0.25 = 25%%)")
+    return parser.parse_args(arguments)
+
+
+def make_volumes(options: argparse.Namespace) -> Volumes:
+    preset = PRESETS[options.preset]
+    return preset._replace(**{
+        field: getattr(options, field) for field in Volumes._fields if getattr(options, field) is not None
+    })
+
+
+def prepare_database(volumes: Volumes, seed_number: int, reuse: bool) -> None:
+    if reuse:
+        create_all()
+        records = count_records()
+        if records["products"] > 0:
+            print(f"reusing the seeded database: {records}")
+            return
+    else:
+        drop_all()
+        create_all()
+
+    start = perf_counter()
+    seed(volumes, seed_number, on_step=lambda table, rows: print(
+        f"seeded {rows:>9} {table} ({perf_counter() - start:.1f} s)"
+    ))
+
+
+def summarize(scenario: Scenario, results: List[Result], elapsed: float) -> dict:
+    statuses = {}
+    for result in results:
+        statuses[str(result.status)] = statuses.get(str(result.status), 0) + 1
+
+    durations = [result.duration for result in results]
+    queries = [result.queries for result in results if result.queries is not None]
+    db_durations = [result.db_duration for result in results if result.db_duration is not None]
+    return {
+        "method": scenario.method,
+        "route": scenario.route,
+        "requests": len(results),
+        "statuses": statuses,
+        "p50_ms": round(percentile(durations, 0.50), 3),
+        "p95_ms": round(percentile(durations, 0.95), 3),
+        "p99_ms": round(percentile(durations, 0.99), 3),
+        "mean_ms": round(sum(durations) / len(durations) * 1000, 3),
+        "throughput": round(len(results) / elapsed, 1),
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "db_ms_per_request": round(sum(db_durations) / len(db_durations) * 1000, 3) if db_durations else None
+    }
+
+
+async def login(app) -> dict:
+    result = await request(app, "POST", API_PREFIX + "/login", {"username": ADMIN_EMAIL, "password": PASSWORD},
+        read_body=True)
+    if result.status != 200:
+        raise SystemExit(f"login failed with status {result.status}")
+    return {"Authorization": "Bearer " + json.loads(result.body)["access_token"]}
+
+
+async def run_scenarios(app, scenarios: List[Scenario], volumes: Volumes, options: argparse.Namespace) -> dict:
+    await app.router.startup()
+    try:
+        headers = await login(app)
+        summaries = {}
+        for scenario in scenarios:
+            context = Context(volumes, options.seed)
+            amount = max(int(options.requests * scenario.weight), 1)
+            if scenario.limit is not None:
+                amount = min(amount, scenario.limit(volumes) - options.concurrency)
+            if amount <= 0:
+                print(f"{scenario.name:>36}: skipped, not enough records")
+                continue
+
+            def send(number: int):
+                parameters, query, body = scenario.make(context)
+                return request(app, scenario.method, scenario.path(parameters), body, headers, urlencode(query))
+
+            # Warm up the caches and the connections, not measured
+            await run_concurrently(send, options.concurrency, options.concurrency)
+
+            start = perf_counter()
+            results = await run_concurrently(send, amount, options.concurrency)
+            summaries[scenario.name] = summary = summarize(scenario, results, perf_counter() - start)
+            print(
+                f"{scenario.name:>36}: p50 {summary['p50_ms']:>8.2f} ms, p95 {summary['p95_ms']:>8.2f} ms, "
+                f"p99 {summary['p99_ms']:>8.2f} ms, {summary['throughput']:>7.1f} req/s, "
+                f"{summary['queries_per_request']} queries/req, statuses {summary['statuses']}"
+            )
+        return summaries
+    finally:
+        await app.router.shutdown()
+
+
+def compare(summaries: dict, baseline: dict, tolerance: float) -> List[str]:
+    """
+    The scenarios slower or sending more statements than on the baseline.
+    """
+    regressions = []
+    for name, summary in summaries.items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+
+        if summary["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.2f} ms -> {summary['p95_ms']:.2f} ms")
+        if (summary["queries_per_request"] is not None and previous["queries_per_request"] is not None
+                and summary["queries_per_request"] > previous["queries_per_request"] + QUERIES_TOLERANCE):
+            regressions.append(
+                f"{name}: {previous['queries_per_request']} -> {summary['queries_per_request']} queries per request"
+            )
+    return regressions
+
+
+def main(options: argparse.Namespace) -> bool:
+    volumes = make_volumes(options)
+    scenarios = [
+        scenario for scenario in SCENARIOS
+        if not options.scenario or any(text in scenario.name for text in options.scenario)
+    ]
+    for method, route in find_uncovered_routes(SCENARIOS):
+        print(f"not benchmarked: {method} {route}")
+
+    prepare_database(volumes, options.seed, options.reuse)
+    print(f"dialect: {engine.dialect.name}, async: {DATABASE_ASYNC}, {volumes}, "
+          f"{options.requests} requests per scenario, concurrency {options.concurrency}")
+    try:
+        summaries = asyncio.get_event_loop().run_until_complete(
+            run_scenarios(create_app(), scenarios, volumes, options)
+        )
+    finally:
+        password_hasher.shutdown()
+        if not options.reuse:
+            drop_all()
+        if TEMPORARY_DATABASE is not None:
+            engine.dispose()
+            os.remove(TEMPORARY_DATABASE)
+
+    results = {
+        "created_on": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "dialect": engine.dialect.name,
+        "database_async": DATABASE_ASYNC,
+        "volumes": volumes._asdict(),
+        "seed": options.seed,
+        "requests": options.requests,
+        "concurrency": options.concurrency,
+        "scenarios": summaries
+    }
+    if options.save:
+        with open(options.save, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"baseline saved to {options.save}")
+
+    if not options.compare:
+        return True
+
+    with open(options.compare) as file:
+        baseline = json.load(file)
+    for key in ("dialect", "database_async", "volumes", "concurrency"):
+        if baseline[key] != results[key]:
+            print(f"warning: the baseline {key} differs ({baseline[key]} != {results[key]})")
+
+    regressions = compare(summaries, baseline, options.tolerance)
+    for regression in regressions:
+        print(f"regression: {regression}")
+    print(f"{len(regressions)} regressions against {options.compare}")
+    return len(regressions) == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(parse_arguments(sys.argv[1:])) else 1)
@@ -0,0 +1,103 @@
+"""
+In-process ASGI client, timing each request and counting its SQL statements.
+"""
+# Standard Imports
+import json
+import asyncio
+from time import perf_counter
+
+# Typing Imports
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+from app.db.instrumentation import get_query_stats
+
+
+class Result(NamedTuple):
+    status: int
+    # Seconds, until the last body chunk was sent
+    duration: float
+    # None when the SQL instrumentation is disabled
+    queries: Optional[int]
+    db_duration: Optional[float]
+    # Only read when asked, the body chunks are dropped otherwise
+    body: Optional[bytes] = None
+
+
+async def request(app, method: str, path: str, body: Any = None, headers: dict = None, query: str = "",
+    read_body: bool = False) -> Result:
+    """
+    Send one request to the ASGI application.
+
+    The statements are read from the query stats of the request, kept until
+    its last statement, so the ones of a streamed body are counted too.
+    """
+    content = json.dumps(body).encode() if body is not None else b""
+    raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())]
+    raw_headers += [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    scope = {
+        "type": "http", "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": query.encode(), "root_path": "",
+        "headers": raw_headers, "client": ("127.0.0.1", 0), "server": ("testserver", 80)
+    }
+    messages = [{"type": "http.request", "body": content, "more_body": False}]
+    status, stats, chunks = [], [], []
+
+    async def receive() -> dict:
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+            stats.append(get_query_stats())
+        elif message["type"] == "http.response.body" and read_body:
+            chunks.append(message.get("body", b""))
+
+    start = perf_counter()
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # Raised again by the server errors middleware, after sending the 500 response
+        if not status:
+            status.append(500)
+    duration = perf_counter() - start
+
+    query_stats = stats[0] if stats else None
+    return Result(
+        status=status[0],
+        duration=duration,
+        queries=query_stats.count if query_stats is not None else None,
+        db_duration=query_stats.duration if query_stats is not None else None,
+        body=b"".join(chunks) if read_body else None
+    )
+
+
+async def run_concurrently(send: Callable[[int], Any], requests: int, concurrency: int) -> List[Result]:
+    """
+    Send the requests from `concurrency` clients, each one waiting for its
+    response before sending the next request.
+
+    Args:
+        send (Callable): Called with the request number, returns the `request` coroutine.
+        requests (int): The amount of requests.
+        concurrency (int): The amount of clients.
+
+    Returns:
+        List[Result]: The results, in completion order.
+    """
+    results: List[Result] = []
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for number in remaining:
+            results.append(await send(number))
+
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    return results
+
+
+def percentile(values: Iterable[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of durations in seconds, in milliseconds.
+    """
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] * 1000
@@ -0,0 +1,211 @@
+"""
+The requests sent to each route of `app/modules/*/routes.py`.
+
+The reads run first, then the writes and at last the deletes, so the
+reads always find the seeded records. Each scenario draws its ids, dates
+and names from the seeded volumes, with its own seeded generator.
+"""
+# Standard Imports
+import random
+import importlib
+from datetime import date, timedelta
+from itertools import count
+from pathlib import Path
+from urllib.parse import urlencode
+
+# Typing Imports
+from typing import Any, Callable, List, NamedTuple, Set, Tuple
+
+from app import API_PREFIX
+from app.modules import __file__ as modules_file
+
+from .seed import FIRST_DATE, Volumes
+
+
+# Items of each import request
+IMPORT_ITEMS = 10
+
+
+class Context:
+    """
+    Draws the values of the requests from the seeded volumes.
+    """
+    def __init__(self, volumes: Volumes, seed: int = 0):
+        self.volumes = volumes
+        self.rng = random.Random(seed)
+        self._unique = count(1)
+        # Deleted from the last seeded id downwards, the first user is the admin
+        self._deleted = {"products": count(volumes.products, -1), "providers": count(volumes.providers, -1),
+                         "users": count(volumes.users, -1)}
+
+    def product_id(self) -> int:
+        return self.rng.randint(1, self.volumes.products)
+
+    def provider_id(self) -> int:
+        return self.rng.randint(1, self.volumes.providers)
+
+    def user_id(self) -> int:
+        return self.rng.randint(1, self.volumes.users)
+
+    def page(self, records: int, per_page: int = 20) -> int:
+        return self.rng.randint(1, max(records // per_page, 1))
+
+    def day(self) -> date:
+        return FIRST_DATE + timedelta(days=self.rng.randrange(self.volumes.days))
+
+    def week(self) -> dict:
+        start = self.day()
+        return {"start_date": start.isoformat(), "finish_date": (start + timedelta(days=6)).isoformat()}
+
+    def month(self) -> dict:
+        start = self.day().replace(day=1)
+        finish = (start + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+        return {"start_date": start.isoformat(), "finish_date": finish.isoformat()}
+
+    def unique(self) -> int:
+        return next(self._unique)
+
+    def deleted_id(self, entity: str) -> int:
+        return next(self._deleted[entity])
+
+    def transaction(self, outgoing: bool = False) -> dict:
+        products = sorted({self.product_id() for _ in range(self.volumes.lines)})
+        transaction = {
+            "type": "SAIDA" if outgoing else "ENTRADA",
+            "date": self.day().isoformat(),
+            # Outgoing ones take a single unit, the seeded stock is not exhausted
+            "products": [{"product_id": id, "quantity": 1 if outgoing else 5} for id in products]
+        }
+        if not outgoing:
+            transaction["provider_id"] = self.provider_id()
+        return transaction
+
+
+# Path parameters, query string and body of a request
+Request = Tuple[dict, dict, Any]
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    # Path template, as declared on the module router
+    route: str
+    make: Callable[[Context], Request]
+    prefix: str = API_PREFIX
+    # Fraction of the requested amount sent, for the heaviest routes
+    weight: float = 1.0
+    # Most requests that can succeed, for the deletes
+    limit: Callable[[Volumes], int] = None
+
+    def path(self, parameters: dict) -> str:
+        return self.prefix + self.route.format(**parameters)
+
+
+def _query(make: Callable[[Context], dict]) -> Callable[[Context], Request]:
+    return lambda c: ({}, make(c), None)
+
+
+ADMIN_PREFIX = API_PREFIX + "/admin"
+
+
+SCENARIOS: List[Scenario] = [
+    # Products
+    Scenario("products list", "GET", "/products/", _query(lambda c: {}), weight=0.1),
+    Scenario("products page", "GET", "/products/page/{page}",
+        lambda c: ({"page": c.page(c.volumes.products)}, {"per_page": 20}, None)),
+    Scenario("products name search", "GET", "/products/page/{page}",
+        lambda c: ({"page": 1}, {"name": f"Camisa {c.product_id()}"}, None)),
+    Scenario("products cursor", "GET", "/products/cursor", _query(lambda c: {"limit": 20})),
+    Scenario("product", "GET", "/products/{id}", lambda c: ({"id": c.product_id()}, {}, None)),
+    Scenario("product image", "GET", "/products/{id}/image", lambda c: ({"id": c.product_id()}, {}, None)),
+    Scenario("product inventory at date", "GET", "/products/{id}/inventory",
+        lambda c: ({"id": c.product_id()}, {"at": c.day().isoformat()}, None)),
+
+    # Providers
+    Scenario("providers list", "GET", "/providers/", _query(lambda c: {}), weight=0.1),
+    Scenario("providers page", "GET", "/providers/page/{page}",
+        lambda c: ({"page": c.page(c.volumes.providers)}, {"per_page": 20}, None)),
+    Scenario("providers name search", "GET", "/providers/page/{page}",
+        lambda c: ({"page": 1}, {"name": f"Fornecedor {c.provider_id()}"}, None)),
+    Scenario("providers cursor", "GET", "/providers/cursor", _query(lambda c: {"limit": 20})),
+    Scenario("provider", "GET", "/providers/{id}", lambda c: ({"id": c.provider_id()}, {}, None)),
+
+    # Transactions, the unpaginated ones filtered by a week
+    Scenario("transactions of a week", "GET", "/transaction/", _query(lambda c: c.week())),
+    Scenario("transactions page", "GET", "/transaction/page/{page}",
+        lambda c: ({"page": c.page(c.volumes.transactions)}, {"per_page": 20}, None)),
+    Scenario("transactions page by type and week", "GET", "/transaction/page/{page}",
+        lambda c: ({"page": 1}, {"transaction_type": "SAIDA", **c.week()}, None)),
+    Scenario("transactions page by product name", "GET", "/transaction/page/{page}",
+        lambda c: ({"page": 1}, {"product_name": f"Camisa {c.product_id()}"}, None)),
+    Scenario("transactions cursor", "GET", "/transaction/cursor", _query(lambda c: {"limit": 20})),
+    Scenario("transactions export of a week", "GET", "/transaction/export",
+        _query(lambda c: {"format": "ndjson", **c.week()})),
+    Scenario("transaction", "GET", "/transaction/{id}",
+        lambda c: ({"id": c.rng.randint(1, c.volumes.transactions)}, {}, None)),
+
+    # Reports
+    Scenario("products daily report of a month", "GET", "/reports/products",
+        _query(lambda c: {"period": "DIARIO", **c.month()})),
+    Scenario("product monthly report", "GET", "/reports/products",
+        _query(lambda c: {"period": "MENSAL", "product_id": c.product_id()})),
+    Scenario("providers daily report of a month", "GET", "/reports/providers",
+        _query(lambda c: {"period": "DIARIO", **c.month()})),
+
+    # Users
+    Scenario("users list", "GET", "/users/", _query(lambda c: {}), prefix=ADMIN_PREFIX),
+    Scenario("user", "GET", "/users/{id}", lambda c: ({"id": c.user_id()}, {}, None), prefix=ADMIN_PREFIX),
+
+    # Writes
+    Scenario("product create", "POST", "/products/", lambda c: ({}, {}, {
+        "name": f"Bermuda {c.unique()}", "size": "M", "inventory": 10, "weight": 0.5
+    })),
+    Scenario("product update", "PATCH", "/products/{id}",
+        lambda c: ({"id": c.product_id()}, {}, {"weight": round(c.rng.uniform(0.1, 2.0), 2)})),
+    Scenario("provider create", "POST", "/providers/", lambda c: ({}, {}, {
+        "name": f"Fornecedora {c.unique()}", "cnpj": "11.222.333/0001-81", "phone_number": "11999999999",
+        "email": "fornecedora@sbf.com", "contact_name": "Beltrano"
+    })),
+    Scenario("provider update", "PATCH", "/providers/{id}",
+        lambda c: ({"id": c.provider_id()}, {}, {"contact_name": f"Contato {c.unique()}"})),
+    Scenario("user create", "POST", "/users/", lambda c: ({}, {}, {
+        "first_name": "Fulano", "last_name": "Silva", "email": f"fulano{c.unique()}@sbf.com",
+        "password": "benchmark", "admin": False
+    }), prefix=ADMIN_PREFIX),
+    Scenario("user update", "PATCH", "/users/{id}",
+        lambda c: ({"id": c.rng.randint(2, max(c.volumes.users, 2))}, {}, {"last_name": f"Silva {c.unique()}"}),
+        prefix=ADMIN_PREFIX),
+    Scenario("incoming transaction", "POST", "/incoming/transaction/", lambda c: ({}, {}, c.transaction())),
+    Scenario("outgoing transaction", "POST", "/outgoing/transaction/",
+        lambda c: ({}, {}, c.transaction(outgoing=True))),
+    Scenario("transactions import", "POST", "/transaction/import",
+        lambda c: ({}, {}, [c.transaction(outgoing=index % 3 == 0) for index in range(IMPORT_ITEMS)]), weight=0.5),
+
+    # Deletes
+    Scenario("product delete", "DELETE", "/products/{id}", lambda c: ({"id": c.deleted_id("products")}, {}, None),
+        limit=lambda volumes: volumes.products // 2),
+    Scenario("provider delete", "DELETE", "/providers/{id}", lambda c: ({"id": c.deleted_id("providers")}, {}, None),
+        limit=lambda volumes: volumes.providers // 2),
+    Scenario("user delete", "DELETE", "/users/{id}", lambda c: ({"id": c.deleted_id("users")}, {}, None),
+        prefix=ADMIN_PREFIX, limit=lambda volumes: volumes.users - 1)
+]
+
+
+def list_module_routes() -> Set[Tuple[str, str]]:
+    """
+    Methods and path templates declared by the routers of `app/modules/*/routes.py`.
+    """
+    routes = set()
+    for path in sorted(Path(modules_file).parent.glob("*/routes.py")):
+        module = importlib.import_module(f"app.modules.{path.parent.name}.routes")
+        for route in module.route.routes:
+            routes.update((method, route.path) for method in route.methods)
+    return routes
+
+
+def find_uncovered_routes(scenarios: List[Scenario]) -> List[Tuple[str, str]]:
+    """
+    Module routes without a scenario, new routes show up here until one is added.
+    """
+    covered = {(scenario.method, scenario.route) for scenario in scenarios}
+    return sorted(list_module_routes() - covered, key=lambda route: (route[1], route[0]))
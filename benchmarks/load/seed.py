@@ -0,0 +1,244 @@
+"""
+Fill the database with generated records through bulk inserts.
+
+The records are drawn from a seeded random generator, the same volumes and
+seed always give the same dataset. The transactions are spread over
+`days` days in date order. Their stock changes are applied to the products
+inventory and to the monthly inventory snapshots, and the movement reports
+are rebuilt from them, as if they were created through the API.
+"""
+# Standard Imports
+import random
+from calendar import monthrange
+from datetime import date, timedelta
+from sqlalchemy import bindparam, func, insert, select, text, update
+
+# Typing Imports
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set
+
+from app.db.engine import SessionLocal, engine
+from app.core.passwords import password_hasher
+from app.modules.users.models import User
+from app.modules.products.models import Product, ProductImage
+from app.modules.providers.models import Provider
+from app.modules.transactions.models import Transaction
+from app.modules.transactions_products.models import TransactionProduct
+from app.modules.inventory_snapshots.models import InventorySnapshot
+from app.modules.reports.services import ReportService
+
+
+# Rows sent by each executemany
+CHUNK_SIZE = 10000
+
+# Every user shares this password, the first one is an admin
+PASSWORD = "benchmark"
+ADMIN_EMAIL = "bench1@sbf.com"
+
+FIRST_DATE = date(2021, 1, 1)
+INITIAL_INVENTORY = 1000
+
+# One transaction out of OUTGOING_EVERY is an outgoing one
+OUTGOING_EVERY = 3
+
+
+class Volumes(NamedTuple):
+    users: int = 20
+    providers: int = 200
+    products: int = 2000
+    transactions: int = 10000
+    # Products of each transaction
+    lines: int = 3
+    # Dates the transactions are spread over, from `FIRST_DATE`
+    days: int = 730
+
+
+PRESETS = {
+    "small": Volumes(),
+    "medium": Volumes(users=100, providers=2000, products=20000, transactions=200000, lines=5),
+    # 5M transaction lines
+    "large": Volumes(users=1000, providers=10000, products=100000, transactions=1000000, lines=5)
+}
+
+
+def _insert_chunks(connection, model, rows: Iterable[dict]) -> int:
+    chunk, count = [], 0
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            connection.execute(insert(model), chunk)
+            count, chunk = count + len(chunk), []
+    if chunk:
+        connection.execute(insert(model), chunk)
+        count += len(chunk)
+    return count
+
+
+def _period_end(day: date) -> date:
+    return day.replace(day=monthrange(day.year, day.month)[1])
+
+
+def _make_users(volumes: Volumes) -> Iterator[dict]:
+    # Hashed once, verifying it still costs a full hash on each login
+    hashed = password_hasher.hash(PASSWORD)
+    for id in range(1, volumes.users + 1):
+        yield {
+            "id": id, "first_name": "Bench", "last_name": str(id), "email": f"bench{id}@sbf.com",
+            # Core inserts take the column names, the `admin` attribute maps to "is_admin"
+            "password": hashed, "is_admin": id == 1, "is_deleted": False
+        }
+
+
+def _make_providers(volumes: Volumes, rng: random.Random) -> Iterator[dict]:
+    for id in range(1, volumes.providers + 1):
+        yield {
+            "id": id, "name": f"Fornecedor {id}", "cnpj": "11222333000181", "phone_number": "11999999999",
+            "email": f"fornecedor{id}@sbf.com", "contact_name": "Ciclano", "is_deleted": False,
+            "created_by": rng.randint(1, volumes.users)
+        }
+
+
+def _make_products(volumes: Volumes, rng: random.Random) -> Iterator[dict]:
+    for id in range(1, volumes.products + 1):
+        yield {
+            "id": id, "name": f"Camisa {id}", "size": rng.choice(("P", "M", "G")), "inventory": INITIAL_INVENTORY,
+            "weight": round(rng.uniform(0.1, 2.0), 2), "is_deleted": False, "created_by": rng.randint(1, volumes.users)
+        }
+
+
+class _TransactionsGenerator:
+    """
+    Generate the transactions and their lines in date order, keeping the
+    products stock and the snapshots of each month.
+    """
+    def __init__(self, volumes: Volumes, rng: random.Random):
+        self.volumes = volumes
+        self.rng = rng
+        self.inventory = [INITIAL_INVENTORY] * (volumes.products + 1)
+        self.snapshots: List[dict] = []
+        self.lines: List[dict] = []
+        self._month_end: Optional[date] = None
+        self._touched: Set[int] = set()
+
+    def _close_month(self) -> None:
+        self.snapshots.extend(
+            {"product_id": product_id, "date": self._month_end, "inventory": self.inventory[product_id]}
+            for product_id in sorted(self._touched)
+        )
+        self._touched = set()
+
+    def transactions(self) -> Iterator[dict]:
+        volumes, rng = self.volumes, self.rng
+        lines = min(volumes.lines, volumes.products)
+        stride = max(volumes.products // lines, 1)
+        line_id = 0
+
+        for id in range(1, volumes.transactions + 1):
+            day = FIRST_DATE + timedelta(days=(id - 1) * volumes.days // volumes.transactions)
+            if _period_end(day) != self._month_end:
+                if self._month_end is not None:
+                    self._close_month()
+                self._month_end = _period_end(day)
+
+            outgoing = id % OUTGOING_EVERY == 0
+            yield {
+                "id": id, "type": "outgoing" if outgoing else "incoming", "description": f"Movimentação {id}",
+                "date": day, "provider_id": None if outgoing else rng.randint(1, volumes.providers),
+                "created_by": rng.randint(1, volumes.users)
+            }
+
+            # Distinct products on each transaction
+            first = rng.randrange(volumes.products)
+            for line in range(lines):
+                product_id = (first + line * stride) % volumes.products + 1
+                quantity = rng.randint(1, 10)
+                line_id += 1
+                self.lines.append({"id": line_id, "transaction_id": id, "product_id": product_id, "quantity": quantity})
+                self.inventory[product_id] += -quantity if outgoing else quantity
+                self._touched.add(product_id)
+
+        if self._month_end is not None:
+            self._close_month()
+
+
+def _reset_sequences(connection) -> None:
+    # The ids were given explicitly, the next ones created by the API follow them
+    for model in (User, Provider, Product, Transaction, TransactionProduct):
+        table = model.__tablename__
+        connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT coalesce(max(id), 1) FROM {table}))"
+        ))
+
+
+def seed(volumes: Volumes, seed: int = 0, on_step: Callable[[str, int], None] = None) -> None:
+    """
+    Insert the records of the volumes into the empty tables.
+
+    Args:
+        volumes (Volumes): The amount of records.
+        seed (int): The random generator seed.
+        on_step (Callable): Called with each table name and the rows inserted into it.
+    """
+    rng = random.Random(seed)
+    on_step = on_step or (lambda table, rows: None)
+
+    with engine.begin() as connection:
+        on_step("users", _insert_chunks(connection, User, _make_users(volumes)))
+        on_step("providers", _insert_chunks(connection, Provider, _make_providers(volumes, rng)))
+        on_step("products", _insert_chunks(connection, Product, _make_products(volumes, rng)))
+        # Default image of every product
+        on_step("images", _insert_chunks(connection, ProductImage, (
+            {"product_id": id} for id in range(1, volumes.products + 1)
+        )))
+
+        generator = _TransactionsGenerator(volumes, rng)
+        transactions = generator.transactions()
+        count = lines = snapshots = 0
+        while True:
+            chunk = [row for _, row in zip(range(CHUNK_SIZE), transactions)]
+            if chunk:
+                connection.execute(insert(Transaction), chunk)
+            # The lines and the closed months of the chunk were generated along with it
+            lines += _insert_chunks(connection, TransactionProduct, generator.lines)
+            snapshots += _insert_chunks(connection, InventorySnapshot, generator.snapshots)
+            generator.lines, generator.snapshots = [], []
+            if not chunk:
+                break
+            count += len(chunk)
+        on_step("transactions", count)
+        on_step("transaction lines", lines)
+        on_step("snapshots", snapshots)
+
+        connection.execute(
+            update(Product.__table__).where(Product.__table__.c.id == bindparam("product_id")).values(
+                inventory=bindparam("new_inventory")
+            ),
+            [
+                {"product_id": id, "new_inventory": inventory}
+                for id, inventory in enumerate(generator.inventory) if id > 0
+            ]
+        )
+
+        if connection.dialect.name == "postgresql":
+            _reset_sequences(connection)
+
+    db = SessionLocal()
+    try:
+        on_step("report transactions", ReportService().rebuild(db))
+    finally:
+        db.close()
+
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+
+def count_records() -> Dict[str, int]:
+    """
+    Records of the seeded tables, to check a database seeded by a previous run.
+    """
+    with engine.connect() as connection:
+        return {
+            "users": connection.execute(select(func.count()).select_from(User.__table__)).scalar(),
+            "providers": connection.execute(select(func.count()).select_from(Provider.__table__)).scalar(),
+            "products": connection.execute(select(func.count()).select_from(Product.__table__)).scalar(),
+            "transactions": connection.execute(select(func.count()).select_from(Transaction.__table__)).scalar()
+        }
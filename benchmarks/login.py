@@ -0,0 +1,133 @@
+"""
+Measure the login throughput of one worker, and the latency of the other
+endpoints while the logins run.
+
+Usage:
+    PASSWORD_HASH_WORKERS=2 python -m benchmarks.login [logins] [concurrency]
+
+The application is driven in-process through ASGI, so the results are for a
+single worker process. The `/health` endpoint is requested alongside the
+logins, it is answered by the requests threadpool and must stay fast
+while the passwords are verified on the hasher threads. Rejected logins
+(`PASSWORD_HASH_MAX_PENDING` exceeded) are counted apart.
+
+Without `DATABASE_URL` a temporary SQLite database is used. The tables are
+created and seeded, so never point it to a database in use.
+"""
+# Standard Imports
+import os
+import sys
+import json
+import asyncio
+from tempfile import mkstemp
+from time import perf_counter
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = "sqlite:///" + mkstemp(suffix=".db")[1]
+
+from app.main import create_app
+from app.db.engine import SessionLocal, create_all, drop_all
+from app.core.passwords import password_hasher
+from app.modules.users.models import User
+
+
+USERS = 50
+PASSWORD = "mysecretpassword"
+
+
+def seed(db) -> None:
+    # Hashed once, all the users share the same password
+    hashed = password_hasher.hash(PASSWORD)
+    db.add_all([
+        User(first_name="Bench", last_name=str(id), email=f"bench{id}@sbf.com", password=hashed, admin=False)
+        for id in range(USERS)
+    ])
+    db.commit()
+
+
+async def request(app, method: str, path: str, body: dict = None) -> int:
+    """
+    Send one request to the ASGI application, returning the response status.
+    """
+    content = json.dumps(body).encode() if body is not None else b""
+    scope = {
+        "type": "http", "http_version": "1.1", "method": method, "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(content)).encode())],
+        "client": ("127.0.0.1", 0), "server": ("testserver", 80)
+    }
+    messages = [{"type": "http.request", "body": content, "more_body": False}]
+    status = []
+
+    async def receive() -> dict:
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    return status[0]
+
+
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)] * 1000
+
+
+async def run(app, logins: int, concurrency: int) -> None:
+    login_timings, health_timings, statuses = [], [], {}
+    remaining = iter(range(logins))
+    finished = asyncio.Event()
+
+    async def login_client() -> None:
+        for id in remaining:
+            start = perf_counter()
+            status = await request(app, "POST", "/v1/login", {
+                "username": f"bench{id % USERS}@sbf.com", "password": PASSWORD
+            })
+            login_timings.append(perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    async def health_client() -> None:
+        while not finished.is_set():
+            start = perf_counter()
+            await request(app, "GET", "/v1/health")
+            health_timings.append(perf_counter() - start)
+            await asyncio.sleep(0.01)
+
+    health = asyncio.ensure_future(health_client())
+    start = perf_counter()
+    await asyncio.gather(*[login_client() for _ in range(concurrency)])
+    elapsed = perf_counter() - start
+    finished.set()
+    await health
+
+    print(f"hasher: {password_hasher.stats()['scheme']}, {password_hasher.workers} workers, "
+          f"{password_hasher.max_pending} max pending")
+    print(f"logins: {logins} in {elapsed:.2f} s, {statuses.get(200, 0) / elapsed:.1f} logins/s, statuses {statuses}")
+    print(f"login latency: p50 {percentile(login_timings, 0.5):.1f} ms, p95 {percentile(login_timings, 0.95):.1f} ms")
+    print(f"health latency: p50 {percentile(health_timings, 0.5):.1f} ms, p95 {percentile(health_timings, 0.95):.1f} ms")
+
+
+def main(logins: int, concurrency: int) -> None:
+    drop_all()
+    create_all()
+    db = SessionLocal()
+    try:
+        seed(db)
+    finally:
+        db.close()
+
+    try:
+        asyncio.get_event_loop().run_until_complete(run(create_app(), logins, concurrency))
+    finally:
+        password_hasher.shutdown()
+        drop_all()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    )
@@ -0,0 +1,150 @@
+"""
+Compare the list endpoints serialization through pydantic against the plain record dicts.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.serialization [records]
+
+The pydantic path validates the loaded models into the response schemas,
+then FastAPI validates and encodes the response model again. The plain path
+builds the same dicts straight from the rows and encodes them with
+`app.utils.serialization.dumps` (orjson when installed). Only the
+serialization is timed, the records are loaded once.
+
+Without `DATABASE_URL` a temporary SQLite database is used. The tables are
+created and seeded, so never point it to a database in use.
+"""
+# Standard Imports
+import os
+import sys
+import asyncio
+from datetime import date, timedelta
+from statistics import median
+from tempfile import mkstemp
+from time import perf_counter
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = "sqlite:///" + mkstemp(suffix=".db")[1]
+
+from typing import List
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import parse_obj_as
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
+
+import app.main  # noqa: F401, configures all the mappers
+from app.db.engine import SessionLocal, create_all, drop_all
+from app.modules.users.models import User
+from app.modules.products.models import Product
+from app.modules.products.schemas import ProductResponse, ProductsResponse, make_product_record
+from app.modules.products.services import PRODUCT_RECORD_COLUMNS
+from app.modules.providers.models import Provider
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.schemas import TransactionResponse
+from app.modules.transactions.services import TransactionService
+from app.modules.transactions_products.models import TransactionProduct
+from app.utils.serialization import drop_none, dumps, orjson
+
+
+PRODUCTS = 1000
+PRODUCTS_PER_TRANSACTION = 3
+ROUNDS = 20
+
+
+def seed(db, records: int) -> None:
+    db.execute(insert(User), [{
+        "first_name": "Bench", "last_name": "Mark", "email": "bench@mark.com",
+        "password": "-", "admin": True
+    }])
+    db.execute(insert(Provider), [{
+        "name": "Fornecedor", "cnpj": "11222333000181", "phone_number": "1",
+        "email": "fornecedor@sbf.com", "contact_name": "Ciclano", "created_by": 1
+    }])
+    db.execute(insert(Product), [
+        {"name": f"Camisa {id}", "size": "M", "inventory": 10, "weight": 1.5, "created_by": 1}
+        for id in range(1, max(records, PRODUCTS) + 1)
+    ])
+    db.execute(insert(Transaction), [
+        {
+            "type": "incoming" if id % 2 else "outgoing",
+            "description": f"Movimentação {id}",
+            "date": date(2021, 1, 1) + timedelta(days=id % 365),
+            "provider_id": 1 if id % 2 else None,
+            "created_by": 1
+        }
+        for id in range(1, records + 1)
+    ])
+    db.execute(insert(TransactionProduct), [
+        {"transaction_id": id, "product_id": (id * 7 + offset) % PRODUCTS + 1, "quantity": 1}
+        for id in range(1, records + 1)
+        for offset in range(PRODUCTS_PER_TRANSACTION)
+    ])
+    db.commit()
+
+
+def encode_with_pydantic(type_, content, **options) -> bytes:
+    # What FastAPI does with a route `response_model`
+    field = create_response_field(name="Response", type_=type_)
+    content = asyncio.run(serialize_response(field=field, response_content=content, **options))
+    return JSONResponse(content).body
+
+
+def measure(function) -> tuple:
+    timings = []
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        body = function()
+        timings.append(perf_counter() - start)
+    return len(body), median(timings) * 1000
+
+
+def main(records: int) -> None:
+    drop_all()
+    create_all()
+    db = SessionLocal()
+    try:
+        seed(db, records)
+
+        products = db.query(Product).order_by(Product.id).limit(records).all()
+        product_rows = db.query(*PRODUCT_RECORD_COLUMNS).order_by(Product.id).limit(records).all()
+        transactions = db.query(Transaction).order_by(Transaction.id).options(
+            selectinload(Transaction.products_transaction)
+        ).all()
+        service = TransactionService()
+        query = service._make_transaction_query_with_filters(db)
+        transaction_rows = service._make_records_query(query).order_by(Transaction.id).all()
+        transaction_products_rows = db.execute(
+            service._make_record_products_select(query.with_entities(Transaction.id))
+        ).all()
+
+        cases = (
+            ("products pydantic", lambda: encode_with_pydantic(
+                ProductsResponse,
+                ProductsResponse(records = parse_obj_as(List[ProductResponse], products)),
+                exclude_unset=True
+            )),
+            ("products plain", lambda: dumps(
+                {"records": [make_product_record(product) for product in product_rows]}
+            )),
+            ("transactions pydantic", lambda: encode_with_pydantic(
+                List[TransactionResponse],
+                parse_obj_as(List[TransactionResponse], transactions),
+                exclude_unset=True, exclude_none=True
+            )),
+            ("transactions plain", lambda: dumps(drop_none(
+                service._make_records(transaction_rows, transaction_products_rows)
+            )))
+        )
+
+        print(f"{records} records, encoder: {'orjson' if orjson is not None else 'json'}")
+        for name, function in cases:
+            size, elapsed = measure(function)
+            print(f"{name:>21}: {size} bytes, median {elapsed:.1f} ms")
+    finally:
+        db.close()
+        drop_all()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,105 @@
+"""
+Compare the `product_name` transaction filter as an id list against the semi-join subquery.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.transaction_product_filter [transactions]
+
+Without `DATABASE_URL` a temporary SQLite database is used. The tables are
+created and seeded, so never point it to a database in use.
+"""
+# Standard Imports
+import os
+import sys
+from datetime import date, timedelta
+from statistics import median
+from tempfile import mkstemp
+from time import perf_counter
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = "sqlite:///" + mkstemp(suffix=".db")[1]
+
+from sqlalchemy import func, insert
+
+import app.main  # noqa: F401, configures all the mappers
+from app.db.engine import SessionLocal, create_all, drop_all
+from app.modules.users.models import User
+from app.modules.products.models import Product
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.services import TransactionService
+from app.modules.transactions_products.models import TransactionProduct
+
+
+PRODUCTS = 200
+PRODUCTS_PER_TRANSACTION = 3
+ROUNDS = 10
+
+# Matches 1 of each 10 products, on many transactions
+PRODUCT_NAME = "camisa"
+
+
+def seed(db, transactions: int) -> None:
+    db.execute(insert(User), [{
+        "first_name": "Bench", "last_name": "Mark", "email": "bench@mark.com",
+        "password": "-", "admin": True
+    }])
+    db.execute(insert(Product), [
+        {
+            "name": f"{'Camisa' if id % 10 == 0 else 'Calça'} {id}",
+            "size": "M", "inventory": 0, "weight": 1, "created_by": 1
+        }
+        for id in range(1, PRODUCTS + 1)
+    ])
+    db.execute(insert(Transaction), [
+        {"type": "outgoing", "date": date(2021, 1, 1) + timedelta(days=id % 365), "created_by": 1}
+        for id in range(1, transactions + 1)
+    ])
+    db.execute(insert(TransactionProduct), [
+        {
+            "transaction_id": id,
+            "product_id": (id * 7 + offset) % PRODUCTS + 1,
+            "quantity": 1
+        }
+        for id in range(1, transactions + 1)
+        for offset in range(PRODUCTS_PER_TRANSACTION)
+    ])
+    db.commit()
+
+
+def count_with_id_list(db) -> int:
+    # The previous implementation, one bound parameter per matching transaction
+    ids = db.query(TransactionProduct.transaction_id).join(TransactionProduct.product).filter(
+        func.lower(Product.name).contains(PRODUCT_NAME, autoescape=True)
+    ).all()
+    return db.query(Transaction.id).filter(Transaction.id.in_([id for id, in ids])).count()
+
+
+def count_with_subquery(db) -> int:
+    query = TransactionService()._make_transaction_query_with_filters(db, product_name=PRODUCT_NAME)
+    return query.with_entities(Transaction.id).count()
+
+
+def measure(db, function) -> tuple:
+    timings = []
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        result = function(db)
+        timings.append(perf_counter() - start)
+    return result, median(timings) * 1000
+
+
+def main(transactions: int) -> None:
+    drop_all()
+    create_all()
+    db = SessionLocal()
+    try:
+        seed(db, transactions)
+        for name, function in (("id list", count_with_id_list), ("subquery", count_with_subquery)):
+            result, elapsed = measure(db, function)
+            print(f"{name:>8}: {result} transactions, median {elapsed:.1f} ms")
+    finally:
+        db.close()
+        drop_all()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,74 @@
+# Standard Imports
+from logging.config import fileConfig
+from sqlalchemy import create_engine, pool, text
+from alembic import context
+
+# Database Configuration
+from app.core.config import DATABASE_URL
+from app.core.config import MIGRATION_LOCK_TIMEOUT
+
+# Database Models, registered on the metadata compared by autogenerate
+from app.db import models  # noqa: F401
+from app.db.engine import Base
+
+
+config = context.config
+fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name: str, type_: str, reflected: bool, compare_to) -> bool:
+    """
+    Leave the name search objects out of autogenerate, they are created by
+    `create_column_search` and not declared on the models.
+    """
+    if reflected and compare_to is None:
+        return not ("_fts" in name or name.endswith("_trgm"))
+    return True
+
+
+def run_migrations_offline() -> None:
+    """
+    Write the migrations SQL to the output, without connecting to the database.
+    """
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"}
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    Run the migrations on the database, each one in its own transaction.
+    """
+    connectable = create_engine(DATABASE_URL, poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            # Fails fast instead of queueing the requests behind a migration waiting for a lock
+            connection.execute(text(f"SET lock_timeout = '{MIGRATION_LOCK_TIMEOUT}'"))
+
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+            transaction_per_migration=True,
+            # SQLite alters tables by copying them
+            render_as_batch=connection.dialect.name == "sqlite"
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,104 @@
+"""Initial schema, as created by the former /create-all endpoint
+
+Databases created by that endpoint already have it, mark them with
+`alembic stamp 0001` before the first `alembic upgrade head`. The later
+revisions add the name search, inventory snapshots and movement reports
+objects, then backfill the last two from the stored transactions:
+
+    python -m app.modules.inventory_snapshots.rebuild
+    python -m app.modules.reports.rebuild
+
+Revision ID: 0001
+Revises:
+Create Date: 2021-06-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column('created_on', sa.DateTime()),
+        sa.Column('updated_on', sa.DateTime())
+    ]
+
+
+def upgrade():
+    op.create_table(
+        'base_users',
+        *_timestamps(),
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('first_name', sa.String()),
+        sa.Column('last_name', sa.String()),
+        sa.Column('email', sa.String(), unique=True),
+        sa.Column('password', sa.String()),
+        sa.Column('is_admin', sa.Boolean()),
+        sa.Column('is_deleted', sa.Boolean())
+    )
+    op.create_table(
+        'base_products',
+        *_timestamps(),
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('size', sa.String(), nullable=False),
+        sa.Column('inventory', sa.Integer(), nullable=False),
+        sa.Column('weight', sa.Float()),
+        sa.Column('is_deleted', sa.Boolean()),
+        sa.Column('created_by', sa.Integer(), sa.ForeignKey('base_users.id'), nullable=False)
+    )
+    op.create_table(
+        'base_providers',
+        *_timestamps(),
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False),
+        sa.Column('cnpj', sa.String(14), nullable=False),
+        sa.Column('phone_number', sa.String(20)),
+        sa.Column('email', sa.String(120)),
+        sa.Column('contact_name', sa.String(100)),
+        sa.Column('is_deleted', sa.Boolean()),
+        sa.Column('created_by', sa.Integer(), sa.ForeignKey('base_users.id'), nullable=False)
+    )
+    op.create_table(
+        'base_transactions',
+        *_timestamps(),
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('type', sa.Enum('incoming', 'outgoing', name='transactiontypeenum'), nullable=False),
+        sa.Column('description', sa.TEXT()),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('provider_id', sa.Integer(), sa.ForeignKey('base_providers.id')),
+        sa.Column('created_by', sa.Integer(), sa.ForeignKey('base_users.id'), nullable=False)
+    )
+    op.create_table(
+        'support_products_image',
+        *_timestamps(),
+        sa.Column('product_id', sa.Integer(), sa.ForeignKey('base_products.id'), primary_key=True),
+        sa.Column('image_data', sa.TEXT())
+    )
+    op.create_table(
+        'base_transactions_products',
+        *_timestamps(),
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('transaction_id', sa.Integer(), sa.ForeignKey('base_transactions.id'), nullable=False),
+        sa.Column('product_id', sa.Integer(), sa.ForeignKey('base_products.id'), nullable=False)
+    )
+    op.create_index('combined_single_value', 'base_transactions_products', ['transaction_id', 'product_id'])
+
+
+def downgrade():
+    op.drop_table('base_transactions_products')
+    op.drop_table('support_products_image')
+    op.drop_table('base_transactions')
+    op.drop_table('base_providers')
+    op.drop_table('base_products')
+    op.drop_table('base_users')
+
+    sa.Enum(name='transactiontypeenum').drop(op.get_bind(), checkfirst=True)
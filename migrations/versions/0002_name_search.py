@@ -0,0 +1,45 @@
+"""Name search indexes of the products and providers
+
+Trigram GIN indexes on PostgreSQL, FTS5 tables kept by triggers on
+SQLite. The existing names are indexed by the creation itself.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2021-06-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.search import create_column_search, drop_column_search
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def _name_column(table_name: str) -> sa.Column:
+    # The SQLite search table is keyed by the primary key
+    table = sa.Table(
+        table_name, sa.MetaData(),
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String())
+    )
+    return table.c.name
+
+
+def upgrade():
+    create_column_search(op.get_bind(), _name_column('base_products'))
+    create_column_search(op.get_bind(), _name_column('base_providers'))
+
+
+def downgrade():
+    drop_column_search(op.get_bind(), _name_column('base_products'))
+    drop_column_search(op.get_bind(), _name_column('base_providers'))
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_base_products_name_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_base_providers_name_trgm")
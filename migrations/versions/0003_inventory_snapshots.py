@@ -0,0 +1,35 @@
+"""Monthly inventory snapshots of the products
+
+Transactions stored before this revision have no snapshots, backfill
+them with `python -m app.modules.inventory_snapshots.rebuild`. Until
+then the stock at a past date is summed from all the older transactions.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2021-06-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'support_inventory_snapshots',
+        sa.Column('created_on', sa.DateTime()),
+        sa.Column('updated_on', sa.DateTime()),
+        sa.Column('product_id', sa.Integer(), sa.ForeignKey('base_products.id'), primary_key=True),
+        sa.Column('date', sa.Date(), primary_key=True),
+        sa.Column('inventory', sa.Integer(), nullable=False)
+    )
+
+
+def downgrade():
+    op.drop_table('support_inventory_snapshots')
@@ -0,0 +1,57 @@
+"""Daily and monthly movement rollups of the products and providers
+
+Transactions stored before this revision are not in the rollups, the
+reports are empty until `python -m app.modules.reports.rebuild` runs.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2021-06-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column('created_on', sa.DateTime()),
+        sa.Column('updated_on', sa.DateTime())
+    ]
+
+
+def upgrade():
+    op.create_table(
+        'report_products_movements',
+        *_timestamps(),
+        sa.Column('period', sa.Enum('daily', 'monthly', name='reportperiodenum'), primary_key=True),
+        sa.Column('date', sa.Date(), primary_key=True),
+        sa.Column('product_id', sa.Integer(), sa.ForeignKey('base_products.id'), primary_key=True),
+        sa.Column('incoming_quantity', sa.Integer(), nullable=False),
+        sa.Column('outgoing_quantity', sa.Integer(), nullable=False),
+        sa.Column('transactions', sa.Integer(), nullable=False)
+    )
+    op.create_table(
+        'report_providers_movements',
+        *_timestamps(),
+        # The enum type is created with the products movements table
+        sa.Column('period', postgresql.ENUM('daily', 'monthly', name='reportperiodenum', create_type=False), primary_key=True),
+        sa.Column('date', sa.Date(), primary_key=True),
+        sa.Column('provider_id', sa.Integer(), sa.ForeignKey('base_providers.id'), primary_key=True),
+        sa.Column('incoming_quantity', sa.Integer(), nullable=False),
+        sa.Column('transactions', sa.Integer(), nullable=False)
+    )
+
+
+def downgrade():
+    op.drop_table('report_providers_movements')
+    op.drop_table('report_products_movements')
+
+    sa.Enum(name='reportperiodenum').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,42 @@
+"""Indexes of the soft-delete, date-range and foreign key filters
+
+Built concurrently on PostgreSQL, the tables stay writable meanwhile.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2021-06-15 00:00:00
+
+"""
+from app.db.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+# Name, table, columns and partial index condition
+INDEXES = [
+    ('ix_base_users_active_id', 'base_users', ['is_deleted', 'id'], 'NOT is_deleted'),
+    ('ix_base_products_active_id', 'base_products', ['is_deleted', 'id'], 'NOT is_deleted'),
+    ('ix_base_products_created_by', 'base_products', ['created_by'], None),
+    ('ix_base_providers_active_id', 'base_providers', ['is_deleted', 'id'], 'NOT is_deleted'),
+    ('ix_base_providers_created_by', 'base_providers', ['created_by'], None),
+    ('ix_base_transactions_date', 'base_transactions', ['date'], None),
+    ('ix_base_transactions_type_date', 'base_transactions', ['type', 'date'], None),
+    ('ix_base_transactions_provider_id', 'base_transactions', ['provider_id'], None),
+    ('ix_base_transactions_created_by', 'base_transactions', ['created_by'], None),
+    ('ix_base_transactions_products_product_id', 'base_transactions_products', ['product_id'], None)
+]
+
+
+def upgrade():
+    for name, table_name, columns, where in INDEXES:
+        create_index_online(name, table_name, columns, where)
+
+
+def downgrade():
+    for name, table_name, _, _ in reversed(INDEXES):
+        drop_index_online(name, table_name)
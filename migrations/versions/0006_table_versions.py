@@ -0,0 +1,31 @@
+"""Versions of the tables, raised by every committed write
+
+The list ETags are made from them. The row of a table is created by its
+first write, until then its version is 0.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2021-07-01 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'support_table_versions',
+        sa.Column('name', sa.String(64), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False)
+    )
+
+
+def downgrade():
+    op.drop_table('support_table_versions')
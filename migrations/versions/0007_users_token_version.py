@@ -0,0 +1,32 @@
+"""Token version of the users, raised by every edit
+
+The stateless tokens carry it, the tokens of older versions are revoked.
+The versions were the `updated_on` time before, the tokens issued with it
+are revoked once by the upgrade.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2021-07-15 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'base_users',
+        sa.Column('token_version', sa.Integer(), nullable=False, server_default='0')
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('base_users') as batch_op:
+        batch_op.drop_column('token_version')
@@ -0,0 +1,52 @@
+# Standard Imports
+import os
+import re
+from tempfile import mkstemp
+
+# The application reads its configuration on import
+_, DATABASE_PATH = mkstemp(suffix=".db")
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + DATABASE_PATH + "?check_same_thread=false")
+os.environ["SQL_INSTRUMENTATION"] = "true"
+
+import pytest
+from starlette.testclient import TestClient
+
+from app import API_PREFIX
+from app.main import create_app
+from app.core.auth import user_cache
+from app.db.engine import create_all, drop_all, engine
+from app.utils.query_cache import query_cache
+
+
+ADMIN = {"first_name": "Fulano", "last_name": "Silva", "email": "fulano@sbf.com", "password": "secret"}
+
+
+def count_queries(response) -> int:
+    """
+    SQL statements sent by the request, read from its `Server-Timing` header.
+    """
+    return int(re.search(r'desc="(\d+) queries"', response.headers["server-timing"]).group(1))
+
+
+@pytest.fixture(scope="session")
+def app():
+    yield create_app()
+    engine.dispose()
+    if os.path.exists(DATABASE_PATH):
+        os.remove(DATABASE_PATH)
+
+
+@pytest.fixture
+def client(app):
+    drop_all()
+    create_all()
+    user_cache.clear()
+    query_cache.clear()
+    return TestClient(app)
+
+
+@pytest.fixture
+def headers(client) -> dict:
+    client.post(API_PREFIX + "/first-access", json=ADMIN)
+    response = client.post(API_PREFIX + "/login", json={"username": ADMIN["email"], "password": ADMIN["password"]})
+    return {"Authorization": "Bearer " + response.json()["access_token"]}
@@ -0,0 +1,87 @@
+# Standard Imports
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from app import API_PREFIX
+from app.core import auth
+from app.core.auth import user_cache
+from app.core.passwords import make_password_context, password_hasher
+from app.core.tokens import token_versions
+from app.db.engine import SessionLocal
+from app.modules.users.models import User
+
+from .conftest import ADMIN
+from .test_transactions import create_product
+
+
+USER = {"first_name": "Ciclano", "last_name": "Souza", "email": "ciclano@sbf.com", "password": "secret", "admin": True}
+
+
+def login(client, email: str, password: str) -> dict:
+    response = client.post(API_PREFIX + "/login", json={"username": email, "password": password})
+    assert response.status_code == 200
+    return {"Authorization": "Bearer " + response.json()["access_token"]}
+
+
+def test_stateless_token_is_revoked_by_user_changes(client, monkeypatch):
+    monkeypatch.setattr(auth, "AUTH_STATELESS_TOKENS", True)
+    monkeypatch.setattr(token_versions, "_versions", {})
+    client.post(API_PREFIX + "/first-access", json=ADMIN)
+    admin_headers = login(client, ADMIN["email"], ADMIN["password"])
+    user_id = client.post(API_PREFIX + "/admin/users/", headers=admin_headers, json=USER).json()["id"]
+    product_path = API_PREFIX + f"/products/{create_product(client, admin_headers)}"
+
+    # Demoted within the same second the user was created
+    headers = login(client, USER["email"], USER["password"])
+    assert client.get(product_path, headers=headers).status_code == 200
+    assert client.patch(API_PREFIX + f"/admin/users/{user_id}", headers=admin_headers,
+        json={"admin": False}).status_code == 200
+    token_versions.refresh()
+    assert client.get(product_path, headers=headers).status_code == 401
+
+    headers = login(client, USER["email"], USER["password"])
+    assert client.get(product_path, headers=headers).status_code == 200
+    assert client.delete(API_PREFIX + f"/admin/users/{user_id}", headers=admin_headers).status_code == 200
+    token_versions.refresh()
+    assert client.get(product_path, headers=headers).status_code == 401
+
+    # The tokens of the other users stay valid
+    assert client.get(product_path, headers=admin_headers).status_code == 200
+
+
+def test_login_rehashes_legacy_passwords(client, monkeypatch):
+    client.post(API_PREFIX + "/first-access", json=ADMIN)
+    # The stored pbkdf2_sha256 hash becomes a legacy one
+    monkeypatch.setattr(password_hasher, "context", make_password_context("sha256_crypt"))
+    updated_on = datetime(2021, 1, 1)
+    with SessionLocal() as db:
+        db.execute(update(User).where(User.email == ADMIN["email"]).values(updated_on=updated_on))
+        db.commit()
+
+    login(client, ADMIN["email"], ADMIN["password"])
+    with SessionLocal() as db:
+        user = db.execute(select(User).where(User.email == ADMIN["email"])).scalar_one()
+    assert user.password.startswith("$5$")
+    assert user.updated_on == updated_on
+
+    # Still accepted with the new hash
+    user_cache.clear()
+    login(client, ADMIN["email"], ADMIN["password"])
+
+
+def test_login_with_wrong_password(client):
+    client.post(API_PREFIX + "/first-access", json=ADMIN)
+    response = client.post(API_PREFIX + "/login", json={"username": ADMIN["email"], "password": "wrong"})
+    assert response.status_code == 401
+
+
+def test_login_with_busy_password_hasher(client, monkeypatch):
+    client.post(API_PREFIX + "/first-access", json=ADMIN)
+    monkeypatch.setattr(password_hasher, "_pending", password_hasher.max_pending)
+    monkeypatch.setattr(password_hasher, "rejected", 0)
+
+    response = client.post(API_PREFIX + "/login", json={"username": ADMIN["email"], "password": ADMIN["password"]})
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert password_hasher.rejected == 1
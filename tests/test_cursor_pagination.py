@@ -0,0 +1,67 @@
+# Standard Imports
+from base64 import urlsafe_b64encode
+
+import pytest
+
+from app import API_PREFIX
+from app.utils.pagination import encode_cursor
+
+from .test_transactions import create_incoming, create_product, create_provider
+
+
+def walk(client, headers, path: str, direction: str, cursor: str = None, limit: int = 3) -> list:
+    """
+    Ids of the records of every page, following the `direction` cursors.
+    """
+    ids = []
+    while True:
+        params = {"limit": limit, **({"after" if direction == "next" else "before": cursor} if cursor else {})}
+        response = client.get(API_PREFIX + path + "cursor", headers=headers, params=params)
+        assert response.status_code == 200
+        ids.append([record["id"] for record in response.json()["records"]])
+        cursor = response.json()["pagination_metadata"][direction + "_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("path, create", [("/products/", create_product), ("/providers/", create_provider)])
+def test_cursor_walks_every_page(client, headers, path, create):
+    ids = [create(client, headers) for _ in range(7)]
+
+    pages = walk(client, headers, path, "next")
+    assert pages == [ids[0:3], ids[3:6], ids[6:7]]
+
+    # Back from the last record
+    pages = walk(client, headers, path, "previous", encode_cursor(ids[-1] + 1))
+    assert pages == [ids[4:7], ids[1:4], ids[0:1]]
+
+
+def test_cursor_survives_deleted_records(client, headers):
+    ids = [create_product(client, headers) for _ in range(7)]
+    response = client.get(API_PREFIX + "/products/cursor", headers=headers, params={"limit": 3})
+    cursor = response.json()["pagination_metadata"]["next_cursor"]
+
+    # The cursor record and the first one of the next page are deleted mid walk
+    for id in (ids[2], ids[3]):
+        assert client.delete(API_PREFIX + f"/products/{id}", headers=headers).status_code == 200
+
+    assert walk(client, headers, "/products/", "next", cursor) == [ids[4:7]]
+
+
+@pytest.mark.parametrize("params", [
+    {"after": "not a cursor"},
+    {"after": "%%%"},
+    {"before": urlsafe_b64encode(b"name:1").decode()},
+    {"after": urlsafe_b64encode(b"id:abc").decode()},
+    {"after": urlsafe_b64encode(b"id:1:2").decode()},
+    {"after": urlsafe_b64encode(b"\xff\xfe").decode()},
+    {"after": urlsafe_b64encode(b"id:99999999999999999999999").decode()},
+    {"after": encode_cursor(1), "before": encode_cursor(2)}
+])
+@pytest.mark.parametrize("path", ["/products/", "/providers/", "/transaction/"])
+def test_invalid_cursor(client, headers, path, params):
+    product_id = create_product(client, headers)
+    create_incoming(client, headers, create_provider(client, headers), {product_id: 1})
+
+    response = client.get(API_PREFIX + path + "cursor", headers=headers, params=params)
+    assert response.status_code == 400
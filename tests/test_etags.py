@@ -0,0 +1,71 @@
+import pytest
+
+from app import API_PREFIX
+
+from .test_transactions import create_incoming, create_product, create_provider
+
+
+def list_etag(client, headers, path: str) -> str:
+    response = client.get(API_PREFIX + path, headers=headers)
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+def test_products_list_etag_changes_on_every_write(client, headers):
+    first_id = create_product(client, headers)
+    create_product(client, headers)
+    etags = [list_etag(client, headers, "/products/")]
+
+    # Same second updates, then the soft delete of the oldest product
+    for weight in (1.0, 2.0):
+        assert client.patch(API_PREFIX + f"/products/{first_id}", headers=headers, json={"weight": weight}).status_code == 200
+        etags.append(list_etag(client, headers, "/products/"))
+    assert client.delete(API_PREFIX + f"/products/{first_id}", headers=headers).status_code == 200
+    etags.append(list_etag(client, headers, "/products/"))
+
+    assert len(set(etags)) == len(etags)
+    response = client.get(API_PREFIX + "/products/", headers={**headers, "If-None-Match": etags[0]})
+    assert response.status_code == 200
+    response = client.get(API_PREFIX + "/products/", headers={**headers, "If-None-Match": etags[-1]})
+    assert response.status_code == 304
+
+
+def test_transactions_list_etag_follows_the_stock_changes(client, headers):
+    product_id = create_product(client, headers, inventory=0)
+    create_incoming(client, headers, create_provider(client, headers), {product_id: 1})
+    before = [list_etag(client, headers, path) for path in ("/products/", "/providers/", "/transaction/")]
+
+    outgoing = {"type": "SAIDA", "date": "2021-01-02", "products": [{"product_id": product_id, "quantity": 2}]}
+    assert client.post(API_PREFIX + "/outgoing/transaction/", headers=headers, json=outgoing).status_code == 422
+    # Rolled back, nothing changed
+    assert [list_etag(client, headers, path) for path in ("/products/", "/providers/", "/transaction/")] == before
+
+    outgoing["products"][0]["quantity"] = 1
+    assert client.post(API_PREFIX + "/outgoing/transaction/", headers=headers, json=outgoing).status_code == 201
+    after = [list_etag(client, headers, path) for path in ("/products/", "/providers/", "/transaction/")]
+    assert after[0] != before[0] and after[1] == before[1] and after[2] != before[2]
+
+
+@pytest.mark.parametrize("path, create, field", [
+    ("/products/", create_product, "weight"),
+    ("/providers/", create_provider, "phone_number")
+])
+def test_record_etag_changes_on_same_second_updates(client, headers, path, create, field):
+    path += str(create(client, headers))
+    etags = [list_etag(client, headers, path)]
+    for value in ("1", "2"):
+        assert client.patch(API_PREFIX + path, headers=headers, json={field: value}).status_code == 200
+        etags.append(list_etag(client, headers, path))
+
+    assert len(set(etags)) == len(etags)
+    response = client.get(API_PREFIX + path, headers={**headers, "If-None-Match": etags[-1]})
+    assert response.status_code == 304
+
+
+def test_transaction_etag_follows_its_product_names(client, headers):
+    product_id = create_product(client, headers)
+    path = f"/transaction/{create_incoming(client, headers, create_provider(client, headers), {product_id: 1})['id']}"
+    before = list_etag(client, headers, path)
+
+    assert client.patch(API_PREFIX + f"/products/{product_id}", headers=headers, json={"name": "Bermuda"}).status_code == 200
+    assert list_etag(client, headers, path) != before
@@ -0,0 +1,66 @@
+# Standard Imports
+import sys
+import csv
+import json
+
+import pytest
+
+from app import API_PREFIX
+from app.db.engine import SessionLocal
+from app.modules.transactions import services
+from app.modules.transactions.schemas import TransactionExportFormatEnum
+from app.modules.transactions.services import TransactionService
+
+from .test_transactions import create_incoming, create_product, create_provider
+
+
+@pytest.fixture
+def transactions(client, headers, monkeypatch) -> dict:
+    """
+    Quantities by product id of 3 transactions of 3 products each, exported
+    in batches of 2 rows so every transaction crosses a batch boundary.
+    """
+    monkeypatch.setattr(services, "EXPORT_BATCH_SIZE", 2)
+    products = [create_product(client, headers) for _ in range(3)]
+    provider_id = create_provider(client, headers)
+
+    transactions = {}
+    for number in range(3):
+        quantities = {id: number * 3 + index + 1 for index, id in enumerate(products)}
+        transactions[create_incoming(client, headers, provider_id, quantities)["id"]] = quantities
+    return transactions
+
+
+def export(export_format: TransactionExportFormatEnum) -> str:
+    with SessionLocal() as db:
+        return "".join(TransactionService().export(db, export_format))
+
+
+def test_ndjson_export_groups_the_products_of_each_transaction(transactions):
+    lines = [json.loads(line) for line in export(TransactionExportFormatEnum.ndjson).splitlines()]
+
+    assert [line["id"] for line in lines] == list(transactions)
+    for line in lines:
+        assert {product["product_id"]: product["quantity"] for product in line["products"]} == transactions[line["id"]]
+        assert line["provider_name"] == "Fornecedora"
+
+
+def test_csv_export_lists_the_products_of_each_transaction(transactions):
+    rows = list(csv.DictReader(export(TransactionExportFormatEnum.csv).splitlines()))
+
+    assert len(rows) == 9
+    assert [int(row["id"]) for row in rows] == [id for id in transactions for _ in range(3)]
+    for row in rows:
+        assert transactions[int(row["id"])][int(row["product_id"])] == int(row["quantity"])
+        assert row["type"] == "ENTRADA" and row["product_name"] == "Camisa"
+
+
+# starlette 0.13 streams with asyncio.wait over coroutines, which Python 3.11 forbids
+@pytest.mark.skipif(sys.version_info >= (3, 11), reason="StreamingResponse of starlette 0.13 fails on Python 3.11")
+@pytest.mark.parametrize("export_format, media_type", [("ndjson", "application/x-ndjson"), ("csv", "text/csv")])
+def test_export_route(client, headers, transactions, export_format, media_type):
+    response = client.get(API_PREFIX + "/transaction/export", headers=headers, params={"format": export_format})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(media_type)
+    assert response.text == export(TransactionExportFormatEnum(export_format))
@@ -0,0 +1,133 @@
+# Standard Imports
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.db.engine import SessionLocal, create_all, drop_all, engine
+from app.modules.users.models import User
+from app.modules.users.services import UserService
+from app.modules.products.models import Product
+from app.modules.products.services import ProductService
+from app.modules.providers.models import Provider
+from app.modules.providers.services import ProviderService
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.schemas import TransactionTypeEnum
+from app.modules.transactions.services import TransactionService
+from app.modules.transactions_products.models import TransactionProduct
+from app.modules.inventory_snapshots.services import InventorySnapshotService
+from app.utils.query_cache import query_cache
+
+
+RECORDS = 2000
+
+PRODUCTS_PER_TRANSACTION = 3
+
+DAY = date(2021, 3, 1)
+
+
+def seed(db) -> None:
+    db.execute(insert(User), [
+        {
+            "first_name": "Bench", "last_name": str(id), "email": f"bench{id}@sbf.com",
+            "password": "-", "admin": id == 1, "is_deleted": id % 10 == 0
+        }
+        for id in range(1, RECORDS // 10 + 1)
+    ])
+    db.execute(insert(Provider), [
+        {
+            "name": f"Fornecedor {id}", "cnpj": "11222333000181", "phone_number": "1",
+            "email": "fornecedor@sbf.com", "contact_name": "Ciclano", "created_by": 1,
+            "is_deleted": id % 10 == 0
+        }
+        for id in range(1, RECORDS + 1)
+    ])
+    db.execute(insert(Product), [
+        {
+            "name": f"Camisa {id}", "size": "M", "inventory": 10, "weight": 1.5, "created_by": 1,
+            "is_deleted": id % 10 == 0
+        }
+        for id in range(1, RECORDS + 1)
+    ])
+    db.execute(insert(Transaction), [
+        {
+            "type": "incoming" if id % 2 else "outgoing",
+            "description": f"Movimentação {id}",
+            "date": date(2021, 1, 1) + timedelta(days=id % 1000),
+            "provider_id": id if id % 2 else None,
+            "created_by": 1
+        }
+        for id in range(1, RECORDS + 1)
+    ])
+    db.execute(insert(TransactionProduct), [
+        {"transaction_id": id, "product_id": (id * 7 + offset) % RECORDS + 1, "quantity": 1}
+        for id in range(1, RECORDS + 1)
+        for offset in range(PRODUCTS_PER_TRANSACTION)
+    ])
+    db.commit()
+
+    # The planner works with the statistics of a filled database
+    db.execute(text("ANALYZE"))
+    db.commit()
+
+
+def explain(statement: str, parameters) -> str:
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(prefix + statement, parameters).all()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+@pytest.fixture(scope="module")
+def db(app):
+    drop_all()
+    create_all()
+    db = SessionLocal()
+    try:
+        seed(db)
+        yield db
+    finally:
+        db.close()
+        drop_all()
+
+
+@pytest.fixture
+def selects():
+    statements = []
+
+    def capture_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    query_cache.clear()
+    event.listen(engine, "before_cursor_execute", capture_statement)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture_statement)
+
+
+@pytest.mark.parametrize("index, fetch", [
+    ("ix_base_products_active_id", lambda db: ProductService().fetch_all_with_pagination(db, 2, 20)),
+    ("ix_base_products_active_id", lambda db: ProductService().fetch_all_with_cursor(db, limit=20)),
+    ("ix_base_providers_active_id", lambda db: ProviderService().fetch_all_with_pagination(db, 2, 20)),
+    ("ix_base_providers_active_id", lambda db: ProviderService().fetch_all_with_cursor(db, limit=20)),
+    ("ix_base_users_active_id", lambda db: UserService().fetch_all(db)),
+    ("ix_base_transactions_date", lambda db: TransactionService().fetch_all_with_pagination(
+        db, 1, 20, start_date=DAY, finish_date=DAY + timedelta(days=6)
+    )),
+    ("ix_base_transactions_type_date", lambda db: TransactionService().fetch_all_with_pagination(
+        db, 1, 20, transaction_type=TransactionTypeEnum.outgoing, start_date=DAY, finish_date=DAY + timedelta(days=6)
+    )),
+    ("ix_base_transactions_products_product_id", lambda db: TransactionService().fetch_all_with_pagination(
+        db, 1, 20, product_name="Camisa 77"
+    )),
+    ("ix_base_transactions_products_product_id", lambda db: InventorySnapshotService().fetch_inventory_at(db, 7, DAY))
+], ids=[
+    "products page", "products cursor", "providers page", "providers cursor", "users list",
+    "transactions date range", "transactions type and date", "transactions product name",
+    "product inventory at date"
+])
+def test_query_uses_index(db, selects, index, fetch):
+    fetch(db)
+    plans = [explain(statement, parameters) for statement, parameters in selects]
+
+    assert any(index in plan for plan in plans), "\n\n".join(plans)
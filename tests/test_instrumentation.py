@@ -0,0 +1,30 @@
+# Standard Imports
+import json
+import logging
+
+from sqlalchemy import select
+
+from app import API_PREFIX
+from app.db import instrumentation
+from app.db.engine import SessionLocal
+from app.modules.users.models import User
+
+from .conftest import ADMIN
+
+
+def test_slow_queries_log_no_credentials(client, caplog, monkeypatch):
+    # Every statement is logged
+    monkeypatch.setattr(instrumentation, "SQL_SLOW_QUERY_SECONDS", 0)
+    caplog.set_level(logging.WARNING, logger="app.db.queries")
+
+    client.post(API_PREFIX + "/first-access", json=ADMIN)
+    response = client.post(API_PREFIX + "/login", json={"username": ADMIN["email"], "password": ADMIN["password"]})
+    assert response.status_code == 200
+    with SessionLocal() as db:
+        hashed = db.execute(select(User.password).where(User.email == ADMIN["email"])).scalar_one()
+
+    records = [json.loads(record.getMessage()) for record in caplog.records if record.name == "app.db.queries"]
+    assert any(record["statement"].startswith("INSERT INTO base_users") for record in records)
+    assert any(record["statement"].startswith("SELECT") and "base_users.email = ?" in record["statement"] for record in records)
+    for secret in (ADMIN["email"], ADMIN["password"], hashed):
+        assert secret not in caplog.text
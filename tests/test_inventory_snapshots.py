@@ -0,0 +1,49 @@
+# Standard Imports
+from sqlalchemy import delete, select
+
+from app import API_PREFIX
+from app.db.engine import SessionLocal
+from app.modules.inventory_snapshots.models import InventorySnapshot
+from app.modules.inventory_snapshots.services import InventorySnapshotService
+
+from .test_transactions import create_product, create_provider
+
+
+def read_snapshots() -> list:
+    db = SessionLocal()
+    try:
+        return db.execute(select(
+            InventorySnapshot.product_id, InventorySnapshot.date, InventorySnapshot.inventory
+        ).order_by(InventorySnapshot.product_id, InventorySnapshot.date)).all()
+    finally:
+        db.close()
+
+
+def test_rebuild_backfills_the_snapshots_of_the_transactions(client, headers):
+    products = [create_product(client, headers, inventory=10) for _ in range(3)]
+    provider_id = create_provider(client, headers)
+    # Stored out of date order, the later months snapshots are updated by the earlier transactions
+    for day, type, quantity in [("2021-03-10", "ENTRADA", 4), ("2021-01-05", "SAIDA", 3),
+                                ("2021-03-01", "SAIDA", 2), ("2021-02-20", "ENTRADA", 7)]:
+        transaction = {"type": type, "date": day, "products": [
+            {"product_id": products[0], "quantity": quantity}, {"product_id": products[1], "quantity": 1}
+        ]}
+        if type == "ENTRADA":
+            transaction["provider_id"] = provider_id
+        path = "/incoming/transaction/" if type == "ENTRADA" else "/outgoing/transaction/"
+        assert client.post(API_PREFIX + path, headers=headers, json=transaction).status_code == 201
+
+    created = read_snapshots()
+    db = SessionLocal()
+    try:
+        # As a database with transactions stored before the snapshots
+        db.execute(delete(InventorySnapshot))
+        db.commit()
+        processed = InventorySnapshotService().rebuild(db, batch_size=2)
+    finally:
+        db.close()
+
+    assert processed == 3 and len(created) == 6
+    assert read_snapshots() == created
+    response = client.get(API_PREFIX + f"/products/{products[0]}/inventory", headers=headers, params={"at": "2021-02-28"})
+    assert response.json()["inventory"] == 10 - 3 + 7
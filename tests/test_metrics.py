@@ -0,0 +1,52 @@
+# Standard Imports
+import json
+
+from app.utils.metrics import MetricsFiles, MetricsRegistry, merge_snapshots
+
+
+def make_registry(requests: int, latencies: list, connections: int) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.", ["method"]).inc("GET", amount=requests)
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for latency in latencies:
+        histogram.observe(latency)
+    registry.gauge("connections", "Connections.").inc(amount=connections)
+    return registry
+
+
+def samples(snapshot: dict, name: str) -> list:
+    return [value for _, value in snapshot[name]["samples"]]
+
+
+def test_merge_snapshots():
+    merged = merge_snapshots([
+        (make_registry(3, [0.05, 0.5], 2).snapshot(), True),
+        (make_registry(4, [0.05, 5.0], 7).snapshot(), True),
+        # Stopped, its gauge is left out
+        (make_registry(5, [0.5], 100).snapshot(), False)
+    ])
+
+    assert merged["requests_total"]["samples"] == [[{"method": "GET"}, 12]]
+    latency, = samples(merged, "latency_seconds")
+    assert latency["buckets"] == {"0.1": 2, "1.0": 4, "+Inf": 5}
+    assert (latency["sum"], latency["count"]) == (6.1, 5)
+    assert samples(merged, "connections") == [9]
+
+
+def write_snapshot(directory, name: str, pid: int, started: float, running: bool, registry: MetricsRegistry) -> None:
+    with open(directory / name, "w") as file:
+        json.dump({"pid": pid, "started": started, "running": running, "metrics": registry.snapshot()}, file)
+
+
+def test_metrics_files_with_a_recycled_pid(tmp_path, monkeypatch):
+    files = MetricsFiles(make_registry(1, [], 1), str(tmp_path))
+    monkeypatch.setattr(files, "_is_running", lambda pid: True)
+    # A worker killed without writing its last snapshot, then a new one with its pid
+    write_snapshot(tmp_path, "metrics-100-aaaaaaaa.json", 100, 1.0, True, make_registry(10, [], 10))
+    write_snapshot(tmp_path, "metrics-100-bbbbbbbb.json", 100, 2.0, True, make_registry(2, [], 3))
+    files.write()
+
+    collected = files.collect()
+    assert samples(collected, "requests_total") == [13]
+    assert samples(collected, "connections") == [4]
+    assert len(list(tmp_path.iterdir())) == 3
@@ -0,0 +1,71 @@
+# Standard Imports
+import os
+import sys
+import subprocess
+from tempfile import mkstemp
+from sqlalchemy import create_engine, inspect, text
+
+# Framework Imports
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+
+from app.db import models  # noqa: F401
+from app.db.engine import Base
+from app.db.search import SQLITE_TRIGRAM
+
+
+# Tables of the former /create-all endpoint
+BASELINE_TABLES = [
+    'base_products', 'base_providers', 'base_transactions', 'base_transactions_products', 'base_users',
+    'support_products_image'
+]
+
+
+@pytest.fixture
+def database():
+    _, path = mkstemp(suffix=".db")
+    url = "sqlite:///" + path
+    engine = create_engine(url)
+
+    def alembic(*arguments: str) -> None:
+        subprocess.run(
+            [sys.executable, "-m", "alembic", *arguments],
+            env=dict(os.environ, DATABASE_URL=url), check=True, capture_output=True
+        )
+
+    yield engine, alembic
+    engine.dispose()
+    os.remove(path)
+
+
+def test_stamped_baseline_is_upgraded_to_the_models(database):
+    engine, alembic = database
+    alembic("upgrade", "0001")
+    assert sorted(inspect(engine).get_table_names()) == sorted(BASELINE_TABLES + ['alembic_version'])
+    with engine.begin() as connection:
+        connection.execute(text("INSERT INTO base_users (id, email) VALUES (1, 'fulano@sbf.com')"))
+        connection.execute(text(
+            "INSERT INTO base_products (id, name, size, inventory, created_by) VALUES (1, 'Camisa', 'M', 1, 1)"
+        ))
+
+    alembic("upgrade", "head")
+
+    with engine.connect() as connection:
+        differences = [
+            difference for difference in compare_metadata(MigrationContext.configure(connection), Base.metadata)
+            # The name search objects are not declared on the models
+            if not (difference[0] == "remove_table" and "_fts" in difference[1].name)
+        ]
+        assert differences == []
+        if SQLITE_TRIGRAM:
+            assert connection.execute(text(
+                "SELECT rowid FROM base_products_name_fts WHERE base_products_name_fts MATCH '\"mis\"'"
+            )).scalars().all() == [1]
+
+
+def test_downgrade_removes_every_revision(database):
+    engine, alembic = database
+    alembic("upgrade", "head")
+    alembic("downgrade", "base")
+    assert inspect(engine).get_table_names() == ['alembic_version']
@@ -0,0 +1,50 @@
+# Standard Imports
+from base64 import b64decode
+
+import pytest
+from sqlalchemy import update
+
+from app import API_PREFIX
+from app.db.engine import SessionLocal
+from app.modules.products.models import ProductImage
+
+from .test_transactions import create_product
+
+
+GIF = "R0lGODdhAQABAPAAAP8AAAAAACwAAAAAAQABAAACAkQBADs="
+
+
+def add_image(product_id: int, image_data) -> None:
+    with SessionLocal() as db:
+        ProductImage(product_id=product_id).insert(db)
+        # Set apart, the column default replaces a None
+        db.execute(update(ProductImage).where(ProductImage.product_id == product_id).values(image_data=image_data))
+        db.commit()
+
+
+@pytest.mark.parametrize("image_data, media_type", [
+    (GIF, "image/gif"),
+    ("data:image/png;base64," + GIF, "image/png")
+])
+def test_product_image(client, headers, image_data, media_type):
+    product_id = create_product(client, headers)
+    add_image(product_id, image_data)
+
+    response = client.get(API_PREFIX + f"/products/{product_id}/image", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
+    assert response.content == b64decode(GIF)
+
+    response = client.get(API_PREFIX + f"/products/{product_id}/image",
+        headers={**headers, "If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("image_data", [None, "not base64!", "data:image/png;base64"])
+def test_missing_product_image(client, headers, image_data):
+    product_id = create_product(client, headers)
+    add_image(product_id, image_data)
+
+    assert client.get(API_PREFIX + f"/products/{product_id}/image", headers=headers).status_code == 404
+    assert client.get(API_PREFIX + f"/products/{product_id + 1}/image", headers=headers).status_code == 404
@@ -0,0 +1,56 @@
+# Standard Imports
+import json
+import pickle
+from datetime import date
+
+from app import API_PREFIX
+from app.db.engine import SessionLocal
+from app.modules.products.models import Product
+from app.utils.query_cache import RedisCacheBackend
+
+from .test_transactions import create_product
+
+
+class FakeRedis:
+    """
+    Dict server for the `RedisCacheBackend` tests, no Redis runs here.
+    """
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def info(self, section):
+        return {}
+
+
+def test_list_cache_follows_the_writes_of_other_workers(client, headers):
+    product_id = create_product(client, headers)
+    first = client.get(API_PREFIX + "/products/", headers=headers)
+    assert first.json()["records"][0]["name"] == "Camisa"
+
+    # Committed by another worker, its cache entries are not this worker's
+    with SessionLocal() as db:
+        db.query(Product).filter(Product.id == product_id).one().update(db, name="Bermuda")
+
+    second = client.get(API_PREFIX + "/products/", headers=headers)
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["records"][0]["name"] == "Bermuda"
+
+
+def test_redis_backend_stores_json():
+    backend = RedisCacheBackend("redis://localhost:6379/0")
+    backend.client = FakeRedis()
+
+    backend.set("products", {"records": [{"id": 1, "created_on": date(2021, 1, 2)}]})
+    assert json.loads(backend.client.values["sbf:query:products"]) == {"records": [{"id": 1, "created_on": "2021-01-02"}]}
+    assert backend.get("products") == {"records": [{"id": 1, "created_on": "2021-01-02"}]}
+
+    # Written by any client of the server, never unpickled
+    backend.client.values["sbf:query:products"] = pickle.dumps({"records": []})
+    assert backend.get("products") is None
+    assert backend.stats()["errors"] == 1
@@ -0,0 +1,91 @@
+# Standard Imports
+from sqlalchemy import case, func, select
+
+from app import API_PREFIX
+from app.db.engine import SessionLocal
+from app.modules.reports.models import ProductMovementReport, ProviderMovementReport
+from app.modules.reports.schemas import ReportPeriodEnum
+from app.modules.reports.services import ReportService
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.schemas import TransactionTypeEnum
+from app.modules.transactions_products.models import TransactionProduct
+
+from .test_transactions import create_incoming, create_product, create_provider
+
+
+def read_rollups(db) -> tuple:
+    products = db.execute(select(
+        ProductMovementReport.period, ProductMovementReport.date, ProductMovementReport.product_id,
+        ProductMovementReport.incoming_quantity, ProductMovementReport.outgoing_quantity,
+        ProductMovementReport.transactions
+    )).all()
+    providers = db.execute(select(
+        ProviderMovementReport.period, ProviderMovementReport.date, ProviderMovementReport.provider_id,
+        ProviderMovementReport.incoming_quantity, ProviderMovementReport.transactions
+    )).all()
+    # Sorted by the period names, the enums don't order
+    return (
+        sorted((row.period.name, *row[1:]) for row in products),
+        sorted((row.period.name, *row[1:]) for row in providers)
+    )
+
+
+def group_transactions(db) -> tuple:
+    """
+    The rollups computed by a plain GROUP BY over the transactions, the
+    months are summed from the days.
+    """
+    incoming = Transaction.type == TransactionTypeEnum.incoming
+    days = db.execute(select(
+        Transaction.date,
+        TransactionProduct.product_id,
+        func.sum(case((incoming, TransactionProduct.quantity), else_=0)),
+        func.sum(case((incoming, 0), else_=TransactionProduct.quantity)),
+        func.count(func.distinct(Transaction.id))
+    ).join(Transaction.products_transaction).group_by(Transaction.date, TransactionProduct.product_id)).all()
+    providers_days = db.execute(select(
+        Transaction.date,
+        Transaction.provider_id,
+        func.sum(TransactionProduct.quantity),
+        func.count(func.distinct(Transaction.id))
+    ).join(Transaction.products_transaction).where(incoming, Transaction.provider_id != None).group_by(
+        Transaction.date, Transaction.provider_id
+    )).all()
+
+    def roll(rows) -> list:
+        rollups = {}
+        for day, id, *values in rows:
+            for period, start in ((ReportPeriodEnum.daily, day), (ReportPeriodEnum.monthly, day.replace(day=1))):
+                previous = rollups.get((period.name, start, id), [0] * len(values))
+                rollups[(period.name, start, id)] = [total + value for total, value in zip(previous, values)]
+        return sorted(key + tuple(values) for key, values in rollups.items())
+
+    return roll(days), roll(providers_days)
+
+
+def test_rollups_equal_the_grouped_transactions(client, headers):
+    products = [create_product(client, headers, inventory=0) for _ in range(3)]
+    providers = [create_provider(client, headers) for _ in range(2)]
+    create_incoming(client, headers, providers[0], {products[0]: 10, products[1]: 5})
+    create_incoming(client, headers, providers[1], {products[0]: 3, products[2]: 8})
+
+    response = client.post(API_PREFIX + "/transaction/import", headers=headers, json=[
+        {"type": "ENTRADA", "date": "2021-01-15", "provider_id": providers[1], "products": [
+            {"product_id": products[1], "quantity": 2}
+        ]},
+        {"type": "SAIDA", "date": "2021-01-01", "products": [
+            {"product_id": products[0], "quantity": 4}, {"product_id": products[2], "quantity": 1}
+        ]},
+        {"type": "SAIDA", "date": "2021-02-03", "products": [{"product_id": products[1], "quantity": 6}]},
+        # Rejected, not in the rollups
+        {"type": "SAIDA", "date": "2021-02-03", "products": [{"product_id": products[2], "quantity": 100}]}
+    ])
+    assert response.status_code == 200
+    assert (response.json()["created"], response.json()["rejected"]) == (3, 1)
+
+    with SessionLocal() as db:
+        grouped = group_transactions(db)
+        assert read_rollups(db) == grouped
+
+        assert ReportService().rebuild(db, batch_size=2) == 5
+        assert read_rollups(db) == grouped
@@ -0,0 +1,114 @@
+# Standard Imports
+import os
+import sys
+import asyncio
+import subprocess
+
+# Framework Imports
+import pytest
+
+from app import API_PREFIX
+from app.core.config import DATABASE_ASYNC
+
+from .test_transactions import create_incoming, create_product, create_provider
+
+
+# Routes with an async version, see `app.core.views._merge_routers`
+ASYNC_ROUTES = [
+    ("GET", "/admin/users/"), ("GET", "/providers/"), ("GET", "/products/page/{page}"),
+    ("POST", "/products/"), ("GET", "/transaction/{id}"), ("POST", "/outgoing/transaction/")
+]
+
+
+def test_routes_follow_the_database_mode(app):
+    endpoints = {
+        (method, route.path[len(API_PREFIX):]): route.endpoint
+        for route in app.routes if route.path.startswith(API_PREFIX)
+        for method in getattr(route, "methods", ())
+    }
+    for key in ASYNC_ROUTES:
+        assert asyncio.iscoroutinefunction(endpoints[key]) == DATABASE_ASYNC, key
+
+
+def test_user_routes(client, headers):
+    response = client.post(API_PREFIX + "/admin/users/", headers=headers, json={
+        "first_name": "Ciclano", "last_name": "Souza", "email": "ciclano@sbf.com", "password": "secret", "admin": False
+    })
+    assert response.status_code == 200
+    user_id = response.json()["id"]
+
+    response = client.get(API_PREFIX + "/admin/users/", headers=headers)
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()] == ["fulano@sbf.com", "ciclano@sbf.com"]
+
+    response = client.patch(API_PREFIX + f"/admin/users/{user_id}", headers=headers, json={"first_name": "Beltrano"})
+    assert response.status_code == 200
+    response = client.get(API_PREFIX + f"/admin/users/{user_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Beltrano"
+
+    assert client.delete(API_PREFIX + f"/admin/users/{user_id}", headers=headers).status_code == 200
+    assert client.get(API_PREFIX + f"/admin/users/{user_id}", headers=headers).status_code == 404
+
+
+@pytest.mark.parametrize("path, create, body", [
+    ("/providers/", create_provider, {"name": "Fornecedora Sul"}),
+    ("/products/", create_product, {"name": "Camiseta"})
+])
+def test_catalog_routes(client, headers, path, create, body):
+    id = create(client, headers)
+    create(client, headers)
+
+    response = client.get(API_PREFIX + path, headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()["records"]) == 2
+
+    response = client.get(API_PREFIX + path + "page/2", headers=headers, params={"per_page": 1})
+    assert response.status_code == 200
+    assert response.json()["pagination_metadata"]["total_count"] == 2
+
+    assert client.patch(API_PREFIX + path + str(id), headers=headers, json=body).status_code == 200
+    response = client.get(API_PREFIX + path + str(id), headers=headers)
+    assert response.status_code == 200
+    assert response.json()["name"] == body["name"]
+
+    assert client.delete(API_PREFIX + path + str(id), headers=headers).status_code == 200
+    assert client.get(API_PREFIX + path + str(id), headers=headers).status_code == 404
+    assert len(client.get(API_PREFIX + path, headers=headers).json()["records"]) == 1
+
+
+def test_transaction_routes(client, headers):
+    product_id = create_product(client, headers, inventory=0)
+    provider_id = create_provider(client, headers)
+    incoming = create_incoming(client, headers, provider_id, {product_id: 5})
+
+    response = client.post(API_PREFIX + "/outgoing/transaction/", headers=headers, json={
+        "type": "SAIDA", "date": "2021-01-02", "products": [{"product_id": product_id, "quantity": 2}]
+    })
+    assert response.status_code == 201
+    outgoing = response.json()
+    assert client.get(API_PREFIX + f"/products/{product_id}", headers=headers).json()["inventory"] == 3
+
+    response = client.get(API_PREFIX + f"/transaction/{incoming['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["provider_id"] == provider_id
+    assert [product["product_id"] for product in response.json()["products"]] == [product_id]
+
+    response = client.get(API_PREFIX + "/transaction/", headers=headers)
+    assert response.status_code == 200
+    assert sorted(record["id"] for record in response.json()) == [incoming["id"], outgoing["id"]]
+
+    response = client.get(API_PREFIX + "/transaction/page/1", headers=headers, params={"per_page": 1})
+    assert response.status_code == 200
+    assert response.json()["pagination_metadata"]["total_count"] == 2
+
+
+@pytest.mark.skipif(DATABASE_ASYNC, reason="already running in the async mode")
+def test_routes_in_async_mode():
+    # The mode is read on import, a new interpreter runs the tests with aiosqlite
+    env = {key: value for key, value in os.environ.items() if key != "DATABASE_URL"}
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", __file__],
+        env=dict(env, DATABASE_ASYNC="true"), capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stdout[-3000:]
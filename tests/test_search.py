@@ -0,0 +1,69 @@
+import pytest
+
+from app import API_PREFIX
+from app.db import search as db_search
+from app.db.engine import engine
+
+
+NAMES = ["Camisa Polo", "Camiseta", "Bermuda", "50% Algodão", "Calça_Jeans", 'Boné "Aba" Reta']
+
+
+@pytest.fixture(params=["fts", "like"])
+def search(request, client, headers, monkeypatch):
+    if engine.dialect.name != "sqlite":
+        pytest.skip("searches SQLite FTS5 and LIKE")
+    # Without the trigram tokenizer every term is searched with LIKE
+    if request.param == "like":
+        monkeypatch.setattr(db_search, "SQLITE_TRIGRAM", False)
+    elif not db_search.SQLITE_TRIGRAM:
+        pytest.skip("FTS5 trigram tokenizer not available")
+
+    for name in NAMES:
+        response = client.post(API_PREFIX + "/products/", headers=headers, json={
+            "name": name, "size": "M", "inventory": 1, "weight": 0.5
+        })
+        assert response.status_code == 200
+
+    def search(term: str) -> list:
+        response = client.get(API_PREFIX + "/products/", headers=headers, params={"name": term})
+        if response.status_code == 404:
+            return []
+        assert response.status_code == 200
+        return [record["name"] for record in response.json()["records"]]
+    return search
+
+
+@pytest.mark.parametrize("term, names", [
+    # Substrings, ignoring case, names starting with the term and then the shorter ones first
+    ("amis", ["Camiseta", "Camisa Polo"]),
+    ("CAMI", ["Camiseta", "Camisa Polo"]),
+    ("polo", ["Camisa Polo"]),
+    ("muda", ["Bermuda"]),
+    ("sapato", []),
+    # Shorter than the trigrams (`FTS_MIN_TERM_LENGTH`), searched with LIKE
+    ("po", ["Camisa Polo"]),
+    ("e", ["Bermuda", "Camiseta", "Calça_Jeans", 'Boné "Aba" Reta']),
+    ("z", [])
+])
+def test_search_matches_substrings(search, term, names):
+    assert search(term) == names
+
+
+@pytest.mark.parametrize("term, names", [
+    # LIKE wildcards are searched as text
+    ("%", ["50% Algodão"]),
+    ("_", ["Calça_Jeans"]),
+    ("0%", ["50% Algodão"]),
+    ("50% alg", ["50% Algodão"]),
+    ("a_j", ["Calça_Jeans"]),
+    # FTS5 quotes and operators are searched as text, through FTS5 when available
+    ('"', ['Boné "Aba" Reta']),
+    ('"aba"', ['Boné "Aba" Reta']),
+    ('é "a', ['Boné "Aba" Reta']),
+    ("polo OR bermuda", []),
+    ("cam*", []),
+    ("NEAR(", []),
+    ("'; --", [])
+])
+def test_search_special_characters(search, term, names):
+    assert search(term) == names
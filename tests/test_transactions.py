@@ -0,0 +1,113 @@
+# Standard Imports
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+# Framework Imports
+import pytest
+
+from app import API_PREFIX
+from app.db.engine import SessionLocal
+from app.modules.users.models import User
+from app.modules.products.models import Product
+from app.modules.transactions.models import Transaction
+from app.modules.transactions.schemas import OutgoingTransactionCreate, TransactionTypeEnum
+from app.modules.transactions.services import TransactionService
+from app.utils.exceptions import NotEnoughStockQuantity
+
+from .conftest import ADMIN, count_queries
+
+
+def create_product(client, headers, inventory: int = 10) -> int:
+    response = client.post(API_PREFIX + "/products/", headers=headers, json={
+        "name": "Camisa", "size": "M", "inventory": inventory, "weight": 0.5
+    })
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def create_provider(client, headers) -> int:
+    response = client.post(API_PREFIX + "/providers/", headers=headers, json={
+        "name": "Fornecedora", "cnpj": "11.222.333/0001-81", "phone_number": "11999999999",
+        "email": "fornecedora@sbf.com", "contact_name": "Beltrano"
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def create_incoming(client, headers, provider_id: int, products: dict) -> dict:
+    response = client.post(API_PREFIX + "/incoming/transaction/", headers=headers, json={
+        "type": "ENTRADA", "date": "2021-01-01", "provider_id": provider_id,
+        "products": [{"product_id": id, "quantity": quantity} for id, quantity in products.items()]
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.parametrize("per_page", [1, 3, 6])
+def test_page_statements_do_not_grow_with_the_page(client, headers, per_page):
+    products = [create_product(client, headers) for _ in range(3)]
+    provider_id = create_provider(client, headers)
+    for index in range(6):
+        create_incoming(client, headers, provider_id, {products[0]: 5, products[1 + index % 2]: 3})
+
+    response = client.get(API_PREFIX + "/transaction/page/1", headers=headers, params={"per_page": per_page})
+
+    assert response.status_code == 200
+    records = response.json()["records"]
+    assert len(records) == per_page
+    assert all(len(record["products"]) == 2 for record in records)
+    # ETag version, count, page and the products of the whole page, the user is cached by the login
+    assert count_queries(response) == 4
+
+
+def test_concurrent_outgoing_transactions_do_not_oversell(client, headers):
+    inventory, attempts = 5, 16
+    product_id = create_product(client, headers, inventory=inventory)
+    db = SessionLocal()
+    user = db.query(User).filter(User.email == ADMIN["email"]).one()
+    db.expunge(user)
+    db.close()
+
+    # Every outgoing transaction reads the stock before any of them takes it
+    barrier = Barrier(attempts)
+    transaction = OutgoingTransactionCreate(
+        type=TransactionTypeEnum.outgoing, date=date(2021, 1, 2), products=[{"product_id": product_id, "quantity": 1}]
+    )
+
+    def take_one() -> bool:
+        db = SessionLocal()
+        try:
+            barrier.wait()
+            TransactionService().create(db, user, transaction)
+            return True
+        except NotEnoughStockQuantity:
+            return False
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=attempts) as executor:
+        results = list(executor.map(lambda _: take_one(), range(attempts)))
+
+    assert results.count(True) == inventory
+    db = SessionLocal()
+    try:
+        assert db.query(Product.inventory).filter(Product.id == product_id).scalar() == 0
+        assert db.query(Transaction).filter(Transaction.type == TransactionTypeEnum.outgoing).count() == inventory
+    finally:
+        db.close()
+
+
+def test_import_reports_the_products_without_stock(client, headers):
+    product_id = create_product(client, headers, inventory=2)
+
+    response = client.post(API_PREFIX + "/transaction/import", headers=headers, json=[
+        {"type": "SAIDA", "date": "2021-01-02", "products": [{"product_id": product_id, "quantity": 1}]},
+        {"type": "SAIDA", "date": "2021-01-02", "products": [{"product_id": product_id, "quantity": 5}]}
+    ])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["rejected"]) == (1, 1)
+    assert body["results"][1]["status_code"] == 422
+    assert body["results"][1]["detail"]["products_missing"] == [{"id": product_id, "name": "Camisa", "inventory": 1}]
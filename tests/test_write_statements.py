@@ -0,0 +1,57 @@
+import pytest
+
+from app import API_PREFIX
+from app.db.engine import engine
+
+from .conftest import count_queries
+from .test_transactions import create_incoming, create_product, create_provider
+
+
+# Without RETURNING (SQLite on SQLAlchemy 1.4) the generated timestamps of
+# an insert or update are selected by the flush, never by a refresh
+FETCH = 0 if engine.dialect.implicit_returning else 1
+
+
+@pytest.mark.parametrize("method, path, body, statements", [
+    # INSERT and the products version
+    ("post", "/products/", {"name": "Bermuda", "size": "P", "inventory": 1, "weight": 1.0}, 2 + FETCH),
+    # SELECT, UPDATE and the products version
+    ("patch", "/products/1", {"name": "Camiseta"}, 3 + FETCH),
+    ("delete", "/products/1", None, 3 + FETCH),
+    ("post", "/providers/", {
+        "name": "Fornecedor", "cnpj": "11.444.777/0001-61", "phone_number": "1",
+        "email": "fornecedor@sbf.com", "contact_name": "Ciclano"
+    }, 2 + FETCH),
+    ("patch", "/providers/1", {"name": "Fornecedora Sul"}, 3 + FETCH),
+    ("post", "/admin/users/", {
+        "first_name": "Ciclano", "last_name": "Souza", "email": "ciclano@sbf.com", "password": "secret", "admin": False
+    }, 1 + FETCH),
+    ("patch", "/admin/users/1", {"first_name": "Beltrano"}, 2 + FETCH)
+])
+def test_write_statements(client, headers, method, path, body, statements):
+    create_product(client, headers)
+    create_provider(client, headers)
+
+    kwargs = {} if body is None else {"json": body}
+    response = getattr(client, method)(API_PREFIX + path, headers=headers, **kwargs)
+
+    assert response.status_code in (200, 201)
+    assert count_queries(response) == statements
+
+
+def test_transaction_create_statements(client, headers):
+    products = [create_product(client, headers) for _ in range(2)]
+    provider_id = create_provider(client, headers)
+    # The snapshots of both products exist, see `InventorySnapshotService.apply_deltas`
+    create_incoming(client, headers, provider_id, {products[0]: 1, products[1]: 1})
+
+    response = client.post(API_PREFIX + "/incoming/transaction/", headers=headers, json={
+        "type": "ENTRADA", "date": "2021-01-01", "provider_id": provider_id,
+        "products": [{"product_id": products[0], "quantity": 5}, {"product_id": products[1], "quantity": 3}]
+    })
+
+    assert response.status_code == 201
+    # Provider, 2 stock UPDATEs, the transaction INSERT, 2 products INSERTs,
+    # 2 snapshots UPDATEs and the checks of their months, 2 reports upserts, 2 versions
+    # and the products of the response
+    assert count_queries(response) == 15 + FETCH